@@ -4,6 +4,7 @@ from vivado_mcp.vivado.detection import (
     VivadoInstallation,
     detect_vivado_installations,
     get_default_vivado,
+    invalidate_detection_cache,
 )
 from vivado_mcp.vivado.session import (
     SessionInfo,
@@ -19,6 +20,7 @@ __all__ = [
     "VivadoInstallation",
     "detect_vivado_installations",
     "get_default_vivado",
+    "invalidate_detection_cache",
     "SessionInfo",
     "SessionManager",
     "SessionState",
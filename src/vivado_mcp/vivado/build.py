@@ -10,11 +10,14 @@ from __future__ import annotations
 import asyncio
 import os
 import re
+import stat
 import tempfile
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
+from functools import lru_cache
 from pathlib import Path
+from typing import AnyStr
 
 from vivado_mcp.vivado.detection import VivadoInstallation, get_default_vivado
 
@@ -28,7 +31,7 @@ class BuildState(str, Enum):
     FAILED = "failed"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True, kw_only=True)
 class RunStatus:
     """Represents the status of a single Vivado run (synth_1, impl_1, etc.)."""
 
@@ -49,7 +52,7 @@ class RunStatus:
         }
 
 
-@dataclass
+@dataclass(slots=True, frozen=True, kw_only=True)
 class BuildStatus:
     """Represents the overall build status of a Vivado project."""
 
@@ -72,7 +75,7 @@ class BuildStatus:
         }
 
 
-@dataclass
+@dataclass(slots=True, frozen=True, kw_only=True)
 class BuildMessage:
     """Represents an error or warning from the Vivado build."""
 
@@ -84,6 +87,7 @@ class BuildMessage:
 
     def to_dict(self) -> dict[str, str | int | None]:
         """Convert to dictionary for JSON serialization."""
+        # A dict literal beats attrgetter + zip over a field tuple here
         return {
             "severity": self.severity,
             "id": self.id,
@@ -93,7 +97,7 @@ class BuildMessage:
         }
 
 
-@dataclass
+@dataclass(slots=True, frozen=True, kw_only=True)
 class BuildResult:
     """Represents the result of a Vivado build."""
 
@@ -112,15 +116,15 @@ class BuildResult:
             "success": self.success,
             "project_path": self.project_path,
             "vivado_version": self.vivado_version,
-            "errors": [e.to_dict() for e in self.errors],
-            "critical_warnings": [w.to_dict() for w in self.critical_warnings],
+            "errors": list(map(BuildMessage.to_dict, self.errors)),
+            "critical_warnings": list(map(BuildMessage.to_dict, self.critical_warnings)),
             "error_count": len(self.errors),
             "critical_warning_count": len(self.critical_warnings),
             "exit_code": self.exit_code,
         }
 
 
-@dataclass
+@dataclass(slots=True, frozen=True, kw_only=True)
 class BitstreamResult:
     """Represents the result of a Vivado bitstream generation."""
 
@@ -141,121 +145,318 @@ class BitstreamResult:
             "project_path": self.project_path,
             "vivado_version": self.vivado_version,
             "bitstream_path": self.bitstream_path,
-            "errors": [e.to_dict() for e in self.errors],
-            "critical_warnings": [w.to_dict() for w in self.critical_warnings],
+            "errors": list(map(BuildMessage.to_dict, self.errors)),
+            "critical_warnings": list(map(BuildMessage.to_dict, self.critical_warnings)),
             "error_count": len(self.errors),
             "critical_warning_count": len(self.critical_warnings),
             "exit_code": self.exit_code,
         }
 
 
-# Regex patterns for parsing Vivado output
+# Regex patterns for parsing Vivado output, compiled once at import
 # Vivado messages follow format: SEVERITY: [ID] message
-_MESSAGE_PATTERN = re.compile(
-    r"^(ERROR|CRITICAL WARNING|WARNING):\s*\[([^\]]+)\]\s*(.+)$",
-    re.MULTILINE,
-)
+# Plain warnings are never reported, so they are not matched at all. The
+# patterns are matched at the start of each line, so they need no anchors.
+# Each severity has its own pattern starting with a plain literal rather
+# than one pattern with an alternation. They only match the prefix and
+# ID; the message is sliced from the rest of the line
+_ERROR_PATTERN = re.compile(r"ERROR:\s*\[([^\]]+)\]\s*")
+_CRITICAL_WARNING_PATTERN = re.compile(r"CRITICAL WARNING:\s*\[([^\]]+)\]\s*")
+
+# The same patterns for scanning raw process output without decoding it
+_ERROR_PATTERN_BYTES = re.compile(rb"ERROR:\s*\[([^\]]+)\]\s*")
+_CRITICAL_WARNING_PATTERN_BYTES = re.compile(rb"CRITICAL WARNING:\s*\[([^\]]+)\]\s*")
+
+# Vivado sometimes dumps huge signal or path lists on a single line. Patterns
+# only look at the start of a line, and only the start of a message is kept
+_MATCH_WINDOW = 1000
+_MAX_MESSAGE_LENGTH = 4096
+
+# Pattern to extract file:line from messages. Negated character classes
+# rather than lazy quantifiers keep matching linear on long lines
+_FILE_LINE_PATTERN = re.compile(r"['\"]([^'\"]*)['\"](?:\s+line\s+(\d+))?")
+
+# Patterns for scanning run logs in _parse_run_status
+_PROGRESS_PATTERN = re.compile(r"Progress:\s*(\d+%)")
+_LOG_ERROR_PATTERN = re.compile(rb"ERROR:\s*\[")
+
+# Run logs can grow to tens of megabytes, but the latest progress, the
+# completion message and Vivado's closing error summary are all at the end
+_LOG_TAIL_BYTES = 65536
+
+# Build outputs at least this long are parsed on a worker thread so a
+# multi-megabyte log doesn't stall the server's event loop
+_THREADED_PARSE_SIZE = 1_000_000
+
+
+def _make_message(severity: str, msg_id: str, message: str) -> BuildMessage:
+    """Build a BuildMessage, pulling any quoted file and line out of the text."""
+    message = message.strip()
+
+    # Try to extract file and line from the message; file names are
+    # always quoted, so unquoted messages can skip the search
+    file_match = (
+        _FILE_LINE_PATTERN.search(message, 0, _MATCH_WINDOW)
+        if "'" in message or '"' in message
+        else None
+    )
+    file_path: str | None = None
+    line_num: int | None = None
+
+    if file_match:
+        file_path = file_match.group(1)
+        if file_match.group(2):
+            line_num = int(file_match.group(2))
+
+    return BuildMessage(
+        severity=severity,
+        id=msg_id,
+        message=message,
+        file=file_path,
+        line=line_num,
+    )
 
-# Pattern to extract file:line from messages
-_FILE_LINE_PATTERN = re.compile(r"['\"](.*?)['\"](?:\s+line\s+(\d+))?")
 
+def _scan_messages(
+    output: AnyStr,
+    prefix: AnyStr,
+    pattern: re.Pattern[AnyStr],
+    line_breaks: AnyStr,
+    severity: str,
+) -> list[BuildMessage]:
+    """Collect the messages of one severity from a whole Vivado output.
 
-def parse_vivado_output(output: str) -> tuple[list[BuildMessage], list[BuildMessage]]:
+    find() jumps straight between occurrences of the prefix, so the bulk of
+    a log (INFO lines and plain warnings) is never split into lines or
+    matched. Only occurrences at the start of a line count, and only the
+    part of that line the pattern and message cap can reach is split off.
+    """
+    messages: list[BuildMessage] = []
+    index = output.find(prefix)
+    while index != -1:
+        if index == 0 or output[index - 1:index] in line_breaks:
+            # Cut at the newline so a short line isn't copied at full cap
+            # length, then drop the carriage return of a CRLF line ending.
+            # splitlines() would also split str at \x0b, \x85, \u2028 etc.
+            limit = index + _MATCH_WINDOW + _MAX_MESSAGE_LENGTH
+            line_end = output.find(line_breaks[-1:], index, limit)
+            line = output[index:limit if line_end == -1 else line_end].rstrip(line_breaks[:1])
+            match = pattern.match(line, 0, _MATCH_WINDOW)
+            if match is not None:
+                start = match.end()
+                messages.append(_make_message(
+                    severity,
+                    _decode(match.group(1)),
+                    _decode(line[start:start + _MAX_MESSAGE_LENGTH]),
+                ))
+        index = output.find(prefix, index + 1)
+    return messages
+
+
+def _decode(value: str | bytes) -> str:
+    """Return text as-is and decode raw output, replacing invalid UTF-8."""
+    if isinstance(value, str):
+        return value
+    return value.decode("utf-8", errors="replace")
+
+
+def parse_vivado_output(
+    output: str | bytes, *, include_warnings: bool = True
+) -> tuple[list[BuildMessage], list[BuildMessage]]:
     """Parse Vivado output for errors and critical warnings.
 
+    Raw bytes are scanned without decoding; only the ID and text of the
+    matched messages are decoded.
+
     Args:
-        output: The stdout/stderr output from Vivado
+        output: The stdout/stderr output from Vivado, as text or raw bytes
+        include_warnings: If False, critical warnings are not searched for
+            and the returned warning list is empty
 
     Returns:
         Tuple of (errors, critical_warnings) as lists of BuildMessage
     """
-    errors: list[BuildMessage] = []
-    critical_warnings: list[BuildMessage] = []
+    if isinstance(output, (bytes, bytearray)):
+        raw = output if isinstance(output, bytes) else bytes(output)
+        errors = _scan_messages(raw, b"ERROR:", _ERROR_PATTERN_BYTES, b"\r\n", "ERROR")
+        critical_warnings = (
+            _scan_messages(
+                raw,
+                b"CRITICAL WARNING:",
+                _CRITICAL_WARNING_PATTERN_BYTES,
+                b"\r\n",
+                "CRITICAL WARNING",
+            )
+            if include_warnings
+            else []
+        )
+        return errors, critical_warnings
 
-    for match in _MESSAGE_PATTERN.finditer(output):
-        severity = match.group(1)
-        msg_id = match.group(2)
-        message = match.group(3).strip()
-
-        # Try to extract file and line from the message
-        file_match = _FILE_LINE_PATTERN.search(message)
-        file_path: str | None = None
-        line_num: int | None = None
-
-        if file_match:
-            file_path = file_match.group(1)
-            if file_match.group(2):
-                line_num = int(file_match.group(2))
-
-        build_msg = BuildMessage(
-            severity=severity,
-            id=msg_id,
-            message=message,
-            file=file_path,
-            line=line_num,
+    errors = _scan_messages(output, "ERROR:", _ERROR_PATTERN, "\r\n", "ERROR")
+    critical_warnings = (
+        _scan_messages(
+            output, "CRITICAL WARNING:", _CRITICAL_WARNING_PATTERN, "\r\n", "CRITICAL WARNING"
         )
+        if include_warnings
+        else []
+    )
+    return errors, critical_warnings
+
+
+async def _parse_build_output(
+    *outputs: str | bytes,
+) -> tuple[list[BuildMessage], list[BuildMessage]]:
+    """Parse build outputs in order, moving large ones off the event loop.
 
-        if severity == "ERROR":
-            errors.append(build_msg)
-        elif severity == "CRITICAL WARNING":
-            critical_warnings.append(build_msg)
+    Each stream is parsed on its own rather than joined first, so a large
+    log is never copied into a combined buffer.
 
+    Args:
+        *outputs: The stdout and stderr output from Vivado, as text or raw bytes
+
+    Returns:
+        Tuple of (errors, critical_warnings) as lists of BuildMessage
+    """
+    errors: list[BuildMessage] = []
+    critical_warnings: list[BuildMessage] = []
+    for output in outputs:
+        if len(output) < _THREADED_PARSE_SIZE:
+            stream_errors, stream_warnings = parse_vivado_output(output)
+        else:
+            stream_errors, stream_warnings = await asyncio.to_thread(parse_vivado_output, output)
+        errors += stream_errors
+        critical_warnings += stream_warnings
     return errors, critical_warnings
 
 
-def _generate_synthesis_tcl(project_path: Path) -> str:
-    """Generate TCL script for running synthesis only.
+@lru_cache(maxsize=16)
+def _render_project_tcl(
+    project_path: Path, script_kind: str, xpr_body: str, source_body: str
+) -> str:
+    """Render a generated TCL script for a project.
+
+    The script bodies are joined once at import; only the line that opens
+    or sources the project depends on the path. Scripts are cached per
+    project path, since the same project is usually built repeatedly.
 
     Args:
         project_path: Path to the project (.xpr or .tcl)
+        script_kind: Kind of script, used in the header comment
+        xpr_body: Script body used after opening an .xpr project
+        source_body: Script body used after sourcing a .tcl script
 
     Returns:
         TCL script content as a string
     """
     project_path_tcl = str(project_path).replace("\\", "/")
-    is_xpr = project_path.suffix.lower() == ".xpr"
+    if project_path.suffix.lower() == ".xpr":
+        command, body = "open_project", xpr_body
+    else:
+        command, body = "source", source_body
 
-    tcl_lines = [
-        "# Auto-generated synthesis script for vivado-mcp",
-    ]
+    return (
+        f"# Auto-generated {script_kind} script for vivado-mcp\n"
+        f'{command} "{project_path_tcl}"\n'
+        f"{body}"
+    )
 
-    if is_xpr:
-        # For .xpr files, open the project and run synthesis only
-        tcl_lines.extend([
-            f'open_project "{project_path_tcl}"',
-            "",
-            "# Run synthesis",
-            "reset_run synth_1",
-            "launch_runs synth_1 -jobs 4",
-            "wait_on_run synth_1",
-            "",
-            "# Check synthesis result",
-            'if {[get_property PROGRESS [get_runs synth_1]] != "100%"} {',
-            '    puts "ERROR: Synthesis failed"',
-            "    exit 1",
-            "}",
-            'if {[get_property STATUS [get_runs synth_1]] != "synth_design Complete!"} {',
-            '    puts "ERROR: Synthesis did not complete successfully"',
-            "    exit 1",
-            "}",
-            "",
-            'puts "Synthesis completed successfully"',
-            "close_project",
-            "exit 0",
-        ])
-    else:
-        # For .tcl files, source them and run synthesis only
-        tcl_lines.extend([
-            f'source "{project_path_tcl}"',
-            "",
-            "# Run synthesis only",
-            "synth_design",
-            "",
-            'puts "Synthesis completed successfully"',
-            "exit 0",
-        ])
 
-    return "\n".join(tcl_lines)
+# For .xpr files, open the project and run synthesis only
+_SYNTHESIS_TCL_XPR = "\n".join([
+    "",
+    "# Run synthesis",
+    "reset_run synth_1",
+    "launch_runs synth_1 -jobs 4",
+    "wait_on_run synth_1",
+    "",
+    "# Check synthesis result",
+    'if {[get_property PROGRESS [get_runs synth_1]] != "100%"} {',
+    '    puts "ERROR: Synthesis failed"',
+    "    exit 1",
+    "}",
+    'if {[get_property STATUS [get_runs synth_1]] != "synth_design Complete!"} {',
+    '    puts "ERROR: Synthesis did not complete successfully"',
+    "    exit 1",
+    "}",
+    "",
+    'puts "Synthesis completed successfully"',
+    "close_project",
+    "exit 0",
+])
+
+# For .tcl files, source them and run synthesis only
+_SYNTHESIS_TCL_SOURCE = "\n".join([
+    "",
+    "# Run synthesis only",
+    "synth_design",
+    "",
+    'puts "Synthesis completed successfully"',
+    "exit 0",
+])
+
+
+def _generate_synthesis_tcl(project_path: Path) -> str:
+    """Generate TCL script for running synthesis only.
+
+    Args:
+        project_path: Path to the project (.xpr or .tcl)
+
+    Returns:
+        TCL script content as a string
+    """
+    return _render_project_tcl(
+        project_path, "synthesis", _SYNTHESIS_TCL_XPR, _SYNTHESIS_TCL_SOURCE
+    )
+
+
+# For .xpr files, open the project and run implementation only
+_IMPLEMENTATION_TCL_XPR = "\n".join([
+    "",
+    "# Verify synthesis is complete",
+    'if {[get_property PROGRESS [get_runs synth_1]] != "100%"} {',
+    '    puts "ERROR: Synthesis not complete. Run synthesis first."',
+    "    exit 1",
+    "}",
+    'if {[get_property STATUS [get_runs synth_1]] != "synth_design Complete!"} {',
+    '    puts "ERROR: Synthesis did not complete successfully. Run synthesis first."',
+    "    exit 1",
+    "}",
+    "",
+    "# Run implementation",
+    "reset_run impl_1",
+    "launch_runs impl_1 -jobs 4",
+    "wait_on_run impl_1",
+    "",
+    "# Check implementation result",
+    'if {[get_property PROGRESS [get_runs impl_1]] != "100%"} {',
+    '    puts "ERROR: Implementation failed"',
+    "    exit 1",
+    "}",
+    "",
+    "# Generate bitstream",
+    "launch_runs impl_1 -to_step write_bitstream -jobs 4",
+    "wait_on_run impl_1",
+    "",
+    'puts "Implementation completed successfully"',
+    "close_project",
+    "exit 0",
+])
+
+# For .tcl files, source them and run implementation only
+# Assumes synth_design has already been run and design is in memory
+_IMPLEMENTATION_TCL_SOURCE = "\n".join([
+    "",
+    "# Run implementation only (assumes synthesis checkpoint exists)",
+    "opt_design",
+    "place_design",
+    "route_design",
+    "",
+    "# Generate bitstream",
+    "write_bitstream -force [get_property DIRECTORY [current_project]]/output.bit",
+    "",
+    'puts "Implementation completed successfully"',
+    "exit 0",
+])
 
 
 def _generate_implementation_tcl(project_path: Path) -> str:
@@ -267,66 +468,58 @@ def _generate_implementation_tcl(project_path: Path) -> str:
     Returns:
         TCL script content as a string
     """
-    project_path_tcl = str(project_path).replace("\\", "/")
-    is_xpr = project_path.suffix.lower() == ".xpr"
+    return _render_project_tcl(
+        project_path, "implementation", _IMPLEMENTATION_TCL_XPR, _IMPLEMENTATION_TCL_SOURCE
+    )
 
-    tcl_lines = [
-        "# Auto-generated implementation script for vivado-mcp",
-    ]
 
-    if is_xpr:
-        # For .xpr files, open the project and run implementation only
-        tcl_lines.extend([
-            f'open_project "{project_path_tcl}"',
-            "",
-            "# Verify synthesis is complete",
-            'if {[get_property PROGRESS [get_runs synth_1]] != "100%"} {',
-            '    puts "ERROR: Synthesis not complete. Run synthesis first."',
-            "    exit 1",
-            "}",
-            'if {[get_property STATUS [get_runs synth_1]] != "synth_design Complete!"} {',
-            '    puts "ERROR: Synthesis did not complete successfully. Run synthesis first."',
-            "    exit 1",
-            "}",
-            "",
-            "# Run implementation",
-            "reset_run impl_1",
-            "launch_runs impl_1 -jobs 4",
-            "wait_on_run impl_1",
-            "",
-            "# Check implementation result",
-            'if {[get_property PROGRESS [get_runs impl_1]] != "100%"} {',
-            '    puts "ERROR: Implementation failed"',
-            "    exit 1",
-            "}",
-            "",
-            "# Generate bitstream",
-            "launch_runs impl_1 -to_step write_bitstream -jobs 4",
-            "wait_on_run impl_1",
-            "",
-            'puts "Implementation completed successfully"',
-            "close_project",
-            "exit 0",
-        ])
-    else:
-        # For .tcl files, source them and run implementation only
-        # Assumes synth_design has already been run and design is in memory
-        tcl_lines.extend([
-            f'source "{project_path_tcl}"',
-            "",
-            "# Run implementation only (assumes synthesis checkpoint exists)",
-            "opt_design",
-            "place_design",
-            "route_design",
-            "",
-            "# Generate bitstream",
-            "write_bitstream -force [get_property DIRECTORY [current_project]]/output.bit",
-            "",
-            'puts "Implementation completed successfully"',
-            "exit 0",
-        ])
-
-    return "\n".join(tcl_lines)
+# For .xpr files, open the project and generate bitstream only
+_BITSTREAM_TCL_XPR = "\n".join([
+    "",
+    "# Verify synthesis is complete",
+    'if {[get_property PROGRESS [get_runs synth_1]] != "100%"} {',
+    '    puts "ERROR: Synthesis not complete. Run synthesis first."',
+    "    exit 1",
+    "}",
+    "",
+    "# Verify implementation is complete",
+    'if {[get_property PROGRESS [get_runs impl_1]] != "100%"} {',
+    '    puts "ERROR: Implementation not complete. Run implementation first."',
+    "    exit 1",
+    "}",
+    "",
+    "# Generate bitstream only",
+    "launch_runs impl_1 -to_step write_bitstream -jobs 4",
+    "wait_on_run impl_1",
+    "",
+    "# Find and report bitstream file path",
+    "set impl_dir [get_property DIRECTORY [get_runs impl_1]]",
+    'set bit_files [glob -nocomplain -directory $impl_dir "*.bit"]',
+    'if {[llength $bit_files] > 0} {',
+    '    puts "BITSTREAM_FILE: [lindex $bit_files 0]"',
+    '} else {',
+    '    puts "ERROR: Bitstream file not found after generation"',
+    "    exit 1",
+    "}",
+    "",
+    'puts "Bitstream generation completed successfully"',
+    "close_project",
+    "exit 0",
+])
+
+# For .tcl files, source them and generate bitstream only
+# Assumes implementation has already been run
+_BITSTREAM_TCL_SOURCE = "\n".join([
+    "",
+    "# Generate bitstream (assumes design is routed)",
+    "set output_dir [get_property DIRECTORY [current_project]]",
+    "set bitstream_path ${output_dir}/output.bit",
+    "write_bitstream -force $bitstream_path",
+    "",
+    'puts "BITSTREAM_FILE: $bitstream_path"',
+    'puts "Bitstream generation completed successfully"',
+    "exit 0",
+])
 
 
 def _generate_bitstream_tcl(project_path: Path) -> str:
@@ -338,65 +531,102 @@ def _generate_bitstream_tcl(project_path: Path) -> str:
     Returns:
         TCL script content as a string
     """
-    project_path_tcl = str(project_path).replace("\\", "/")
-    is_xpr = project_path.suffix.lower() == ".xpr"
+    return _render_project_tcl(
+        project_path, "bitstream", _BITSTREAM_TCL_XPR, _BITSTREAM_TCL_SOURCE
+    )
+
+
+def _poll_run_tcl(run_name: str, failure_message: str) -> list[str]:
+    """Generate TCL lines that wait for a launched run, exiting on the first error.
+
+    Unlike a plain ``wait_on_run``, the run is waited on in one-minute slices
+    (``wait_on_run -timeout 1``) and its status checked in between, so a run
+    which fails early terminates the batch process immediately instead of
+    waiting for the whole stage to wind down. The loop stops as soon as the
+    run is no longer running or queued, so a run that ends without reporting
+    an error cannot keep it spinning.
+
+    Args:
+        run_name: Name of the run to wait for (e.g., "synth_1")
+        failure_message: Message printed as an ERROR when the run fails
 
-    tcl_lines = [
-        "# Auto-generated bitstream script for vivado-mcp",
+    Returns:
+        List of TCL script lines
+    """
+    return [
+        f'while {{[get_property PROGRESS [get_runs {run_name}]] != "100%"}} {{',
+        f"    set run_status [get_property STATUS [get_runs {run_name}]]",
+        '    if {[string match "*ERROR*" $run_status]} {',
+        f'        puts "ERROR: {failure_message}"',
+        "        exit 1",
+        "    }",
+        '    if {![string match "*Running*" $run_status] &&',
+        '        ![string match "*Queued*" $run_status]} {',
+        "        break",
+        "    }",
+        f"    wait_on_run -timeout 1 {run_name}",
+        "}",
+        f"wait_on_run {run_name}",
     ]
 
-    if is_xpr:
-        # For .xpr files, open the project and generate bitstream only
-        tcl_lines.extend([
-            f'open_project "{project_path_tcl}"',
-            "",
-            "# Verify synthesis is complete",
-            'if {[get_property PROGRESS [get_runs synth_1]] != "100%"} {',
-            '    puts "ERROR: Synthesis not complete. Run synthesis first."',
-            "    exit 1",
-            "}",
-            "",
-            "# Verify implementation is complete",
-            'if {[get_property PROGRESS [get_runs impl_1]] != "100%"} {',
-            '    puts "ERROR: Implementation not complete. Run implementation first."',
-            "    exit 1",
-            "}",
-            "",
-            "# Generate bitstream only",
-            "launch_runs impl_1 -to_step write_bitstream -jobs 4",
-            "wait_on_run impl_1",
-            "",
-            "# Find and report bitstream file path",
-            "set impl_dir [get_property DIRECTORY [get_runs impl_1]]",
-            'set bit_files [glob -nocomplain -directory $impl_dir "*.bit"]',
-            'if {[llength $bit_files] > 0} {',
-            '    puts "BITSTREAM_FILE: [lindex $bit_files 0]"',
-            '} else {',
-            '    puts "ERROR: Bitstream file not found after generation"',
-            "    exit 1",
-            "}",
-            "",
-            'puts "Bitstream generation completed successfully"',
-            "close_project",
-            "exit 0",
-        ])
-    else:
-        # For .tcl files, source them and generate bitstream only
-        # Assumes implementation has already been run
-        tcl_lines.extend([
-            f'source "{project_path_tcl}"',
-            "",
-            "# Generate bitstream (assumes design is routed)",
-            "set output_dir [get_property DIRECTORY [current_project]]",
-            "set bitstream_path ${output_dir}/output.bit",
-            "write_bitstream -force $bitstream_path",
-            "",
-            'puts "BITSTREAM_FILE: $bitstream_path"',
-            'puts "Bitstream generation completed successfully"',
-            "exit 0",
-        ])
-
-    return "\n".join(tcl_lines)
+
+# For .xpr files, open the project
+_BUILD_TCL_XPR = "\n".join([
+    "",
+    "# Run synthesis, bailing out as soon as the run reports an error",
+    "reset_run synth_1",
+    "launch_runs synth_1 -jobs 4",
+    *_poll_run_tcl("synth_1", "Synthesis failed"),
+    "",
+    "# Check synthesis result",
+    'if {[get_property PROGRESS [get_runs synth_1]] != "100%"} {',
+    '    puts "ERROR: Synthesis failed"',
+    "    exit 1",
+    "}",
+    'if {[get_property STATUS [get_runs synth_1]] != "synth_design Complete!"} {',
+    '    puts "ERROR: Synthesis did not complete successfully"',
+    "    exit 1",
+    "}",
+    "",
+    "# Run implementation, bailing out as soon as the run reports an error",
+    "reset_run impl_1",
+    "launch_runs impl_1 -jobs 4",
+    *_poll_run_tcl("impl_1", "Implementation failed"),
+    "",
+    "# Check implementation result",
+    'if {[get_property PROGRESS [get_runs impl_1]] != "100%"} {',
+    '    puts "ERROR: Implementation failed"',
+    "    exit 1",
+    "}",
+    "",
+    "# Generate bitstream",
+    "launch_runs impl_1 -to_step write_bitstream -jobs 4",
+    "wait_on_run impl_1",
+    "",
+    "# Final status",
+    'puts "Build completed successfully"',
+    "close_project",
+    "exit 0",
+])
+
+# For .tcl files, source them directly
+# The TCL file is expected to set up everything
+_BUILD_TCL_SOURCE = "\n".join([
+    "",
+    "# Run synthesis",
+    "synth_design",
+    "",
+    "# Run implementation",
+    "opt_design",
+    "place_design",
+    "route_design",
+    "",
+    "# Generate bitstream",
+    "write_bitstream -force [get_property DIRECTORY [current_project]]/output.bit",
+    "",
+    'puts "Build completed successfully"',
+    "exit 0",
+])
 
 
 def _generate_build_tcl(project_path: Path) -> str:
@@ -408,75 +638,13 @@ def _generate_build_tcl(project_path: Path) -> str:
     Returns:
         TCL script content as a string
     """
-    project_path_tcl = str(project_path).replace("\\", "/")
-    is_xpr = project_path.suffix.lower() == ".xpr"
+    return _render_project_tcl(
+        project_path, "build", _BUILD_TCL_XPR, _BUILD_TCL_SOURCE
+    )
 
-    tcl_lines = [
-        "# Auto-generated build script for vivado-mcp",
-    ]
 
-    if is_xpr:
-        # For .xpr files, open the project
-        tcl_lines.extend([
-            f'open_project "{project_path_tcl}"',
-            "",
-            "# Run synthesis",
-            "reset_run synth_1",
-            "launch_runs synth_1 -jobs 4",
-            "wait_on_run synth_1",
-            "",
-            "# Check synthesis result",
-            'if {[get_property PROGRESS [get_runs synth_1]] != "100%"} {',
-            '    puts "ERROR: Synthesis failed"',
-            "    exit 1",
-            "}",
-            'if {[get_property STATUS [get_runs synth_1]] != "synth_design Complete!"} {',
-            '    puts "ERROR: Synthesis did not complete successfully"',
-            "    exit 1",
-            "}",
-            "",
-            "# Run implementation",
-            "reset_run impl_1",
-            "launch_runs impl_1 -jobs 4",
-            "wait_on_run impl_1",
-            "",
-            "# Check implementation result",
-            'if {[get_property PROGRESS [get_runs impl_1]] != "100%"} {',
-            '    puts "ERROR: Implementation failed"',
-            "    exit 1",
-            "}",
-            "",
-            "# Generate bitstream",
-            "launch_runs impl_1 -to_step write_bitstream -jobs 4",
-            "wait_on_run impl_1",
-            "",
-            "# Final status",
-            'puts "Build completed successfully"',
-            "close_project",
-            "exit 0",
-        ])
-    else:
-        # For .tcl files, source them directly
-        # The TCL file is expected to set up everything
-        tcl_lines.extend([
-            f'source "{project_path_tcl}"',
-            "",
-            "# Run synthesis",
-            "synth_design",
-            "",
-            "# Run implementation",
-            "opt_design",
-            "place_design",
-            "route_design",
-            "",
-            "# Generate bitstream",
-            "write_bitstream -force [get_property DIRECTORY [current_project]]/output.bit",
-            "",
-            'puts "Build completed successfully"',
-            "exit 0",
-        ])
-
-    return "\n".join(tcl_lines)
+# Project file types the build functions accept
+_PROJECT_SUFFIXES = frozenset({".xpr", ".tcl"})
 
 
 def _validate_project_path(project_path: str | Path) -> tuple[Path, str | None]:
@@ -491,14 +659,17 @@ def _validate_project_path(project_path: str | Path) -> tuple[Path, str | None]:
     """
     path = Path(project_path)
 
-    if not path.exists():
+    # A single stat answers both the existence and the file type checks
+    try:
+        mode = os.stat(path).st_mode
+    except OSError:
         return path, f"Project file not found: {path}"
 
-    if not path.is_file():
+    if not stat.S_ISREG(mode):
         return path, f"Project path is not a file: {path}"
 
     suffix = path.suffix.lower()
-    if suffix not in (".xpr", ".tcl"):
+    if suffix not in _PROJECT_SUFFIXES:
         return path, f"Invalid project file type '{suffix}'. Expected .xpr or .tcl"
 
     return path, None
@@ -507,7 +678,7 @@ def _validate_project_path(project_path: str | Path) -> tuple[Path, str | None]:
 async def run_vivado_build(
     project_path: str | Path,
     vivado_install: VivadoInstallation | None = None,
-    timeout: int | None = None,
+    timeout: float | None = None,
 ) -> BuildResult:
     """Run a complete Vivado build flow.
 
@@ -616,9 +787,8 @@ async def run_vivado_build(
         stdout = stdout_bytes.decode("utf-8", errors="replace")
         stderr = stderr_bytes.decode("utf-8", errors="replace")
 
-        # Parse output for errors and warnings
-        combined_output = stdout + "\n" + stderr
-        errors, critical_warnings = parse_vivado_output(combined_output)
+        # Parse the raw output for errors and warnings
+        errors, critical_warnings = await _parse_build_output(stdout_bytes, stderr_bytes)
 
         # Determine success
         exit_code = process.returncode or 0
@@ -643,37 +813,52 @@ async def run_vivado_build(
             pass
 
 
-def _get_run_directory_timestamp(run_dir: Path) -> str | None:
+# Files whose modification time reflects a run's latest activity
+_RUN_STATUS_FILES = ("runme.log", "vivado.pb", ".vivado.begin.rst", ".vivado.end.rst")
+
+
+def _scan_run_directory(run_dir: Path) -> dict[str, os.DirEntry[str]] | None:
+    """List a run directory once so later checks don't each hit the filesystem.
+
+    Args:
+        run_dir: Path to the run directory (e.g., synth_1, impl_1)
+
+    Returns:
+        Mapping of entry name to directory entry, or None if the directory
+        doesn't exist or can't be read
+    """
+    try:
+        with os.scandir(run_dir) as it:
+            return {entry.name: entry for entry in it}
+    except OSError:
+        return None
+
+
+def _get_run_directory_timestamp(
+    run_dir: Path, entries: dict[str, os.DirEntry[str]] | None = None
+) -> str | None:
     """Get the most recent modification timestamp from a run directory.
 
     Args:
         run_dir: Path to the run directory (e.g., synth_1, impl_1)
+        entries: Entries of run_dir from _scan_run_directory(), if already listed
 
     Returns:
         ISO format timestamp string or None if cannot be determined
     """
+    if entries is None:
+        entries = _scan_run_directory(run_dir)
+        if entries is None:
+            return None
+
     try:
         # Look for common status files in the run directory
-        status_files = [
-            run_dir / "runme.log",
-            run_dir / "vivado.pb",
-            run_dir / ".vivado.begin.rst",
-            run_dir / ".vivado.end.rst",
-        ]
-
-        most_recent: float | None = None
-        for status_file in status_files:
-            if status_file.exists():
-                mtime = status_file.stat().st_mtime
-                if most_recent is None or mtime > most_recent:
-                    most_recent = mtime
+        mtimes = [entries[name].stat().st_mtime for name in _RUN_STATUS_FILES if name in entries]
 
         # If no status files found, use the directory mtime
-        if most_recent is None and run_dir.exists():
-            most_recent = run_dir.stat().st_mtime
+        most_recent = max(mtimes) if mtimes else os.stat(run_dir).st_mtime
 
-        if most_recent is not None:
-            return datetime.fromtimestamp(most_recent).isoformat()
+        return datetime.fromtimestamp(most_recent).isoformat()
 
     except OSError:
         pass
@@ -681,6 +866,43 @@ def _get_run_directory_timestamp(run_dir: Path) -> str | None:
     return None
 
 
+def _read_log_tail(log_path: str | Path, max_bytes: int = _LOG_TAIL_BYTES) -> bytes:
+    """Read the end of a log file without reading the whole file.
+
+    Args:
+        log_path: Path to the log file
+        max_bytes: Maximum number of bytes to read from the end
+
+    Returns:
+        Up to max_bytes from the end of the file
+    """
+    with open(log_path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        f.seek(max(0, size - max_bytes))
+        return f.read(max_bytes)
+
+
+def _find_last_progress(log_content: str) -> str | None:
+    """Find the most recent "Progress: X%" value in a run log.
+
+    Searches backwards from the end, so only the last progress line is
+    matched instead of every one in the log.
+
+    Args:
+        log_content: Run log text
+
+    Returns:
+        The latest progress value (e.g., "75%"), or None if there is none
+    """
+    end = len(log_content)
+    while (start := log_content.rfind("Progress:", 0, end)) != -1:
+        match = _PROGRESS_PATTERN.match(log_content, start)
+        if match:
+            return match.group(1)
+        end = start
+    return None
+
+
 def _parse_run_status(run_dir: Path, run_name: str) -> RunStatus:
     """Parse the status of a Vivado run from its directory.
 
@@ -689,6 +911,8 @@ def _parse_run_status(run_dir: Path, run_name: str) -> RunStatus:
     - runme.log for detailed progress
     - vivado.pb for progress information
 
+    Only the last _LOG_TAIL_BYTES of runme.log are read.
+
     Args:
         run_dir: Path to the run directory
         run_name: Name of the run (e.g., "synth_1")
@@ -696,33 +920,35 @@ def _parse_run_status(run_dir: Path, run_name: str) -> RunStatus:
     Returns:
         RunStatus object with current state
     """
-    if not run_dir.exists():
+    # One directory listing answers every existence check below
+    entries = _scan_run_directory(run_dir)
+    if entries is None:
         return RunStatus(
             name=run_name,
             state=BuildState.NOT_STARTED,
         )
 
-    timestamp = _get_run_directory_timestamp(run_dir)
+    timestamp = _get_run_directory_timestamp(run_dir, entries)
 
     # Check for begin/end markers
-    begin_marker = run_dir / ".vivado.begin.rst"
-    end_marker = run_dir / ".vivado.end.rst"
-    error_marker = run_dir / ".vivado.error.rst"
+    has_begin_marker = ".vivado.begin.rst" in entries
+    has_end_marker = ".vivado.end.rst" in entries
+    has_error_marker = ".vivado.error.rst" in entries
 
     # Check runme.log for detailed status
-    runme_log = run_dir / "runme.log"
+    has_runme_log = "runme.log" in entries
     progress: str | None = None
     status_message: str | None = None
 
-    if runme_log.exists():
+    if has_runme_log:
         try:
-            log_content = runme_log.read_text(errors="replace")
+            # The directory entry already holds the joined path as a string
+            log_tail = _read_log_tail(entries["runme.log"].path)
+            log_content = log_tail.decode("utf-8", errors="replace")
 
             # Look for progress indicators
             # Vivado logs "Progress: X%" during runs
-            progress_matches = re.findall(r"Progress:\s*(\d+%)", log_content)
-            if progress_matches:
-                progress = progress_matches[-1]  # Get the most recent progress
+            progress = _find_last_progress(log_content)
 
             # Look for completion status
             if "synth_design Complete!" in log_content:
@@ -738,8 +964,9 @@ def _parse_run_status(run_dir: Path, run_name: str) -> RunStatus:
             elif "Synthesis successful" in log_content:
                 status_message = "Synthesis successful"
 
-            # Check for error conditions
-            if re.search(r"ERROR:\s*\[", log_content):
+            # Check for error conditions on the raw bytes; the substring test
+            # settles the common no-error case without running the regex
+            if b"ERROR:" in log_tail and _LOG_ERROR_PATTERN.search(log_tail):
                 return RunStatus(
                     name=run_name,
                     state=BuildState.FAILED,
@@ -752,7 +979,7 @@ def _parse_run_status(run_dir: Path, run_name: str) -> RunStatus:
             pass
 
     # Determine state based on markers and log content
-    if error_marker.exists():
+    if has_error_marker:
         return RunStatus(
             name=run_name,
             state=BuildState.FAILED,
@@ -761,7 +988,7 @@ def _parse_run_status(run_dir: Path, run_name: str) -> RunStatus:
             timestamp=timestamp,
         )
 
-    if end_marker.exists():
+    if has_end_marker:
         # Run completed (may be success or failure)
         if status_message and "Complete" in status_message:
             return RunStatus(
@@ -773,8 +1000,12 @@ def _parse_run_status(run_dir: Path, run_name: str) -> RunStatus:
             )
         # Check if there's a bitstream file for impl runs
         if run_name.startswith("impl"):
-            bit_files = list(run_dir.glob("*.bit"))
-            if bit_files:
+            # Same files as glob("*.bit"), which skips hidden names
+            has_bitstream = any(
+                not name.startswith(".") and os.path.normcase(name).endswith(".bit")
+                for name in entries
+            )
+            if has_bitstream:
                 return RunStatus(
                     name=run_name,
                     state=BuildState.COMPLETED,
@@ -790,7 +1021,7 @@ def _parse_run_status(run_dir: Path, run_name: str) -> RunStatus:
             timestamp=timestamp,
         )
 
-    if begin_marker.exists() and not end_marker.exists():
+    if has_begin_marker and not has_end_marker:
         return RunStatus(
             name=run_name,
             state=BuildState.IN_PROGRESS,
@@ -800,7 +1031,7 @@ def _parse_run_status(run_dir: Path, run_name: str) -> RunStatus:
         )
 
     # If we have some files but no markers, it might be an incomplete or old run
-    if runme_log.exists():
+    if has_runme_log:
         return RunStatus(
             name=run_name,
             state=BuildState.FAILED,
@@ -816,6 +1047,51 @@ def _parse_run_status(run_dir: Path, run_name: str) -> RunStatus:
     )
 
 
+@lru_cache(maxsize=128)
+def _resolve_runs_dir(project_dir: Path, dir_mtime_ns: int) -> Path | None:
+    """Find the runs directory of a project.
+
+    Vivado creates runs directories like <project_name>.runs/. The result
+    is cached per project directory; dir_mtime_ns is part of the cache key
+    so that adding or removing entries invalidates it.
+
+    Args:
+        project_dir: Directory containing the Vivado project
+        dir_mtime_ns: Modification time of project_dir in nanoseconds
+
+    Returns:
+        Path to the runs directory, or None if there isn't one
+    """
+    xpr_stem: str | None = None
+    # Normalized name -> actual name, so matching follows the platform's
+    # case rules the way glob() did
+    runs_names: dict[str, str] = {}
+    try:
+        with os.scandir(project_dir) as it:
+            for entry in it:
+                name = entry.name
+                if name.startswith("."):
+                    continue
+                normalized = os.path.normcase(name)
+                if xpr_stem is None and normalized.endswith(".xpr"):
+                    xpr_stem = name[: -len(".xpr")]
+                elif normalized.endswith(".runs"):
+                    runs_names[normalized] = name
+    except OSError:
+        return None
+
+    # First try the .xpr file's name to get the exact runs directory
+    runs_name: str | None = None
+    if xpr_stem is not None:
+        runs_name = runs_names.get(os.path.normcase(f"{xpr_stem}.runs"))
+
+    # Fallback: use any .runs directory
+    if runs_name is None:
+        runs_name = next(iter(runs_names.values()), None)
+
+    return project_dir / runs_name if runs_name is not None else None
+
+
 def get_build_status(project_path: str | Path) -> BuildStatus:
     """Get the current build status of a Vivado project.
 
@@ -836,24 +1112,15 @@ def get_build_status(project_path: str | Path) -> BuildStatus:
     else:
         project_dir = path
 
-    # Find the project name for the runs directory
-    # Vivado creates runs directories like: <project_name>.runs/
-    runs_dir: Path | None = None
-
-    # First try to find .xpr file to get exact project name
-    xpr_files = list(project_dir.glob("*.xpr"))
-    if xpr_files:
-        project_name = xpr_files[0].stem
-        runs_dir = project_dir / f"{project_name}.runs"
-
-    # Fallback: look for any .runs directory
-    if runs_dir is None or not runs_dir.exists():
-        runs_dirs = list(project_dir.glob("*.runs"))
-        if runs_dirs:
-            runs_dir = runs_dirs[0]
+    # Status is typically polled, so the runs directory lookup is cached
+    # until the project directory's contents change
+    try:
+        runs_dir = _resolve_runs_dir(project_dir, os.stat(project_dir).st_mtime_ns)
+    except OSError:
+        runs_dir = None
 
     # If no runs directory exists, build hasn't been started
-    if runs_dir is None or not runs_dir.exists():
+    if runs_dir is None:
         return BuildStatus(
             project_path=str(project_path),
             overall_state=BuildState.NOT_STARTED,
@@ -903,7 +1170,7 @@ def get_build_status(project_path: str | Path) -> BuildStatus:
 async def run_synthesis(
     project_path: str | Path,
     vivado_install: VivadoInstallation | None = None,
-    timeout: int | None = None,
+    timeout: float | None = None,
 ) -> BuildResult:
     """Run Vivado synthesis only.
 
@@ -1010,9 +1277,8 @@ async def run_synthesis(
         stdout = stdout_bytes.decode("utf-8", errors="replace")
         stderr = stderr_bytes.decode("utf-8", errors="replace")
 
-        # Parse output for errors and warnings
-        combined_output = stdout + "\n" + stderr
-        errors, critical_warnings = parse_vivado_output(combined_output)
+        # Parse the raw output for errors and warnings
+        errors, critical_warnings = await _parse_build_output(stdout_bytes, stderr_bytes)
 
         # Determine success
         exit_code = process.returncode or 0
@@ -1040,7 +1306,7 @@ async def run_synthesis(
 async def run_implementation(
     project_path: str | Path,
     vivado_install: VivadoInstallation | None = None,
-    timeout: int | None = None,
+    timeout: float | None = None,
 ) -> BuildResult:
     """Run Vivado implementation only (after synthesis is complete).
 
@@ -1166,9 +1432,8 @@ async def run_implementation(
         stdout = stdout_bytes.decode("utf-8", errors="replace")
         stderr = stderr_bytes.decode("utf-8", errors="replace")
 
-        # Parse output for errors and warnings
-        combined_output = stdout + "\n" + stderr
-        errors, critical_warnings = parse_vivado_output(combined_output)
+        # Parse the raw output for errors and warnings
+        errors, critical_warnings = await _parse_build_output(stdout_bytes, stderr_bytes)
 
         # Determine success
         exit_code = process.returncode or 0
@@ -1195,23 +1460,40 @@ async def run_implementation(
 
 # Pattern to parse bitstream file path from Vivado output
 _BITSTREAM_PATH_PATTERN = re.compile(r"^BITSTREAM_FILE:\s*(.+)$", re.MULTILINE)
+_BITSTREAM_PATH_PATTERN_BYTES = re.compile(rb"^BITSTREAM_FILE:\s*(.+)$", re.MULTILINE)
 
 
-def _parse_bitstream_path(output: str) -> str | None:
+def _parse_bitstream_path(output: str | bytes) -> str | None:
     """Parse the bitstream file path from Vivado output.
 
     The TCL script outputs a line "BITSTREAM_FILE: /path/to/file.bit"
-    which we parse to extract the path.
+    which we parse to extract the path. Raw bytes are searched without
+    decoding; only the path itself is decoded.
 
     Args:
-        output: The stdout/stderr output from Vivado
+        output: The stdout/stderr output from Vivado, as text or raw bytes
 
     Returns:
         The bitstream file path if found, None otherwise
     """
-    match = _BITSTREAM_PATH_PATTERN.search(output)
-    if match:
-        return match.group(1).strip()
+    # find() locates the marker with a fast substring scan; the anchored
+    # pattern then only runs where the marker actually occurs, instead of
+    # being tried at every line start of a multi-megabyte log
+    if isinstance(output, (bytes, bytearray)):
+        index = output.find(b"BITSTREAM_FILE:")
+        while index != -1:
+            raw_match = _BITSTREAM_PATH_PATTERN_BYTES.match(output, index)
+            if raw_match:
+                return raw_match.group(1).decode("utf-8", errors="replace").strip()
+            index = output.find(b"BITSTREAM_FILE:", index + 1)
+        return None
+
+    index = output.find("BITSTREAM_FILE:")
+    while index != -1:
+        match = _BITSTREAM_PATH_PATTERN.match(output, index)
+        if match:
+            return match.group(1).strip()
+        index = output.find("BITSTREAM_FILE:", index + 1)
     return None
 
 
@@ -1224,15 +1506,17 @@ def _find_bitstream_file(project_path: Path) -> str | None:
     Returns:
         Path to the bitstream file if found, None otherwise
     """
-    project_dir = project_path.parent
-    project_name = project_path.stem
-
-    # Look in the standard impl_1 directory
-    impl_dir = project_dir / f"{project_name}.runs" / "impl_1"
-    if impl_dir.exists():
-        bit_files = list(impl_dir.glob("*.bit"))
-        if bit_files:
-            return str(bit_files[0])
+    # Look in the standard impl_1 directory. DirEntry.path is already a
+    # string, so no Path is built per entry; normcase matches glob()'s
+    # case rules
+    impl_dir = os.path.join(project_path.parent, f"{project_path.stem}.runs", "impl_1")
+    try:
+        with os.scandir(impl_dir) as it:
+            for entry in it:
+                if os.path.normcase(entry.name).endswith(".bit"):
+                    return entry.path
+    except OSError:
+        pass
 
     return None
 
@@ -1240,7 +1524,7 @@ def _find_bitstream_file(project_path: Path) -> str | None:
 async def run_bitstream_generation(
     project_path: str | Path,
     vivado_install: VivadoInstallation | None = None,
-    timeout: int | None = None,
+    timeout: float | None = None,
 ) -> BitstreamResult:
     """Generate bitstream only (after implementation is complete).
 
@@ -1369,12 +1653,13 @@ async def run_bitstream_generation(
         stdout = stdout_bytes.decode("utf-8", errors="replace")
         stderr = stderr_bytes.decode("utf-8", errors="replace")
 
-        # Parse output for errors and warnings
-        combined_output = stdout + "\n" + stderr
-        errors, critical_warnings = parse_vivado_output(combined_output)
+        # Parse the raw output for errors and warnings
+        errors, critical_warnings = await _parse_build_output(stdout_bytes, stderr_bytes)
 
         # Parse bitstream file path from output
-        bitstream_path = _parse_bitstream_path(combined_output)
+        bitstream_path = (
+            _parse_bitstream_path(stdout_bytes) or _parse_bitstream_path(stderr_bytes)
+        )
 
         # If not found in output, try to find it in the impl directory
         if bitstream_path is None and validated_path.suffix.lower() == ".xpr":
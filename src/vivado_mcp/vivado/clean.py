@@ -6,7 +6,11 @@ to allow fresh rebuilds without stale artifacts.
 
 from __future__ import annotations
 
-import shutil
+import os
+import stat
+import subprocess
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, field
 from pathlib import Path
 
@@ -20,8 +24,15 @@ VIVADO_OUTPUT_DIRS = [
     ".ip_user_files",  # IP user files
 ]
 
+# Upper bound on concurrent directory removals
+_MAX_CLEAN_WORKERS = 8
 
-@dataclass
+# Trees with at least this many entries are removed with the native
+# platform tool, which avoids per-entry Python overhead
+_FAST_RMTREE_MIN_ENTRIES = 64
+
+
+@dataclass(slots=True)
 class CleanResult:
     """Represents the result of a clean operation."""
 
@@ -59,19 +70,212 @@ def _validate_project_path(project_path: str | Path) -> tuple[Path, str | None]:
             return path.parent, f"Expected .xpr project file, got: {path.suffix}"
         return path.parent, None
 
-    # If a directory is provided, check if it contains a .xpr file
+    # If a directory is provided, accept it whether or not it contains a
+    # .xpr file - the directory might have leftover build artifacts
     if path.is_dir():
-        xpr_files = list(path.glob("*.xpr"))
-        if not xpr_files:
-            # Still allow cleaning even without .xpr file
-            # The directory might have leftover build artifacts
-            pass
         return path, None
 
     # Path doesn't exist
     return path, f"Project path not found: {path}"
 
 
+def _is_small_tree(path: Path, limit: int = _FAST_RMTREE_MIN_ENTRIES) -> bool:
+    """Check whether a directory tree holds fewer than ``limit`` entries.
+
+    The walk stops as soon as the limit is reached, so large trees are not
+    fully traversed. Directories that disappear during the walk (e.g. removed
+    by an overlapping clean entry) are skipped.
+    """
+    count = 0
+    pending = [path]
+    while pending:
+        try:
+            it = os.scandir(pending.pop())
+        except FileNotFoundError:
+            continue
+        with it:
+            for entry in it:
+                count += 1
+                if count >= limit:
+                    return False
+                if entry.is_dir(follow_symlinks=False):
+                    pending.append(Path(entry.path))
+    return True
+
+
+def _walk_rmtree(path: Path) -> None:
+    """Remove a directory tree bottom-up with direct unlink/rmdir calls.
+
+    os.walk lists each directory once via scandir, so no per-entry stat is
+    needed. Entries that vanish concurrently are ignored.
+
+    Args:
+        path: Directory to remove
+
+    Raises:
+        OSError: If an entry could not be removed
+    """
+    for root, dirs, files in os.walk(path, topdown=False, followlinks=False):
+        for name in files:
+            try:
+                os.unlink(os.path.join(root, name))
+            except FileNotFoundError:
+                pass
+        for name in dirs:
+            entry_path = os.path.join(root, name)
+            try:
+                os.rmdir(entry_path)
+            except FileNotFoundError:
+                pass
+            except NotADirectoryError:
+                # Symlinks to directories are listed in dirs but not followed
+                os.unlink(entry_path)
+    try:
+        os.rmdir(path)
+    except FileNotFoundError:
+        # Already removed, e.g. by an overlapping clean entry
+        pass
+
+
+def _fast_rmtree(path: Path) -> None:
+    """Remove a directory tree, delegating large trees to the native tool.
+
+    Uses ``rm -rf`` on POSIX and ``rd /s /q`` on Windows, falling back to
+    ``_walk_rmtree`` for small trees or when the tool is unavailable.
+
+    Args:
+        path: Directory to remove
+
+    Raises:
+        OSError: If the directory could not be removed
+    """
+    if _is_small_tree(path):
+        _walk_rmtree(path)
+        return
+
+    if os.name == "nt":
+        cmd = ["cmd", "/c", "rd", "/s", "/q", str(path)]
+    else:
+        cmd = ["rm", "-rf", str(path)]
+
+    try:
+        completed = subprocess.run(cmd, capture_output=True, text=True, check=False)
+    except FileNotFoundError:
+        # Native tool is missing, remove in Python instead
+        _walk_rmtree(path)
+        return
+
+    # rd can report success while leaving entries behind, so verify removal.
+    # A tree that is gone counts as removed even if the tool complained that
+    # something else (e.g. an overlapping clean entry) got there first.
+    if not os.path.lexists(path):
+        return
+    message = completed.stderr.strip() or f"{cmd[0]} exited with {completed.returncode}"
+    raise OSError(message)
+
+
+def _remove_one(project_dir: Path, dir_name: str) -> tuple[str | None, str | None]:
+    """Remove a single output directory from the project directory.
+
+    Args:
+        project_dir: The project directory
+        dir_name: Name of the output directory to remove
+
+    Returns:
+        Tuple of (cleaned_directory, error_message); either may be None
+    """
+    dir_path = project_dir / dir_name
+
+    try:
+        # A single lstat both checks existence and tells us the entry type
+        try:
+            st = os.lstat(dir_path)
+        except FileNotFoundError:
+            return None, None
+
+        if stat.S_ISDIR(st.st_mode):
+            # Output directories are often empty right after project
+            # creation; rmdir removes those in one call without listing them
+            try:
+                os.rmdir(dir_path)
+            except OSError:
+                # Not empty (or not removable as-is), remove the whole tree
+                _fast_rmtree(dir_path)
+        else:
+            # Handle case where it's a file or symlink (shouldn't happen, but be safe)
+            os.unlink(dir_path)
+    except FileNotFoundError:
+        # Removed concurrently, e.g. as part of an overlapping entry such as
+        # "build" when cleaning "build/sub"
+        return dir_name, None
+    except OSError as e:
+        return None, f"Failed to remove {dir_name}: {e}"
+
+    return dir_name, None
+
+
+def _dirs_to_clean(additional_dirs: list[str] | None) -> list[str]:
+    """Build the list of output directories to clean, without duplicates."""
+    dirs_to_clean = list(VIVADO_OUTPUT_DIRS)
+    if additional_dirs:
+        dirs_to_clean.extend(additional_dirs)
+    return list(dict.fromkeys(dirs_to_clean))
+
+
+def _iter_clean(project_dir: Path, dirs_to_clean: list[str]) -> Iterator[tuple[str, str | None]]:
+    """Remove output directories concurrently, yielding each as it finishes.
+
+    Args:
+        project_dir: The project directory
+        dirs_to_clean: Names of the output directories to remove
+
+    Yields:
+        Tuple of (dir_name, error_message) in completion order; error_message
+        is None if the directory was removed. Directories that do not exist
+        are not yielded.
+    """
+    # Each output directory is an independent subtree, so remove them
+    # concurrently to overlap the unlink/rmdir syscall latency.
+    workers = min(len(dirs_to_clean), _MAX_CLEAN_WORKERS)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = {
+            executor.submit(_remove_one, project_dir, dir_name): dir_name
+            for dir_name in dirs_to_clean
+        }
+        for future in as_completed(futures):
+            cleaned, error = future.result()
+            if cleaned is None and error is None:
+                continue
+            yield futures[future], error
+
+
+def clean_build_outputs_iter(
+    project_path: str | Path,
+    additional_dirs: list[str] | None = None,
+) -> Iterator[tuple[str, str | None]]:
+    """Clean Vivado build output directories, reporting each as it finishes.
+
+    Streaming variant of clean_build_outputs() for callers that want
+    progress while large directories are being removed.
+
+    Args:
+        project_path: Path to the Vivado project file (.xpr) or project directory
+        additional_dirs: Optional list of additional directories to clean
+
+    Yields:
+        Tuple of (dir_name, error_message) for each directory that was
+        removed or failed to be removed; error_message is None on success
+
+    Raises:
+        ValueError: If the project path is invalid
+    """
+    project_dir, error = _validate_project_path(project_path)
+    if error:
+        raise ValueError(error)
+
+    yield from _iter_clean(project_dir, _dirs_to_clean(additional_dirs))
+
+
 def clean_build_outputs(
     project_path: str | Path,
     additional_dirs: list[str] | None = None,
@@ -99,27 +303,20 @@ def clean_build_outputs(
             errors=[error],
         )
 
-    # Build list of directories to clean
-    dirs_to_clean = list(VIVADO_OUTPUT_DIRS)
-    if additional_dirs:
-        dirs_to_clean.extend(additional_dirs)
+    dirs_to_clean = _dirs_to_clean(additional_dirs)
+    outcomes = dict(_iter_clean(project_dir, dirs_to_clean))
 
+    # Report in configured order rather than completion order
     cleaned_directories: list[str] = []
     errors: list[str] = []
-
     for dir_name in dirs_to_clean:
-        dir_path = project_dir / dir_name
-        if dir_path.exists():
-            try:
-                if dir_path.is_dir():
-                    shutil.rmtree(dir_path)
-                    cleaned_directories.append(dir_name)
-                else:
-                    # Handle case where it's a file (shouldn't happen, but be safe)
-                    dir_path.unlink()
-                    cleaned_directories.append(dir_name)
-            except OSError as e:
-                errors.append(f"Failed to remove {dir_name}: {e}")
+        if dir_name not in outcomes:
+            continue
+        error = outcomes[dir_name]
+        if error is None:
+            cleaned_directories.append(dir_name)
+        else:
+            errors.append(error)
 
     # Determine overall success
     success = len(errors) == 0
@@ -8,11 +8,31 @@ from __future__ import annotations
 
 import os
 import re
+import time
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 
+# Vivado version directories are named like 2023.2, 2024.1, etc.
+_VERSION_DIR_RE = re.compile(r"^\d{4}\.\d")
 
-@dataclass
+# Separators between the numeric components of a version string
+_VERSION_SPLIT_RE = re.compile(r"[._-]")
+
+# Identity of a version directory: (st_dev, st_ino), or the resolved path on
+# filesystems that do not report inode numbers
+_DirId = tuple[int, int] | Path
+
+# Upper bound on search bases scanned concurrently
+_MAX_SCAN_WORKERS = 8
+
+# Seconds a cached detection result for the default search paths stays valid
+_CACHE_TTL = 60.0
+
+
+@dataclass(slots=True)
 class VivadoInstallation:
     """Represents a detected Vivado installation."""
 
@@ -38,7 +58,7 @@ def _parse_version(version_str: str) -> tuple[int, ...]:
     Returns:
         Tuple of version numbers for comparison
     """
-    parts = re.split(r"[._-]", version_str)
+    parts = _VERSION_SPLIT_RE.split(version_str)
     result: list[int] = []
     for part in parts:
         try:
@@ -48,138 +68,249 @@ def _parse_version(version_str: str) -> tuple[int, ...]:
     return tuple(result)
 
 
-def _get_windows_search_paths() -> list[Path]:
-    """Get standard Vivado installation paths on Windows."""
-    paths: list[Path] = []
-
-    # Standard Xilinx installation locations
-    for drive in ["C:", "D:", "E:"]:
-        paths.append(Path(f"{drive}/Xilinx/Vivado"))
-        paths.append(Path(f"{drive}/Xilinx/Vivado_Lab"))
+@lru_cache(maxsize=1)
+def _get_windows_search_paths() -> tuple[Path, ...]:
+    """Get standard Vivado installation paths on Windows.
 
-    # Also check Program Files
+    The result is computed once per process; the Program Files environment
+    variables are read on the first call only.
+    """
     program_files = os.environ.get("PROGRAMFILES", "C:/Program Files")
     program_files_x86 = os.environ.get("PROGRAMFILES(X86)", "C:/Program Files (x86)")
 
-    paths.append(Path(program_files) / "Xilinx" / "Vivado")
-    paths.append(Path(program_files_x86) / "Xilinx" / "Vivado")
-
-    return paths
-
-
-def _get_linux_search_paths() -> list[Path]:
-    """Get standard Vivado installation paths on Linux."""
-    paths: list[Path] = []
-
-    # Standard Xilinx installation locations on Linux
-    paths.append(Path("/opt/Xilinx/Vivado"))
-    paths.append(Path("/tools/Xilinx/Vivado"))
-
-    # Home directory installations
+    return (
+        # Standard Xilinx installation locations
+        *(
+            Path(f"{drive}/Xilinx/{product}")
+            for drive in ("C:", "D:", "E:")
+            for product in ("Vivado", "Vivado_Lab")
+        ),
+        # Also check Program Files
+        Path(program_files) / "Xilinx" / "Vivado",
+        Path(program_files_x86) / "Xilinx" / "Vivado",
+    )
+
+
+@lru_cache(maxsize=1)
+def _get_linux_search_paths() -> tuple[Path, ...]:
+    """Get standard Vivado installation paths on Linux.
+
+    The result is computed once per process, resolving the home directory on
+    the first call only.
+    """
     home = Path.home()
-    paths.append(home / "Xilinx" / "Vivado")
-    paths.append(home / ".Xilinx" / "Vivado")
+    return (
+        # Standard Xilinx installation locations on Linux
+        Path("/opt/Xilinx/Vivado"),
+        Path("/tools/Xilinx/Vivado"),
+        # Home directory installations
+        home / "Xilinx" / "Vivado",
+        home / ".Xilinx" / "Vivado",
+    )
 
-    return paths
 
+@lru_cache(maxsize=1)
+def _get_search_paths() -> tuple[Path, ...]:
+    """Get platform-appropriate search paths for Vivado installations.
 
-def _get_search_paths() -> list[Path]:
-    """Get platform-appropriate search paths for Vivado installations."""
+    Cached for the lifetime of the process; the returned tuple is shared.
+    """
     if os.name == "nt":
         return _get_windows_search_paths()
     return _get_linux_search_paths()
 
 
-def _find_vivado_executable(version_path: Path) -> Path | None:
+def _find_vivado_executable(version_path: str | Path) -> Path | None:
     """Find the Vivado executable within a version directory.
 
     Args:
-        version_path: Path to a Vivado version directory (e.g., C:/Xilinx/Vivado/2023.2)
+        version_path: Path to a Vivado version directory (e.g., C:/Xilinx/Vivado/2023.2).
+            Plain strings are accepted so scan loops can avoid building Path objects.
 
     Returns:
         Path to the vivado executable, or None if not found
     """
     if os.name == "nt":
-        # Windows: look for vivado.bat in bin directory
-        executable = version_path / "bin" / "vivado.bat"
-        if executable.exists():
-            return executable
-        # Also check for vivado.exe
-        executable = version_path / "bin" / "vivado.exe"
-        if executable.exists():
-            return executable
+        # Windows: look for vivado.bat, then vivado.exe, in bin directory
+        targets: tuple[str, ...] = ("vivado.bat", "vivado.exe")
     else:
         # Linux: look for vivado script in bin directory
-        executable = version_path / "bin" / "vivado"
-        if executable.exists():
-            return executable
+        targets = ("vivado",)
+
+    # One listing of bin/ replaces a stat per candidate, and a missing
+    # bin/ is reported by scandir itself
+    try:
+        with os.scandir(os.path.join(version_path, "bin")) as it:
+            names = {
+                # Windows file names are case-insensitive
+                (entry.name.lower() if os.name == "nt" else entry.name): entry.path
+                for entry in it
+                if entry.is_file(follow_symlinks=True)
+            }
+    except (FileNotFoundError, NotADirectoryError, PermissionError):
+        return None
+
+    for target in targets:
+        if target in names:
+            return Path(names[target])
 
     return None
 
 
 def _is_valid_version_dir(path: Path) -> bool:
     """Check if a directory name looks like a Vivado version."""
-    name = path.name
-    # Vivado versions are typically like 2023.2, 2024.1, etc.
-    return bool(re.match(r"^\d{4}\.\d", name))
+    return _VERSION_DIR_RE.match(path.name) is not None
+
+
+def _sorted_installations(
+    installations: list[VivadoInstallation],
+) -> list[VivadoInstallation]:
+    """Return installations sorted by version, newest first."""
+    return sorted(installations, key=lambda x: _parse_version(x.version), reverse=True)
+
+
+def _scan_base(base_path: Path) -> list[tuple[_DirId, str, str, Path]]:
+    """Find Vivado version directories directly under a search base.
+
+    Args:
+        base_path: Directory to scan (e.g., C:/Xilinx/Vivado)
+
+    Returns:
+        List of (dir_id, version, version_path, executable) tuples in listing
+        order, where dir_id is the (st_dev, st_ino) of the version directory,
+        or its resolved path when the filesystem reports an inode of 0.
+        Missing or unreadable bases yield an empty list.
+    """
+    found: list[tuple[_DirId, str, str, Path]] = []
+
+    # scandir entries carry the file type from the directory listing, so
+    # is_dir() does not need an extra stat call on most platforms.
+    try:
+        with os.scandir(base_path) as it:
+            for entry in it:
+                # Reject by name first - it is already in the listing,
+                # so non-version siblings never cost a stat
+                if not _VERSION_DIR_RE.match(entry.name):
+                    continue
+
+                if not entry.is_dir(follow_symlinks=True):
+                    continue
+
+                # Identify the directory by device and inode so that
+                # symlinked duplicates can be skipped without resolving the
+                # whole path. os.stat is used over entry.stat() because
+                # the latter leaves st_ino unset on Windows.
+                try:
+                    st = os.stat(entry.path)
+                except OSError:
+                    continue
+
+                # Find the executable
+                executable = _find_vivado_executable(entry.path)
+                if executable is None:
+                    continue
+
+                # st_ino is only unique when non-zero; some Windows and
+                # network filesystems report 0 for every entry
+                dir_id: _DirId
+                if st.st_ino:
+                    dir_id = (st.st_dev, st.st_ino)
+                else:
+                    dir_id = Path(entry.path).resolve()
+
+                found.append((dir_id, entry.name, entry.path, executable))
+    except (FileNotFoundError, NotADirectoryError, PermissionError):
+        # Skip missing base paths and directories we can't read
+        pass
+
+    return found
+
+
+# Last detection result for the default search paths, as (monotonic time, installations)
+_detection_cache: tuple[float, list[VivadoInstallation]] | None = None
+
+
+def invalidate_detection_cache() -> None:
+    """Discard the cached result of detecting installations in the default paths.
+
+    The next call to detect_vivado_installations() without explicit search
+    paths will scan the filesystem again.
+    """
+    global _detection_cache
+    _detection_cache = None
 
 
 def detect_vivado_installations(
-    search_paths: list[Path] | None = None,
+    search_paths: Sequence[Path] | None = None,
+    sort: bool = True,
 ) -> list[VivadoInstallation]:
     """Detect all Vivado installations on the system.
 
+    Results for the platform default search paths are cached for _CACHE_TTL
+    seconds; use invalidate_detection_cache() to force a rescan. Explicit
+    search paths are always scanned.
+
     Args:
         search_paths: Optional list of paths to search. If None, uses platform defaults.
+        sort: Sort the result by version. Callers that only need one entry can
+            pass False and skip the sort.
 
     Returns:
-        List of detected VivadoInstallation objects, sorted by version (newest first)
+        List of detected VivadoInstallation objects, sorted by version (newest
+        first) unless sort is False
     """
+    global _detection_cache
+
+    use_cache = search_paths is None
     if search_paths is None:
+        cached = _detection_cache
+        if cached is not None and time.monotonic() - cached[0] < _CACHE_TTL:
+            return _sorted_installations(cached[1]) if sort else list(cached[1])
         search_paths = _get_search_paths()
 
-    installations: list[VivadoInstallation] = []
-    seen_paths: set[Path] = set()
-
+    # Several standard locations can point at the same directory (e.g.
+    # %PROGRAMFILES% on C:), so drop duplicates before scanning. The first
+    # spelling of each base path is kept for the reported paths.
+    unique_bases: dict[Path, Path] = {}
     for base_path in search_paths:
-        if not base_path.exists() or not base_path.is_dir():
-            continue
-
-        # Look for version directories within the base path
         try:
-            for version_dir in base_path.iterdir():
-                if not version_dir.is_dir():
-                    continue
-
-                # Skip if not a valid version directory name
-                if not _is_valid_version_dir(version_dir):
-                    continue
-
-                # Resolve to handle symlinks and normalize path
-                resolved_path = version_dir.resolve()
-                if resolved_path in seen_paths:
-                    continue
-                seen_paths.add(resolved_path)
+            resolved_base = Path(base_path).resolve()
+        except OSError:
+            continue
+        unique_bases.setdefault(resolved_base, base_path)
 
-                # Find the executable
-                executable = _find_vivado_executable(version_dir)
-                if executable is None:
+    installations: list[VivadoInstallation] = []
+    seen_ids: set[_DirId] = set()
+
+    # Scan the bases concurrently so slow drives or network mounts overlap,
+    # then merge in search order so the first spelling of a directory wins
+    bases = list(unique_bases.values())
+    if bases:
+        workers = min(len(bases), _MAX_SCAN_WORKERS)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            scans = list(executor.map(_scan_base, bases))
+
+        for scan in scans:
+            for dir_id, version, version_path, executable in scan:
+                # Skip symlinked duplicates found under another base
+                if dir_id in seen_ids:
                     continue
+                seen_ids.add(dir_id)
 
                 installations.append(
                     VivadoInstallation(
-                        version=version_dir.name,
-                        path=version_dir,
+                        version=version,
+                        path=Path(version_path),
                         executable=executable,
                     )
                 )
-        except PermissionError:
-            # Skip directories we can't read
-            continue
 
-    # Sort by version, newest first
-    installations.sort(key=lambda x: _parse_version(x.version), reverse=True)
+    if use_cache:
+        # Cache in scan order; sorting is applied per call
+        _detection_cache = (time.monotonic(), list(installations))
 
+    if sort:
+        return _sorted_installations(installations)
     return installations
 
 
@@ -194,6 +325,10 @@ def get_default_vivado(
     2. If override_version is provided, find that version from detected installations
     3. Otherwise, use the most recent detected version
 
+    Detection results are shared with detect_vivado_installations(), so
+    repeated lookups don't rescan the filesystem until the cache expires or
+    invalidate_detection_cache() is called.
+
     Args:
         override_path: Optional explicit path to a Vivado installation
         override_version: Optional specific version to use (e.g., "2023.2")
@@ -204,9 +339,8 @@ def get_default_vivado(
     # If an explicit path is provided, use it directly
     if override_path is not None:
         override_path = Path(override_path)
-        if not override_path.exists():
-            return None
 
+        # A missing path has no bin/ either, so this also covers that case
         executable = _find_vivado_executable(override_path)
         if executable is None:
             return None
@@ -223,8 +357,8 @@ def get_default_vivado(
             executable=executable,
         )
 
-    # Detect all installations
-    installations = detect_vivado_installations()
+    # Detect all installations; selection below never needs the full order
+    installations = detect_vivado_installations(sort=False)
 
     if not installations:
         return None
@@ -237,5 +371,5 @@ def get_default_vivado(
         # Version not found
         return None
 
-    # Return the most recent version (first in sorted list)
-    return installations[0]
+    # Return the most recent version
+    return max(installations, key=lambda x: _parse_version(x.version))
@@ -7,9 +7,14 @@ session, allowing subsequent commands to run faster without Vivado startup overh
 from __future__ import annotations
 
 import asyncio
+import itertools
+import os
+import re
 import tempfile
+import time
 import uuid
-from dataclasses import dataclass, field
+from collections import deque
+from dataclasses import dataclass, field, replace
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
@@ -25,6 +30,13 @@ MAX_OUTPUT_SIZE = 50000  # ~50KB of text, roughly ~12,500 tokens
 # Directory for storing large output files
 _OUTPUT_DIR: Path | None = None
 
+# Set to "1" to start a persistent session on the first fallback command and
+# reuse it for later ones instead of running each command in batch mode
+_AUTO_SESSION_ENV = "VIVADO_MCP_AUTO_SESSION"
+
+# Commands that end the TCL shell are always run in batch mode
+_SESSION_ENDING_RE = re.compile(r"^\s*(?:exit|quit)\b", re.MULTILINE)
+
 
 def get_output_dir() -> Path:
     """Get or create the directory for storing large output files.
@@ -39,7 +51,7 @@ def get_output_dir() -> Path:
     return _OUTPUT_DIR
 
 
-@dataclass
+@dataclass(slots=True)
 class TruncationResult:
     """Result of truncating output."""
 
@@ -123,7 +135,7 @@ class SessionState(str, Enum):
     ERROR = "error"
 
 
-@dataclass
+@dataclass(slots=True)
 class TclCommandResult:
     """Represents the result of a TCL command execution."""
 
@@ -148,8 +160,8 @@ class TclCommandResult:
             "command": self.command,
             "output": result.truncated_output,
             "output_truncated": result.was_truncated,
-            "errors": [e.to_dict() for e in self.errors],
-            "critical_warnings": [w.to_dict() for w in self.critical_warnings],
+            "errors": list(map(BuildMessage.to_dict, self.errors)),
+            "critical_warnings": list(map(BuildMessage.to_dict, self.critical_warnings)),
             "error_count": len(self.errors),
             "critical_warning_count": len(self.critical_warnings),
             "execution_time_ms": self.execution_time_ms,
@@ -159,7 +171,7 @@ class TclCommandResult:
         return response
 
 
-@dataclass
+@dataclass(slots=True)
 class SessionInfo:
     """Information about a TCL shell session."""
 
@@ -190,9 +202,40 @@ class TclSession:
     Vivado for each command.
     """
 
-    # Unique marker to detect end of command output
-    _OUTPUT_MARKER = "<<<VIVADO_MCP_CMD_COMPLETE>>>"
-    _ERROR_MARKER = "<<<VIVADO_MCP_CMD_ERROR>>>"
+    # Each command response is framed as
+    #   <<VMCP:<catch status>:<result bytes>>>\n<result><<VMCP:END>>\n
+    # so the reader knows exactly how much to consume once it sees the header
+    _FRAME_PREFIX = b"<<VMCP:"
+    _FRAME_HEADER_RE = re.compile(rb"<<VMCP:(\d+):(\d+)>>\n")
+    _FRAME_TRAILER = b"<<VMCP:END>>\n"
+    # Bytes of the previous read kept to catch a prompt split across reads
+    _TAIL_SIZE = len(b"vivado%") - 1
+
+    # Bytes requested per stdout read; matches the Linux pipe buffer so large
+    # logs are consumed in few reads
+    _READ_CHUNK = 65536
+    # Bytes requested when draining trailing output after the prompt
+    _DRAIN_CHUNK = 8192
+    # StreamReader buffer limit, large enough for long Vivado log lines
+    _STREAM_LIMIT = 1 << 20
+
+    # Most queued commands sent to Vivado in a single stdin write
+    _MAX_BATCH = 16
+    # A batch stops growing once its wrapped commands reach this many bytes
+    _MAX_BATCH_BYTES = 65536
+    # Fixed Tcl around each command; see _wrap_command()
+    _WRAP_PREFIX = b"\nset __vmcp_status [catch {"
+    _WRAP_SUFFIX = (
+        b"} __vmcp_out]\n"
+        b"set __vmcp_bytes [encoding convertto utf-8 $__vmcp_out]\n"
+        b"set __vmcp_translation [fconfigure stdout -translation]\n"
+        b"set __vmcp_encoding [fconfigure stdout -encoding]\n"
+        b"fconfigure stdout -translation binary\n"
+        b'puts -nonewline "<<VMCP:${__vmcp_status}:[string length $__vmcp_bytes]>>\\n"\n'
+        b'puts -nonewline "$__vmcp_bytes<<VMCP:END>>\\n"\n'
+        b"flush stdout\n"
+        b"fconfigure stdout -translation $__vmcp_translation -encoding $__vmcp_encoding\n"
+    )
 
     def __init__(
         self,
@@ -211,9 +254,20 @@ class TclSession:
         self._process: asyncio.subprocess.Process | None = None
         self._state = SessionState.CLOSED
         self._session_id = str(uuid.uuid4())
-        self._started_at: str | None = None
+        # Kept as a raw timestamp; it is only formatted when info is requested
+        self._started_at_ns: int | None = None
         self._command_count = 0
+        # Only the writer task advances the counter; readers see the last value
+        self._command_counter = itertools.count(1)
+        # Serializes start() and close(); commands go through the queue below
         self._lock = asyncio.Lock()
+        # Pending (command, timeout, result future) entries, run in order
+        self._queue: deque[tuple[str, bytes, float, asyncio.Future[TclCommandResult]]] = deque()
+        self._writer_task: asyncio.Task[None] | None = None
+        # Set while close() is shutting the process down
+        self._closing = False
+        # Output read past the end of the previous response frame
+        self._read_buffer = bytearray()
 
     @property
     def session_id(self) -> str:
@@ -236,7 +290,11 @@ class TclSession:
             session_id=self._session_id,
             state=self._state,
             vivado_version=self._vivado_install.version if self._vivado_install else "unknown",
-            started_at=self._started_at or "",
+            started_at=(
+                datetime.fromtimestamp(self._started_at_ns / 1e9).isoformat()
+                if self._started_at_ns is not None
+                else ""
+            ),
             working_directory=str(self._working_directory) if self._working_directory else None,
             command_count=self._command_count,
         )
@@ -278,9 +336,10 @@ class TclSession:
                     stdout=asyncio.subprocess.PIPE,
                     stderr=asyncio.subprocess.STDOUT,
                     cwd=self._working_directory,
+                    limit=self._STREAM_LIMIT,
                 )
 
-                self._started_at = datetime.now().isoformat()
+                self._started_at_ns = time.time_ns()
 
                 # Wait for Vivado to start and show the prompt
                 # We read until we see "Vivado%" or timeout
@@ -307,7 +366,7 @@ class TclSession:
                 return False, f"Failed to start Vivado: {e}"
 
     async def _read_until_prompt(self, timeout: float = 30.0) -> str:
-        """Read output until we see a Vivado prompt or marker.
+        """Read output until we see a Vivado prompt.
 
         Args:
             timeout: Maximum time to wait in seconds
@@ -318,55 +377,144 @@ class TclSession:
         if self._process is None or self._process.stdout is None:
             return ""
 
-        output_parts: list[str] = []
-        start_time = asyncio.get_event_loop().time()
+        output_parts: list[bytes] = []
+        # The prompt can straddle at most one chunk boundary, so each read
+        # only needs to be scanned together with the tail of the previous one
+        tail = b""
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
 
         while True:
-            remaining_time = timeout - (asyncio.get_event_loop().time() - start_time)
+            remaining_time = deadline - loop.time()
             if remaining_time <= 0:
                 break
 
             try:
-                # Read available data with timeout
+                # Wait for data for the rest of the timeout in one go
                 chunk = await asyncio.wait_for(
-                    self._process.stdout.read(4096),
-                    timeout=min(remaining_time, 1.0),
+                    self._process.stdout.read(self._READ_CHUNK),
+                    timeout=remaining_time,
                 )
+            except asyncio.TimeoutError:
+                break
 
-                if not chunk:
-                    # EOF - process may have exited
-                    break
-
-                text = chunk.decode("utf-8", errors="replace")
-                output_parts.append(text)
-
-                # Check for our completion markers
-                combined = "".join(output_parts)
-                if self._OUTPUT_MARKER in combined or self._ERROR_MARKER in combined:
-                    break
-
-                # Check for Vivado prompt (for startup)
-                if "Vivado%" in combined or "vivado%" in combined.lower():
-                    # Wait a tiny bit more for any trailing output
-                    try:
-                        extra = await asyncio.wait_for(
-                            self._process.stdout.read(1024),
-                            timeout=0.1,
-                        )
-                        if extra:
-                            output_parts.append(extra.decode("utf-8", errors="replace"))
-                    except asyncio.TimeoutError:
-                        pass
-                    break
+            if not chunk:
+                # EOF - process may have exited
+                break
 
-            except asyncio.TimeoutError:
-                # Check if we have a prompt in accumulated output
-                combined = "".join(output_parts)
-                if "Vivado%" in combined or "vivado%" in combined.lower():
-                    break
-                # Otherwise continue waiting
+            output_parts.append(chunk)
+            window = tail + chunk
+
+            # Check for Vivado prompt
+            if b"vivado%" in window.lower():
+                # Wait a tiny bit more for any trailing output
+                try:
+                    extra = await asyncio.wait_for(
+                        self._process.stdout.read(self._DRAIN_CHUNK),
+                        timeout=0.1,
+                    )
+                    if extra:
+                        output_parts.append(extra)
+                except asyncio.TimeoutError:
+                    pass
+                break
+
+            tail = window[-self._TAIL_SIZE :]
 
-        return "".join(output_parts)
+        # Decode once at the end; this also keeps multi-byte characters split
+        # across reads intact
+        return b"".join(output_parts).decode("utf-8", errors="replace")
+
+    def _find_frame_header(
+        self, buffer: bytearray, start: int
+    ) -> tuple[re.Match[bytes] | None, int]:
+        """Look for a complete response frame header in the buffer.
+
+        Args:
+            buffer: Bytes read so far
+            start: Offset before which the buffer is known not to hold a header
+
+        Returns:
+            Tuple of (header match or None, offset to resume the search from)
+        """
+        pos = buffer.find(self._FRAME_PREFIX, start)
+        while pos != -1:
+            header = self._FRAME_HEADER_RE.match(buffer, pos)
+            if header is not None:
+                return header, pos
+            if buffer.find(b"\n", pos) == -1:
+                # Header line may still be incomplete, wait for more data
+                return None, pos
+            # Not a header (e.g. echoed wrapper source), keep looking
+            pos = buffer.find(self._FRAME_PREFIX, pos + 1)
+        return None, max(start, len(buffer) - len(self._FRAME_PREFIX) + 1)
+
+    async def _read_frame(self, timeout: float) -> tuple[int, str, str]:
+        """Read one framed command response from the session.
+
+        Output printed before the frame header (Vivado messages, prompts and
+        echo) is returned separately from the command result. Bytes read past
+        the end of the frame are kept for the next call.
+
+        Args:
+            timeout: Maximum time to wait in seconds
+
+        Returns:
+            Tuple of (catch_status, log_output, result)
+
+        Raises:
+            asyncio.TimeoutError: If the frame is not complete within timeout
+            EOFError: If the process closes its output before the frame ends
+        """
+        if self._process is None or self._process.stdout is None:
+            raise EOFError("Session process is not available")
+
+        # The receive buffer is reused across frames so that each read only
+        # extends it in place instead of building a fresh bytes object
+        buffer = self._read_buffer
+        header, search_from = self._find_frame_header(buffer, 0)
+        frame_end = 0
+        if header is not None:
+            frame_end = header.end() + int(header.group(2)) + len(self._FRAME_TRAILER)
+
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+
+        try:
+            while header is None or len(buffer) < frame_end:
+                remaining_time = deadline - loop.time()
+                if remaining_time <= 0:
+                    raise asyncio.TimeoutError
+
+                chunk = await asyncio.wait_for(
+                    self._process.stdout.read(self._READ_CHUNK),
+                    timeout=remaining_time,
+                )
+                if not chunk:
+                    raise EOFError("Session process closed its output")
+                buffer += chunk
+
+                if header is None:
+                    header, search_from = self._find_frame_header(buffer, search_from)
+                    if header is not None:
+                        frame_end = (
+                            header.end() + int(header.group(2)) + len(self._FRAME_TRAILER)
+                        )
+        except BaseException:
+            # A partial frame cannot be resumed, drop it
+            buffer.clear()
+            raise
+
+        result_end = frame_end - len(self._FRAME_TRAILER)
+        status = int(header.group(1))
+
+        # Decode straight from the buffer, then drop the consumed frame in
+        # place so any bytes of the next response stay at the front
+        with memoryview(buffer) as view:
+            log_output = str(view[: header.start()], "utf-8", "replace")
+            result = str(view[header.end() : result_end], "utf-8", "replace")
+        del buffer[:frame_end]
+        return status, log_output, result
 
     async def execute(
         self,
@@ -375,6 +523,9 @@ class TclSession:
     ) -> TclCommandResult:
         """Execute a TCL command in the session.
 
+        Commands are queued and run one at a time, in submission order, by a
+        writer task that owns the process pipes.
+
         Args:
             command: The TCL command to execute
             timeout: Maximum time to wait for command completion in seconds
@@ -382,108 +533,300 @@ class TclSession:
         Returns:
             TclCommandResult with the command output and any errors
         """
-        async with self._lock:
-            if self._state == SessionState.CLOSED:
-                return TclCommandResult(
-                    success=False,
-                    command=command,
-                    output="Session is not started. Call start() first.",
-                )
+        if self._closing:
+            # Same answer the caller gets once close() has finished
+            return TclCommandResult(
+                success=False,
+                command=command,
+                output="Session is not started. Call start() first.",
+            )
 
-            if self._state == SessionState.ERROR:
-                return TclCommandResult(
-                    success=False,
-                    command=command,
-                    output="Session is in error state. Close and restart.",
-                )
+        unavailable = self._unavailable_result(command)
+        if unavailable is not None:
+            return unavailable
 
-            if self._process is None or self._process.stdin is None:
-                return TclCommandResult(
-                    success=False,
-                    command=command,
-                    output="Session process is not available.",
-                )
+        # Blank lines and single-line comments do nothing in Tcl, so answer
+        # them without a round-trip to Vivado
+        stripped = command.strip()
+        if not stripped or (stripped.startswith("#") and "\n" not in stripped):
+            return TclCommandResult(success=True, command=command, output="")
 
-            self._state = SessionState.BUSY
-            start_time = asyncio.get_event_loop().time()
+        # Encode up front so a bad command fails on its own instead of
+        # stopping the writer task with other commands queued behind it
+        try:
+            wrapped = self._wrap_command(command)
+        except UnicodeEncodeError as e:
+            return TclCommandResult(
+                success=False,
+                command=command,
+                output=f"Command cannot be sent to Vivado: {e}",
+            )
 
-            try:
-                # Wrap command with markers for output detection
-                # We use puts to print a marker after the command completes
-                wrapped_command = f"""
-if {{[catch {{{command}}} result]}} {{
-    puts $result
-    puts "{self._ERROR_MARKER}"
-}} else {{
-    if {{$result ne ""}} {{
-        puts $result
-    }}
-    puts "{self._OUTPUT_MARKER}"
-}}
-"""
-                # Send the command
-                self._process.stdin.write(wrapped_command.encode("utf-8"))
-                await self._process.stdin.drain()
+        future: asyncio.Future[TclCommandResult] = asyncio.get_running_loop().create_future()
+        self._queue.append((command, wrapped, timeout, future))
+        if self._writer_task is None or self._writer_task.done():
+            self._writer_task = asyncio.create_task(self._run_queue())
+        return await future
 
-                # Read output until we see our marker
-                output = await self._read_until_prompt(timeout=timeout)
+    def _unavailable_result(self, command: str) -> TclCommandResult | None:
+        """Build the failure result for a session that cannot run commands.
 
-                end_time = asyncio.get_event_loop().time()
-                execution_time_ms = (end_time - start_time) * 1000
+        Args:
+            command: The TCL command that was requested
 
-                self._command_count += 1
+        Returns:
+            A failed TclCommandResult, or None if the session can run commands
+        """
+        if self._state == SessionState.CLOSED:
+            return TclCommandResult(
+                success=False,
+                command=command,
+                output="Session is not started. Call start() first.",
+            )
 
-                # Check for error marker
-                is_error = self._ERROR_MARKER in output
-                success = not is_error
+        if self._state == SessionState.STARTING:
+            # start() is still reading the startup output from the process
+            return TclCommandResult(
+                success=False,
+                command=command,
+                output="Session is still starting. Wait for start() to finish.",
+            )
 
-                # Clean up markers from output
-                clean_output = output.replace(self._OUTPUT_MARKER, "").replace(
-                    self._ERROR_MARKER, ""
-                )
-                # Remove empty lines and the command echo
-                lines = clean_output.strip().split("\n")
-                # Filter out command echo and prompt lines
-                filtered_lines = [
-                    line
-                    for line in lines
-                    if not line.strip().startswith("Vivado%")
-                    and not line.strip() == command.strip()
-                    and line.strip()
-                ]
-                clean_output = "\n".join(filtered_lines)
-
-                # Parse for errors and warnings
-                errors, critical_warnings = parse_vivado_output(output)
-
-                if errors:
-                    success = False
+        if self._state == SessionState.ERROR:
+            return TclCommandResult(
+                success=False,
+                command=command,
+                output="Session is in error state. Close and restart.",
+            )
 
-                self._state = SessionState.READY
-                return TclCommandResult(
-                    success=success,
-                    command=command,
-                    output=clean_output,
-                    errors=errors,
-                    critical_warnings=critical_warnings,
-                    execution_time_ms=execution_time_ms,
-                )
+        if self._process is None or self._process.stdin is None:
+            return TclCommandResult(
+                success=False,
+                command=command,
+                output="Session process is not available.",
+            )
 
-            except asyncio.TimeoutError:
-                self._state = SessionState.ERROR
-                return TclCommandResult(
-                    success=False,
-                    command=command,
-                    output=f"Command timed out after {timeout} seconds",
-                )
+        return None
+
+    async def _run_queue(self) -> None:
+        """Run queued commands until the queue is empty.
+
+        Queued commands are sent in batches of up to _MAX_BATCH commands with
+        a single stdin write, then their responses are read back in order.
+        While this task runs it is the only user of the process pipes, so
+        commands never interleave on stdin/stdout.
+        """
+        batch: list[tuple[str, float, asyncio.Future[TclCommandResult]]] = []
+        try:
+            while self._queue:
+                batch = []
+                payload = bytearray()
+                while self._queue and len(batch) < self._MAX_BATCH:
+                    command, wrapped, timeout, future = self._queue[0]
+                    if future.cancelled():
+                        # Caller gave up before the command was sent
+                        self._queue.popleft()
+                        continue
+
+                    if batch and len(payload) + len(wrapped) > self._MAX_BATCH_BYTES:
+                        break
+                    self._queue.popleft()
+                    batch.append((command, timeout, future))
+                    payload += wrapped
+
+                if batch:
+                    await self._run_batch(batch, bytes(payload))
+        finally:
+            # Only reached with unresolved futures if the loop was interrupted;
+            # nothing else would ever resolve them, so their callers would hang
+            pending = [(command, future) for command, _, future in batch]
+            pending += [(command, future) for command, _, _, future in self._queue]
+            self._queue.clear()
+            for command, future in pending:
+                if not future.done():
+                    self._state = SessionState.ERROR
+                    future.set_result(
+                        TclCommandResult(
+                            success=False,
+                            command=command,
+                            output="Session stopped unexpectedly before the command finished",
+                        )
+                    )
+
+    def _wrap_command(self, command: str) -> bytes:
+        """Wrap a command so its result comes back in a length-prefixed frame.
+
+        The result is written as UTF-8 bytes over a binary channel so the
+        byte count matches what the reader sees.
+
+        Args:
+            command: The TCL command to wrap
 
-            except BrokenPipeError:
+        Returns:
+            The TCL source to send to the session
+        """
+        return self._WRAP_PREFIX + command.encode("utf-8") + self._WRAP_SUFFIX
+
+    async def _run_batch(
+        self,
+        batch: list[tuple[str, float, asyncio.Future[TclCommandResult]]],
+        payload: bytes,
+    ) -> None:
+        """Send a batch of wrapped commands and resolve each command's future.
+
+        Must only be called from the writer task.
+
+        Args:
+            batch: The (command, timeout, future) entries being sent
+            payload: The wrapped commands, concatenated in batch order
+        """
+        # An earlier queued command may have left the session unusable
+        unavailable = self._unavailable_result(batch[0][0])
+        if unavailable is not None:
+            for command, _, future in batch:
+                if not future.done():
+                    future.set_result(replace(unavailable, command=command))
+            return
+        # Guaranteed by the check above, restated for the type checker
+        assert self._process is not None and self._process.stdin is not None
+
+        self._state = SessionState.BUSY
+        start_time = asyncio.get_running_loop().time()
+
+        try:
+            # Send the whole batch at once. The pipe transport already calls
+            # os.write() directly when nothing is buffered and drain() only
+            # suspends while the pipe is full, so this is not worth bypassing;
+            # drain() is also where a closed pipe is reported
+            self._process.stdin.write(payload)
+            await self._process.stdin.drain()
+        except Exception as e:
+            # A dead process shows up as BrokenPipeError from write() or
+            # ConnectionResetError from drain()
+            if isinstance(e, ConnectionError):
+                output = "Session process has terminated unexpectedly"
+            else:
+                output = f"Failed to send command to the session: {e}"
+            self._state = SessionState.ERROR
+            for command, _, future in batch:
+                if not future.done():
+                    future.set_result(
+                        TclCommandResult(success=False, command=command, output=output)
+                    )
+            return
+
+        # Set once a response could not be read; the stream is then out of
+        # step, so later responses in the batch cannot be matched up
+        failure: str | None = None
+
+        for command, timeout, future in batch:
+            if failure is not None:
+                # The command was already written and Vivado will still run
+                # it, so report it as unobserved rather than as not run
+                if not future.done():
+                    future.set_result(
+                        TclCommandResult(
+                            success=False,
+                            command=command,
+                            output=(
+                                "Command was sent to Vivado but its output could not be "
+                                f"read because an earlier command failed: {failure}"
+                            ),
+                        )
+                    )
+                continue
+
+            # Responses must be read even for cancelled callers to keep the
+            # stream in step with the commands that were sent
+            try:
+                result = await self._read_result(command, timeout, start_time)
+            except Exception as e:
+                failure = str(e) or type(e).__name__
                 self._state = SessionState.ERROR
-                return TclCommandResult(
-                    success=False,
-                    command=command,
-                    output="Session process has terminated unexpectedly",
-                )
+                if not future.done():
+                    future.set_exception(e)
+            else:
+                if self._state == SessionState.ERROR:
+                    failure = result.output
+                if not future.done():
+                    future.set_result(result)
+            finally:
+                if not future.done():
+                    future.cancel()
+            start_time = asyncio.get_running_loop().time()
+
+    async def _read_result(
+        self, command: str, timeout: float, start_time: float
+    ) -> TclCommandResult:
+        """Read the response to a sent command and build its result.
+
+        Args:
+            command: The TCL command that was sent
+            timeout: Maximum time to wait for command completion in seconds
+            start_time: Event loop time at which the command started
+
+        Returns:
+            TclCommandResult with the command output and any errors
+        """
+        try:
+            # Read output up to the end of the response frame
+            status, log_output, result = await self._read_frame(timeout=timeout)
+
+            end_time = asyncio.get_running_loop().time()
+            execution_time_ms = (end_time - start_time) * 1000
+
+            self._command_count = next(self._command_counter)
+
+            # A non-zero catch status means the command raised an error
+            success = status == 0
+
+            # Filter out command echo, prompt and empty lines from the log in
+            # a single pass, stripping each line only once
+            echo = command.strip()
+            filtered_lines: list[str] = []
+            for line in log_output.split("\n"):
+                stripped = line.strip()
+                if not stripped or stripped == echo or stripped.startswith("Vivado%"):
+                    continue
+                filtered_lines.append(line)
+            result = result.strip()
+            if result:
+                filtered_lines.append(result)
+            clean_output = "\n".join(filtered_lines)
+
+            # Parse for errors and warnings. Messages only match at the start
+            # of a line, so the lines dropped above can never contain one and
+            # the cleaned output can be parsed instead of the raw log
+            errors, critical_warnings = parse_vivado_output(clean_output)
+
+            if errors:
+                success = False
+
+            self._state = SessionState.READY
+            return TclCommandResult(
+                success=success,
+                command=command,
+                output=clean_output,
+                errors=errors,
+                critical_warnings=critical_warnings,
+                execution_time_ms=execution_time_ms,
+            )
+
+        except asyncio.TimeoutError:
+            self._state = SessionState.ERROR
+            return TclCommandResult(
+                success=False,
+                command=command,
+                output=f"Command timed out after {timeout} seconds",
+            )
+
+        except EOFError:
+            self._state = SessionState.ERROR
+            return TclCommandResult(
+                success=False,
+                command=command,
+                output="Session process has terminated unexpectedly",
+            )
 
     async def close(self) -> tuple[bool, str]:
         """Close the TCL session.
@@ -495,34 +838,44 @@ if {{[catch {{{command}}} result]}} {{
             if self._state == SessionState.CLOSED:
                 return True, "Session is already closed"
 
-            if self._process is None:
-                self._state = SessionState.CLOSED
-                return True, "Session closed"
-
+            # Reject new commands from here on; anything submitted now would
+            # be written after the exit command
+            self._closing = True
             try:
-                # Try to exit gracefully first
-                if self._process.stdin is not None:
-                    try:
-                        self._process.stdin.write(b"exit\n")
-                        await self._process.stdin.drain()
+                # Let commands that were already queued finish first
+                if self._writer_task is not None and not self._writer_task.done():
+                    await self._writer_task
 
-                        # Wait briefly for graceful exit
+                if self._process is None:
+                    self._state = SessionState.CLOSED
+                    return True, "Session closed"
+
+                try:
+                    # Try to exit gracefully first
+                    if self._process.stdin is not None:
                         try:
-                            await asyncio.wait_for(self._process.wait(), timeout=5.0)
-                        except asyncio.TimeoutError:
+                            self._process.stdin.write(b"exit\n")
+                            await self._process.stdin.drain()
+
+                            # Wait briefly for graceful exit
+                            try:
+                                await asyncio.wait_for(self._process.wait(), timeout=5.0)
+                            except asyncio.TimeoutError:
+                                pass
+                        except (BrokenPipeError, OSError):
                             pass
-                    except (BrokenPipeError, OSError):
-                        pass
 
-                # Kill if still running
-                await self._kill_process()
+                    # Kill if still running
+                    await self._kill_process()
 
-                self._state = SessionState.CLOSED
-                return True, "Session closed successfully"
+                    self._state = SessionState.CLOSED
+                    return True, "Session closed successfully"
 
-            except Exception as e:
-                self._state = SessionState.CLOSED
-                return False, f"Error closing session: {e}"
+                except Exception as e:
+                    self._state = SessionState.CLOSED
+                    return False, f"Error closing session: {e}"
+            finally:
+                self._closing = False
 
     async def _kill_process(self) -> None:
         """Kill the Vivado process if running."""
@@ -546,6 +899,9 @@ class SessionManager:
         self._sessions: dict[str, TclSession] = {}
         self._default_session_id: str | None = None
         self._lock = asyncio.Lock()
+        # Held while a default session is started on demand, so concurrent
+        # callers wait for one Vivado process instead of each starting one
+        self._auto_create_lock = asyncio.Lock()
 
     async def create_session(
         self,
@@ -563,20 +919,43 @@ class SessionManager:
         Returns:
             Tuple of (session, success, message)
         """
-        async with self._lock:
-            session = TclSession(
-                vivado_install=vivado_install,
-                working_directory=working_directory,
-            )
+        session = TclSession(
+            vivado_install=vivado_install,
+            working_directory=working_directory,
+        )
 
-            success, message = await session.start()
+        # Start outside the lock so a slow Vivado startup doesn't block
+        # other sessions from being created or closed
+        success, message = await session.start()
 
-            if success:
+        if success:
+            async with self._lock:
                 self._sessions[session.session_id] = session
                 if set_as_default or self._default_session_id is None:
                     self._default_session_id = session.session_id
 
-            return session, success, message
+        return session, success, message
+
+    async def get_or_create_default_session(
+        self, vivado_install: VivadoInstallation | None = None
+    ) -> TclSession | None:
+        """Return the default session, starting one if there is none yet.
+
+        Args:
+            vivado_install: Optional specific Vivado installation to use
+
+        Returns:
+            The active default session, or None if a default session exists
+            but is not active or a new one could not be started
+        """
+        async with self._auto_create_lock:
+            # Another caller may have started it while this one waited
+            if self._default_session_id is not None:
+                session = self.get_session()
+                return session if session is not None and session.is_active else None
+
+            session, success, _ = await self.create_session(vivado_install=vivado_install)
+            return session if success else None
 
     def get_session(self, session_id: str | None = None) -> TclSession | None:
         """Get a session by ID or return the default session.
@@ -611,22 +990,19 @@ class SessionManager:
             if session_id is None:
                 return False, "No session to close"
 
-            session = self._sessions.get(session_id)
+            # Remove from sessions dict
+            session = self._sessions.pop(session_id, None)
             if session is None:
                 return False, f"Session not found: {session_id}"
 
-            success, message = await session.close()
-
-            # Remove from sessions dict
-            del self._sessions[session_id]
-
             # Update default session
             if self._default_session_id == session_id:
                 self._default_session_id = (
                     next(iter(self._sessions.keys())) if self._sessions else None
                 )
 
-            return success, message
+        # The graceful exit can take seconds, so it runs without the lock
+        return await session.close()
 
     async def close_all_sessions(self) -> list[tuple[str, bool, str]]:
         """Close all sessions.
@@ -637,14 +1013,22 @@ class SessionManager:
         results: list[tuple[str, bool, str]] = []
 
         async with self._lock:
-            for session_id in list(self._sessions.keys()):
-                session = self._sessions[session_id]
-                success, message = await session.close()
-                results.append((session_id, success, message))
-                del self._sessions[session_id]
-
+            items = list(self._sessions.items())
+            self._sessions.clear()
             self._default_session_id = None
 
+        # Close every session at once so shutdown takes as long as the
+        # slowest session rather than the sum of all of them
+        outcomes = await asyncio.gather(
+            *(session.close() for _, session in items),
+            return_exceptions=True,
+        )
+        for (session_id, _), outcome in zip(items, outcomes, strict=True):
+            if isinstance(outcome, BaseException):
+                results.append((session_id, False, f"Error closing session: {outcome}"))
+            else:
+                results.append((session_id, *outcome))
+
         return results
 
     def list_sessions(self) -> list[SessionInfo]:
@@ -684,6 +1068,11 @@ async def run_tcl_command_with_fallback(
     This function first tries to use an existing session. If no session
     is available, it falls back to running the command in batch mode.
 
+    When the VIVADO_MCP_AUTO_SESSION environment variable is "1" and no
+    session exists yet, a persistent session is started instead and becomes
+    the default, so later calls skip Vivado startup. Commands that would exit
+    the shell, and calls for an explicit session_id, still use batch mode.
+
     Args:
         command: The TCL command to execute
         session_id: Optional session ID to use
@@ -700,10 +1089,50 @@ async def run_tcl_command_with_fallback(
         # Use existing session
         return await session.execute(command, timeout=timeout)
 
+    if (
+        session_id is None
+        and manager.default_session_id is None
+        and os.environ.get(_AUTO_SESSION_ENV) == "1"
+        and not _SESSION_ENDING_RE.search(command)
+    ):
+        session = await manager.get_or_create_default_session(vivado_install=vivado_install)
+        if session is not None:
+            return await session.execute(command, timeout=timeout)
+
     # Fall back to batch mode
     return await _run_batch_command(command, vivado_install, timeout)
 
 
+async def _collect_batch_output(
+    process: asyncio.subprocess.Process, script: bytes | None
+) -> bytes:
+    """Feed a batch process its script and collect its combined output.
+
+    Args:
+        process: The Vivado process, with stderr merged into stdout
+        script: TCL to write to stdin, or None if it was given as a file
+
+    Returns:
+        Everything the process printed before exiting
+    """
+    if script is not None and process.stdin is not None:
+        try:
+            process.stdin.write(script)
+            await process.stdin.drain()
+        except (BrokenPipeError, ConnectionResetError):
+            # Vivado exited before reading its input; its output says why
+            pass
+        process.stdin.close()
+
+    output = bytearray()
+    if process.stdout is not None:
+        while chunk := await process.stdout.read(TclSession._READ_CHUNK):
+            output += chunk
+
+    await process.wait()
+    return bytes(output)
+
+
 async def _run_batch_command(
     command: str,
     vivado_install: VivadoInstallation | None = None,
@@ -719,8 +1148,6 @@ async def _run_batch_command(
     Returns:
         TclCommandResult with the command output
     """
-    import tempfile
-
     if vivado_install is None:
         vivado_install = get_default_vivado()
 
@@ -731,38 +1158,45 @@ async def _run_batch_command(
             output="No Vivado installation found. Install Vivado or set VIVADO_PATH.",
         )
 
-    # Create a temporary TCL file with the command
-    with tempfile.NamedTemporaryFile(
-        mode="w",
-        suffix=".tcl",
-        delete=False,
-        prefix="vivado_cmd_",
-    ) as tcl_file:
-        tcl_file.write(command)
-        tcl_file.write("\nexit\n")
-        tcl_path = tcl_file.name
-
-    start_time = asyncio.get_event_loop().time()
+    script = f"{command}\nexit\n"
+    tcl_path: str | None = None
+    if os.name == "nt":
+        # Windows has no /dev/stdin, so the command goes through a TCL file
+        with tempfile.NamedTemporaryFile(
+            mode="w",
+            suffix=".tcl",
+            delete=False,
+            prefix="vivado_cmd_",
+        ) as tcl_file:
+            tcl_file.write(script)
+            tcl_path = tcl_file.name
+
+    start_time = asyncio.get_running_loop().time()
 
     try:
         vivado_exe = str(vivado_install.executable)
         cmd = [
             vivado_exe,
             "-mode", "batch",
-            "-source", tcl_path,
+            "-source", tcl_path or "/dev/stdin",
             "-nojournal",
             "-nolog",
         ]
 
         process = await asyncio.create_subprocess_exec(
             *cmd,
+            stdin=asyncio.subprocess.PIPE if tcl_path is None else None,
             stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.STDOUT,
+            limit=TclSession._STREAM_LIMIT,
         )
 
         try:
-            stdout_bytes, stderr_bytes = await asyncio.wait_for(
-                process.communicate(),
+            # Without a script file the command is piped in on stdin
+            output_bytes = await asyncio.wait_for(
+                _collect_batch_output(
+                    process, script.encode("utf-8") if tcl_path is None else None
+                ),
                 timeout=timeout,
             )
         except asyncio.TimeoutError:
@@ -774,14 +1208,12 @@ async def _run_batch_command(
                 output=f"Command timed out after {timeout} seconds",
             )
 
-        end_time = asyncio.get_event_loop().time()
+        end_time = asyncio.get_running_loop().time()
         execution_time_ms = (end_time - start_time) * 1000
 
-        stdout = stdout_bytes.decode("utf-8", errors="replace")
-        stderr = stderr_bytes.decode("utf-8", errors="replace")
-        combined_output = stdout + "\n" + stderr
+        output = output_bytes.decode("utf-8", errors="replace")
 
-        errors, critical_warnings = parse_vivado_output(combined_output)
+        errors, critical_warnings = parse_vivado_output(output_bytes)
 
         exit_code = process.returncode or 0
         success = exit_code == 0 and len(errors) == 0
@@ -789,16 +1221,15 @@ async def _run_batch_command(
         return TclCommandResult(
             success=success,
             command=command,
-            output=stdout.strip(),
+            output=output.strip(),
             errors=errors,
             critical_warnings=critical_warnings,
             execution_time_ms=execution_time_ms,
         )
 
     finally:
-        import os
-
-        try:
-            os.unlink(tcl_path)
-        except OSError:
-            pass
+        if tcl_path is not None:
+            try:
+                os.unlink(tcl_path)
+            except OSError:
+                pass
@@ -3,11 +3,17 @@
 from __future__ import annotations
 
 import asyncio
+import dataclasses
+import os
+import re
+import shutil
+from collections.abc import Callable
 from pathlib import Path
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import patch
 
 import pytest
 
+from vivado_mcp.vivado import build
 from vivado_mcp.vivado.build import (
     BitstreamResult,
     BuildMessage,
@@ -22,7 +28,10 @@ from vivado_mcp.vivado.build import (
     _generate_synthesis_tcl,
     _get_run_directory_timestamp,
     _parse_bitstream_path,
+    _parse_build_output,
     _parse_run_status,
+    _read_log_tail,
+    _resolve_runs_dir,
     _validate_project_path,
     get_build_status,
     parse_vivado_output,
@@ -34,6 +43,194 @@ from vivado_mcp.vivado.build import (
 from vivado_mcp.vivado.detection import VivadoInstallation
 
 
+@pytest.fixture(scope="session")
+def mock_install(tmp_path_factory: pytest.TempPathFactory) -> VivadoInstallation:
+    """A fake Vivado installation shared by every test."""
+    root = tmp_path_factory.mktemp("vivado")
+    return VivadoInstallation(
+        version="2023.2",
+        path=root / "Vivado" / "2023.2",
+        executable=root / "Vivado" / "2023.2" / "bin" / "vivado",
+    )
+
+
+def _make_files(directory: Path, *names: str) -> None:
+    """Create a directory, with any missing parents, holding the given empty files."""
+    os.makedirs(directory, exist_ok=True)
+    for name in names:
+        # Skips the utime() Path.touch() tries first on every call
+        os.close(os.open(directory / name, os.O_CREAT | os.O_WRONLY, 0o644))
+
+
+@pytest.fixture(scope="session")
+def session_tmp(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """A shared, read-only directory holding only a non-project design.v file."""
+    root = tmp_path_factory.mktemp("vivado_build_tests")
+    (root / "design.v").touch()
+    return root
+
+
+@pytest.fixture(scope="session")
+def synth_skeleton(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """A project whose synthesis run has completed, built once and copied per test."""
+    root = tmp_path_factory.mktemp("synth_skeleton")
+    (root / "test.xpr").touch()
+    synth_dir = root / "test.runs" / "synth_1"
+    _make_files(synth_dir, ".vivado.begin.rst", ".vivado.end.rst")
+    (synth_dir / "runme.log").write_text("synth_design Complete!")
+    return root
+
+
+@pytest.fixture
+def synth_complete_project(tmp_path: Path, synth_skeleton: Path) -> Path:
+    """Recreate the completed-synthesis layout in tmp_path and return its .xpr.
+
+    The skeleton's files are hard-linked rather than copied; tests only read
+    them. Copying is the fallback where links aren't possible.
+    """
+    shutil.copytree(synth_skeleton, tmp_path, copy_function=_link_or_copy, dirs_exist_ok=True)
+    return tmp_path / "test.xpr"
+
+
+@pytest.fixture(scope="session")
+def impl_skeleton(tmp_path_factory: pytest.TempPathFactory, synth_skeleton: Path) -> Path:
+    """The completed-synthesis skeleton plus a finished impl_1 run with its bitstream."""
+    root = tmp_path_factory.mktemp("impl_skeleton")
+    shutil.copytree(synth_skeleton, root, copy_function=_link_or_copy, dirs_exist_ok=True)
+    _make_files(
+        root / "test.runs" / "impl_1", ".vivado.begin.rst", ".vivado.end.rst", "design.bit"
+    )
+    return root
+
+
+@pytest.fixture
+def impl_complete_project(impl_skeleton: Path) -> Path:
+    """The shared completed-implementation project's .xpr.
+
+    Bitstream runs only read the project tree (their TCL scripts go to the
+    system temp directory), so tests use the skeleton in place rather than
+    a per-test copy. Tests must not modify it.
+    """
+    return impl_skeleton / "test.xpr"
+
+
+def _link_or_copy(src: str, dst: str) -> None:
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+
+
+class FakeProcess:
+    """A finished Vivado process, far cheaper to build than a MagicMock."""
+
+    __slots__ = ("returncode", "stdout", "stderr", "stall", "cancelled", "kill_count")
+
+    def __init__(
+        self, returncode: int = 0, stdout: bytes = b"Success\n", stderr: bytes = b""
+    ) -> None:
+        self.returncode = returncode
+        self.stdout = stdout
+        self.stderr = stderr
+        # When set, communicate() never finishes, like a run that outlives its timeout
+        self.stall = False
+        self.cancelled = False
+        self.kill_count = 0
+
+    async def communicate(self) -> tuple[bytes, bytes]:
+        if self.stall:
+            try:
+                # A future nothing resolves; no timer is left behind on the loop
+                await asyncio.get_running_loop().create_future()
+            except asyncio.CancelledError:
+                # wait_for cancels the stalled read on timeout; record that it did
+                self.cancelled = True
+                raise
+        return self.stdout, self.stderr
+
+    def kill(self) -> None:
+        self.kill_count += 1
+
+    async def wait(self) -> int:
+        return self.returncode
+
+
+class FakeExec:
+    """Stands in for ``create_subprocess_exec``, recording the argv of the last call."""
+
+    __slots__ = ("process", "argv")
+
+    def __init__(self, process: FakeProcess) -> None:
+        self.process = process
+        self.argv: tuple[object, ...] = ()
+
+    async def __call__(self, *argv: object, **kwargs: object) -> FakeProcess:
+        self.argv = argv
+        return self.process
+
+
+ExecPatcher = Callable[[FakeProcess], FakeExec]
+
+
+@pytest.fixture(autouse=True)
+def _patch_default_vivado(
+    monkeypatch: pytest.MonkeyPatch, mock_install: VivadoInstallation
+) -> None:
+    """Resolve the default Vivado to the shared fake installation."""
+    monkeypatch.setattr(build, "get_default_vivado", lambda: mock_install)
+
+
+@pytest.fixture
+def mock_subprocess_exec(monkeypatch: pytest.MonkeyPatch) -> ExecPatcher:
+    """Return a helper that makes ``create_subprocess_exec`` yield a process."""
+
+    def install(process: FakeProcess) -> FakeExec:
+        fake_exec = FakeExec(process)
+        monkeypatch.setattr(asyncio, "create_subprocess_exec", fake_exec)
+        return fake_exec
+
+    return install
+
+
+@dataclasses.dataclass
+class VivadoMocks:
+    """Handles on the fake Vivado a run_* test talks to."""
+
+    install: VivadoInstallation
+    process: FakeProcess
+    exec: FakeExec
+
+
+@pytest.fixture
+def vivado_mocks(
+    mock_install: VivadoInstallation, mock_subprocess_exec: ExecPatcher
+) -> VivadoMocks:
+    """Route subprocess creation to a process that succeeds unless a test changes it."""
+    process = FakeProcess()
+    return VivadoMocks(install=mock_install, process=process, exec=mock_subprocess_exec(process))
+
+
+@pytest.fixture(scope="class")
+async def synthesis_call(
+    tmp_path_factory: pytest.TempPathFactory,
+) -> tuple[BuildResult, tuple[object, ...]]:
+    """Run synthesis once against a custom install; return the result and Vivado argv."""
+    root = tmp_path_factory.mktemp("synthesis_call")
+    project = root / "test.xpr"
+    project.touch()
+    custom_install = VivadoInstallation(
+        version="2024.1",
+        path=root / "Custom" / "Vivado" / "2024.1",
+        executable=root / "Custom" / "Vivado" / "2024.1" / "bin" / "vivado",
+    )
+
+    fake_exec = FakeExec(FakeProcess())
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setattr(asyncio, "create_subprocess_exec", fake_exec)
+        result = await run_synthesis(project, vivado_install=custom_install)
+    return result, fake_exec.argv
+
+
 class TestBuildMessage:
     """Tests for BuildMessage dataclass."""
 
@@ -62,6 +259,13 @@ class TestBuildMessage:
         assert result["file"] == "/path/to/design.v"
         assert result["line"] == 42
 
+    def test_frozen_without_instance_dict(self) -> None:
+        """Test that messages are immutable and carry no per-instance __dict__."""
+        msg = BuildMessage(severity="ERROR", id="Synth 8-87", message="Signal not found")
+        assert not hasattr(msg, "__dict__")
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            msg.line = 1  # type: ignore[misc]
+
 
 class TestBuildResult:
     """Tests for BuildResult dataclass."""
@@ -150,11 +354,151 @@ ERROR: [Synth 8-327] Module 'foo' not found
         assert errors[0].file == "design.v"
         assert errors[0].line == 42
 
+    def test_parse_message_stays_on_its_line(self) -> None:
+        """Test that a message without text doesn't take the next line's text."""
+        output = "ERROR: [Common 17-39]\nINFO: [Common 17-206] Exiting Vivado"
+        errors, _ = parse_vivado_output(output)
+        assert len(errors) == 1
+        assert errors[0].id == "Common 17-39"
+        assert errors[0].message == ""
+
+    def test_parse_indented_message_ignored(self) -> None:
+        """Test that messages only count at the start of a line."""
+        errors, warnings = parse_vivado_output("  ERROR: [Synth 8-87] quoted in a report")
+        assert errors == []
+        assert warnings == []
+
+    def test_parse_prefix_filter(self) -> None:
+        """Test that only lines starting with a reportable severity are parsed."""
+        output = "\n".join(
+            [
+                "INFO: [Common 17-14] Message 'ERROR: [Synth 8-87]' appears 100 times",
+                "WARNING: [Vivado 12-584] No ports matched 'CRITICAL WARNING:'",
+                "ERROR:[Synth 8-87] no space before the ID",
+            ]
+        )
+        errors, warnings = parse_vivado_output(output)
+        assert [e.id for e in errors] == ["Synth 8-87"]
+        assert warnings == []
+
+    def test_parse_long_malformed_lines(self) -> None:
+        """Test that long lines with unbalanced brackets and quotes parse correctly."""
+        output = "\n".join(
+            [
+                "ERROR: [" + "x" * 5000,
+                "ERROR: [Synth 8-87] '" + "y" * 5000,
+                "CRITICAL WARNING: [Timing 38-282] " + "'a' " * 1250 + "line 7",
+            ]
+        )
+        errors, warnings = parse_vivado_output(output)
+        assert len(errors) == 1
+        assert errors[0].id == "Synth 8-87"
+        assert errors[0].file is None
+        assert len(warnings) == 1
+        assert warnings[0].file == "a"
+        assert warnings[0].line is None
+
+    def test_parse_errors_only(self) -> None:
+        """Test that critical warnings are skipped when not requested."""
+        output = (
+            "CRITICAL WARNING: [Constraints 18-5210] No constraints selected\n"
+            "ERROR: [Synth 8-87] Signal not found\n"
+        )
+        for data in (output, output.encode()):
+            errors, warnings = parse_vivado_output(data, include_warnings=False)
+            assert [e.id for e in errors] == ["Synth 8-87"]
+            assert warnings == []
+
+    def test_parse_caps_message_length(self) -> None:
+        """Test that only the start of a very long message is kept."""
+        line = "ERROR: [Synth 8-87] " + "n" * 10000
+        for output in (line, line.encode()):
+            errors, _ = parse_vivado_output(output)
+            assert len(errors) == 1
+            assert errors[0].id == "Synth 8-87"
+            assert errors[0].message == "n" * 4096
+
+    def test_parse_id_beyond_match_window_ignored(self) -> None:
+        """Test that an ID bracket closing past the match window is not a message."""
+        errors, _ = parse_vivado_output("ERROR: [" + "x" * 2000 + "] message")
+        assert errors == []
+
     def test_parse_empty_output(self) -> None:
         errors, warnings = parse_vivado_output("")
         assert len(errors) == 0
         assert len(warnings) == 0
 
+    def test_parse_bytes_matches_text(self) -> None:
+        """Test that raw bytes parse to the same messages as decoded text."""
+        output = (
+            "INFO: [Synth 8-6155] done\n"
+            "ERROR: [Synth 8-87] Signal 'clk' not found in 'top.v' line 12\r\n"
+            "CRITICAL WARNING: [Constraints 18-5210] No constraints selected\n"
+            "ERROR: [Synth 8-9] a\x0bb\x1cc\u2028d\n"
+        )
+        errors, _ = parse_vivado_output(output)
+        assert errors[1].message == "a\x0bb\x1cc\u2028d"
+        assert parse_vivado_output(output.encode()) == parse_vivado_output(output)
+
+    def test_parse_ignores_summary_lines(self) -> None:
+        """Test that Vivado's message-count summaries aren't reported as messages."""
+        output = (
+            "Synth Design complete, checksum: 1a2b3c4d\n"
+            "INFO: [Common 17-83] Releasing license: Synthesis\n"
+            "synth_design completed successfully\n"
+            "synth_design: Time (s): cpu = 00:00:42 ; elapsed = 00:00:45\n"
+            "    45 Infos, 12 Warnings, 0 Critical Warnings and 0 Errors encountered.\n"
+            "ERROR: 0 Errors\n"
+            "CRITICAL WARNING: none\n"
+        )
+        assert parse_vivado_output(output) == ([], [])
+        assert parse_vivado_output(output.encode()) == ([], [])
+
+    @pytest.mark.parametrize("to_output", [str.encode, str], ids=["bytes", "text"])
+    def test_parse_messages_stop_at_line_end(self, to_output: Callable[[str], str | bytes]) -> None:
+        """Test that messages start at a line start and end at the line break."""
+        output = (
+            "ERROR: [Synth 8-87] first\r\n"
+            "INFO: [Common 17-1] see ERROR: [Synth 8-1] in the report\n"
+            "ERROR: [Synth 8-2]\n"
+            "next line\r"
+            "CRITICAL WARNING: [Place 30-1] last"
+        )
+        errors, warnings = parse_vivado_output(to_output(output))
+        assert [(e.id, e.message) for e in errors] == [("Synth 8-87", "first"), ("Synth 8-2", "")]
+        assert [(w.id, w.message) for w in warnings] == [("Place 30-1", "last")]
+
+    def test_parse_bytes_invalid_utf8_replaced(self) -> None:
+        """Test that undecodable bytes in a message don't abort parsing."""
+        errors, _ = parse_vivado_output(b"ERROR: [Synth 8-87] bad \xff byte\n")
+        assert len(errors) == 1
+        assert errors[0].message == "bad \ufffd byte"
+
+    async def test_small_build_output_parsed_inline(self) -> None:
+        """Test that short outputs are parsed without a worker thread."""
+        with patch.object(asyncio, "to_thread") as mock_to_thread:
+            errors, _ = await _parse_build_output("ERROR: [Synth 8-87] Signal not found\n")
+        mock_to_thread.assert_not_called()
+        assert errors[0].id == "Synth 8-87"
+
+    async def test_build_output_streams_parsed_in_order(self) -> None:
+        """Test that stdout and stderr messages are reported stdout first."""
+        errors, warnings = await _parse_build_output(
+            b"ERROR: [Synth 8-87] From stdout\n",
+            b"ERROR: [Common 17-69] From stderr\nCRITICAL WARNING: [Vivado 12-1] Late\n",
+        )
+        assert [e.id for e in errors] == ["Synth 8-87", "Common 17-69"]
+        assert [w.id for w in warnings] == ["Vivado 12-1"]
+
+    async def test_large_build_output_parsed_off_loop(self) -> None:
+        """Test that large outputs are parsed on a worker thread."""
+        output = "INFO: [Synth 8-6155] done\n" * 50_000 + "ERROR: [Synth 8-87] Signal not found\n"
+        with patch.object(asyncio, "to_thread", wraps=asyncio.to_thread) as mock_to_thread:
+            errors, _ = await _parse_build_output(output)
+        mock_to_thread.assert_called_once()
+        assert len(errors) == 1
+        assert errors[0].id == "Synth 8-87"
+
 
 class TestValidateProjectPath:
     """Tests for project path validation."""
@@ -208,6 +552,20 @@ class TestGenerateBuildTcl:
         assert "write_bitstream" in tcl
         assert "batch" not in tcl  # batch is in command line, not TCL
 
+    def test_xpr_project_polls_runs_for_early_errors(self, tmp_path: Path) -> None:
+        project = tmp_path / "test.xpr"
+        tcl = _generate_build_tcl(project)
+
+        # Each launched run is polled so an early failure exits immediately
+        assert "set run_status [get_property STATUS [get_runs synth_1]]" in tcl
+        assert "set run_status [get_property STATUS [get_runs impl_1]]" in tcl
+        assert 'string match "*ERROR*" $run_status' in tcl
+        # Waiting is bounded per iteration and stops once the run is idle
+        assert "wait_on_run -timeout 1 synth_1" in tcl
+        assert "wait_on_run -timeout 1 impl_1" in tcl
+        assert "break" in tcl
+        assert "after 2000" not in tcl
+
     def test_tcl_project(self, tmp_path: Path) -> None:
         project = tmp_path / "build.tcl"
         tcl = _generate_build_tcl(project)
@@ -224,146 +582,79 @@ class TestGenerateBuildTcl:
 class TestRunVivadoBuild:
     """Tests for the main build function."""
 
-    @pytest.mark.asyncio
-    async def test_project_not_found(self, tmp_path: Path) -> None:
+    async def test_project_not_found(self, session_tmp: Path) -> None:
         """Test handling of non-existent project file."""
-        result = await run_vivado_build(tmp_path / "nonexistent.xpr")
+        result = await run_vivado_build(session_tmp / "nonexistent.xpr")
         assert result.success is False
         assert len(result.errors) == 1
         assert "not found" in result.errors[0].message
 
-    @pytest.mark.asyncio
-    async def test_invalid_project_type(self, tmp_path: Path) -> None:
+    async def test_invalid_project_type(self, session_tmp: Path) -> None:
         """Test handling of invalid file type."""
-        invalid_file = tmp_path / "design.v"
-        invalid_file.touch()
+        invalid_file = session_tmp / "design.v"
         result = await run_vivado_build(invalid_file)
         assert result.success is False
         assert len(result.errors) == 1
         assert "Invalid project file type" in result.errors[0].message
 
-    @pytest.mark.asyncio
-    async def test_no_vivado_installation(self, tmp_path: Path) -> None:
+    async def test_no_vivado_installation(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """Test handling when no Vivado is found."""
         project = tmp_path / "test.xpr"
         project.touch()
 
-        with patch(
-            "vivado_mcp.vivado.build.get_default_vivado",
-            return_value=None,
-        ):
-            result = await run_vivado_build(project)
-            assert result.success is False
-            assert len(result.errors) == 1
-            assert "No Vivado installation found" in result.errors[0].message
-
-    @pytest.mark.asyncio
-    async def test_successful_build(self, tmp_path: Path) -> None:
+        monkeypatch.setattr(build, "get_default_vivado", lambda: None)
+        result = await run_vivado_build(project)
+        assert result.success is False
+        assert len(result.errors) == 1
+        assert "No Vivado installation found" in result.errors[0].message
+
+    async def test_successful_build(self, tmp_path: Path, vivado_mocks: VivadoMocks) -> None:
         """Test successful build execution."""
         project = tmp_path / "test.xpr"
         project.touch()
 
-        mock_install = VivadoInstallation(
-            version="2023.2",
-            path=tmp_path / "Vivado" / "2023.2",
-            executable=tmp_path / "Vivado" / "2023.2" / "bin" / "vivado",
-        )
+        vivado_mocks.process.stdout = b"Build completed successfully\n"
 
-        # Mock the subprocess
-        mock_process = MagicMock()
-        mock_process.returncode = 0
-        mock_process.communicate = AsyncMock(
-            return_value=(b"Build completed successfully\n", b"")
-        )
+        result = await run_vivado_build(project)
+        assert result.success is True
+        assert result.vivado_version == "2023.2"
+        assert len(result.errors) == 0
 
-        with (
-            patch(
-                "vivado_mcp.vivado.build.get_default_vivado",
-                return_value=mock_install,
-            ),
-            patch(
-                "asyncio.create_subprocess_exec",
-                return_value=mock_process,
-            ),
-        ):
-            result = await run_vivado_build(project)
-            assert result.success is True
-            assert result.vivado_version == "2023.2"
-            assert len(result.errors) == 0
-
-    @pytest.mark.asyncio
-    async def test_build_with_errors(self, tmp_path: Path) -> None:
+    async def test_build_with_errors(self, tmp_path: Path, vivado_mocks: VivadoMocks) -> None:
         """Test build that produces errors."""
         project = tmp_path / "test.xpr"
         project.touch()
 
-        mock_install = VivadoInstallation(
-            version="2023.2",
-            path=tmp_path / "Vivado" / "2023.2",
-            executable=tmp_path / "Vivado" / "2023.2" / "bin" / "vivado",
-        )
-
         error_output = b"ERROR: [Synth 8-87] Signal 'clk' not found\n"
-        mock_process = MagicMock()
-        mock_process.returncode = 1
-        mock_process.communicate = AsyncMock(return_value=(error_output, b""))
-
-        with (
-            patch(
-                "vivado_mcp.vivado.build.get_default_vivado",
-                return_value=mock_install,
-            ),
-            patch(
-                "asyncio.create_subprocess_exec",
-                return_value=mock_process,
-            ),
-        ):
-            result = await run_vivado_build(project)
-            assert result.success is False
-            assert result.exit_code == 1
-            assert len(result.errors) == 1
-            assert result.errors[0].id == "Synth 8-87"
-
-    @pytest.mark.asyncio
-    async def test_build_timeout(self, tmp_path: Path) -> None:
+        vivado_mocks.process.returncode = 1
+        vivado_mocks.process.stdout = error_output
+
+        result = await run_vivado_build(project)
+        assert result.success is False
+        assert result.exit_code == 1
+        assert len(result.errors) == 1
+        assert result.errors[0].id == "Synth 8-87"
+
+    async def test_build_timeout(self, tmp_path: Path, vivado_mocks: VivadoMocks) -> None:
         """Test build timeout handling."""
         project = tmp_path / "test.xpr"
         project.touch()
 
-        mock_install = VivadoInstallation(
-            version="2023.2",
-            path=tmp_path / "Vivado" / "2023.2",
-            executable=tmp_path / "Vivado" / "2023.2" / "bin" / "vivado",
-        )
+        # Stall until wait_for cancels it, with a timeout short enough not to slow the suite
+        vivado_mocks.process.stall = True
 
-        mock_process = MagicMock()
-        mock_process.kill = MagicMock()
-        mock_process.wait = AsyncMock()
-
-        async def slow_communicate() -> tuple[bytes, bytes]:
-            await asyncio.sleep(10)
-            return (b"", b"")
-
-        mock_process.communicate = slow_communicate
+        result = await run_vivado_build(project, timeout=0.01)
+        assert result.success is False
+        assert len(result.errors) == 1
+        assert "timed out" in result.errors[0].message
+        assert vivado_mocks.process.cancelled is True
+        assert vivado_mocks.process.kill_count == 1
 
-        with (
-            patch(
-                "vivado_mcp.vivado.build.get_default_vivado",
-                return_value=mock_install,
-            ),
-            patch(
-                "asyncio.create_subprocess_exec",
-                return_value=mock_process,
-            ),
-        ):
-            result = await run_vivado_build(project, timeout=1)
-            assert result.success is False
-            assert len(result.errors) == 1
-            assert "timed out" in result.errors[0].message
-            mock_process.kill.assert_called_once()
-
-    @pytest.mark.asyncio
-    async def test_custom_vivado_installation(self, tmp_path: Path) -> None:
+    async def test_custom_vivado_installation(
+        self, tmp_path: Path, vivado_mocks: VivadoMocks
+    ) -> None:
         """Test using a custom Vivado installation."""
         project = tmp_path / "test.xpr"
         project.touch()
@@ -374,59 +665,30 @@ class TestRunVivadoBuild:
             executable=tmp_path / "Custom" / "Vivado" / "2024.1" / "bin" / "vivado",
         )
 
-        mock_process = MagicMock()
-        mock_process.returncode = 0
-        mock_process.communicate = AsyncMock(return_value=(b"Success\n", b""))
-
-        with patch(
-            "asyncio.create_subprocess_exec",
-            return_value=mock_process,
-        ) as mock_exec:
-            result = await run_vivado_build(project, vivado_install=custom_install)
-            assert result.success is True
-            assert result.vivado_version == "2024.1"
+        result = await run_vivado_build(project, vivado_install=custom_install)
+        assert result.success is True
+        assert result.vivado_version == "2024.1"
 
-            # Verify the custom executable was used
-            call_args = mock_exec.call_args[0]
-            assert "2024.1" in str(call_args[0])
+        # Verify the custom executable was used
+        call_args = vivado_mocks.exec.argv
+        assert "2024.1" in str(call_args[0])
 
-    @pytest.mark.asyncio
-    async def test_batch_mode_flags(self, tmp_path: Path) -> None:
+    async def test_batch_mode_flags(self, tmp_path: Path, vivado_mocks: VivadoMocks) -> None:
         """Test that Vivado is called with correct batch mode flags."""
         project = tmp_path / "test.xpr"
         project.touch()
 
-        mock_install = VivadoInstallation(
-            version="2023.2",
-            path=tmp_path / "Vivado" / "2023.2",
-            executable=tmp_path / "Vivado" / "2023.2" / "bin" / "vivado",
-        )
-
-        mock_process = MagicMock()
-        mock_process.returncode = 0
-        mock_process.communicate = AsyncMock(return_value=(b"Success\n", b""))
+        await run_vivado_build(project)
 
-        with (
-            patch(
-                "vivado_mcp.vivado.build.get_default_vivado",
-                return_value=mock_install,
-            ),
-            patch(
-                "asyncio.create_subprocess_exec",
-                return_value=mock_process,
-            ) as mock_exec,
-        ):
-            await run_vivado_build(project)
+        # Check batch mode flags
+        call_args = vivado_mocks.exec.argv
+        assert "-mode" in call_args
+        mode_idx = call_args.index("-mode")
+        assert call_args[mode_idx + 1] == "batch"
 
-            # Check batch mode flags
-            call_args = mock_exec.call_args[0]
-            assert "-mode" in call_args
-            mode_idx = call_args.index("-mode")
-            assert call_args[mode_idx + 1] == "batch"
-
-            # Check no GUI flags
-            assert "-nojournal" in call_args
-            assert "-nolog" in call_args
+        # Check no GUI flags
+        assert "-nojournal" in call_args
+        assert "-nolog" in call_args
 
 
 class TestRunStatus:
@@ -544,32 +806,25 @@ class TestParseRunStatus:
 
     def test_in_progress_with_begin_marker(self, tmp_path: Path) -> None:
         run_dir = tmp_path / "synth_1"
-        run_dir.mkdir()
-        (run_dir / ".vivado.begin.rst").touch()
+        _make_files(run_dir, ".vivado.begin.rst")
         result = _parse_run_status(run_dir, "synth_1")
         assert result.state == BuildState.IN_PROGRESS
 
     def test_completed_with_end_marker(self, tmp_path: Path) -> None:
         run_dir = tmp_path / "synth_1"
-        run_dir.mkdir()
-        (run_dir / ".vivado.begin.rst").touch()
-        (run_dir / ".vivado.end.rst").touch()
+        _make_files(run_dir, ".vivado.begin.rst", ".vivado.end.rst")
         result = _parse_run_status(run_dir, "synth_1")
         assert result.state == BuildState.COMPLETED
 
     def test_failed_with_error_marker(self, tmp_path: Path) -> None:
         run_dir = tmp_path / "synth_1"
-        run_dir.mkdir()
-        (run_dir / ".vivado.begin.rst").touch()
-        (run_dir / ".vivado.error.rst").touch()
+        _make_files(run_dir, ".vivado.begin.rst", ".vivado.error.rst")
         result = _parse_run_status(run_dir, "synth_1")
         assert result.state == BuildState.FAILED
 
     def test_completed_with_log_success(self, tmp_path: Path) -> None:
         run_dir = tmp_path / "synth_1"
-        run_dir.mkdir()
-        (run_dir / ".vivado.begin.rst").touch()
-        (run_dir / ".vivado.end.rst").touch()
+        _make_files(run_dir, ".vivado.begin.rst", ".vivado.end.rst")
         log_file = run_dir / "runme.log"
         log_file.write_text("Some output\nsynth_design Complete!\nMore output")
         result = _parse_run_status(run_dir, "synth_1")
@@ -585,25 +840,78 @@ class TestParseRunStatus:
         assert result.state == BuildState.FAILED
         assert result.status_message == "Build failed with errors"
 
+    def test_error_without_message_id_not_failed(self, tmp_path: Path) -> None:
+        run_dir = tmp_path / "synth_1"
+        _make_files(run_dir, ".vivado.begin.rst")
+        (run_dir / "runme.log").write_text("INFO: report contains no ERROR: lines\n")
+        result = _parse_run_status(run_dir, "synth_1")
+        assert result.state == BuildState.IN_PROGRESS
+
     def test_progress_parsing(self, tmp_path: Path) -> None:
         run_dir = tmp_path / "impl_1"
-        run_dir.mkdir()
-        (run_dir / ".vivado.begin.rst").touch()
+        _make_files(run_dir, ".vivado.begin.rst")
         log_file = run_dir / "runme.log"
         log_file.write_text("Progress: 25%\nProgress: 50%\nProgress: 75%\n")
         result = _parse_run_status(run_dir, "impl_1")
         assert result.state == BuildState.IN_PROGRESS
         assert result.progress == "75%"
 
+    def test_progress_skips_malformed_last_line(self, tmp_path: Path) -> None:
+        run_dir = tmp_path / "impl_1"
+        _make_files(run_dir, ".vivado.begin.rst")
+        (run_dir / "runme.log").write_text("Progress: 40%\nProgress: pending\n")
+        result = _parse_run_status(run_dir, "impl_1")
+        assert result.progress == "40%"
+
     def test_impl_completed_with_bitstream(self, tmp_path: Path) -> None:
         run_dir = tmp_path / "impl_1"
-        run_dir.mkdir()
-        (run_dir / ".vivado.begin.rst").touch()
-        (run_dir / ".vivado.end.rst").touch()
-        (run_dir / "design.bit").touch()  # Bitstream file
+        _make_files(run_dir, ".vivado.begin.rst", ".vivado.end.rst", "design.bit")
+        result = _parse_run_status(run_dir, "impl_1")
+        assert result.state == BuildState.COMPLETED
+        assert result.status_message == "Bitstream generated"
+
+    def test_large_log_reads_only_tail(self, tmp_path: Path) -> None:
+        run_dir = tmp_path / "impl_1"
+        _make_files(run_dir, ".vivado.begin.rst")
+        filler = "INFO: [Place 30-611] Multithreading enabled\n" * 10000
+        (run_dir / "runme.log").write_text(
+            "Progress: 10%\n" + filler + "Progress: 90%\nroute_design Complete!\n"
+        )
+        tail = _read_log_tail(run_dir / "runme.log", max_bytes=100)
+        assert len(tail) == 100
+        assert tail.endswith(b"Progress: 90%\nroute_design Complete!\n")
+
+        result = _parse_run_status(run_dir, "impl_1")
+        assert result.state == BuildState.IN_PROGRESS
+        assert result.progress == "90%"
+        assert result.status_message == "route_design Complete!"
+
+    def test_hidden_bitstream_ignored(self, tmp_path: Path) -> None:
+        run_dir = tmp_path / "impl_1"
+        _make_files(run_dir, ".vivado.end.rst", ".design.bit")
         result = _parse_run_status(run_dir, "impl_1")
         assert result.state == BuildState.COMPLETED
+        assert result.status_message is None
+
+    def test_lists_run_directory_once(self, tmp_path: Path) -> None:
+        run_dir = tmp_path / "impl_1"
+        _make_files(run_dir, ".vivado.begin.rst", ".vivado.end.rst")
+        (run_dir / "runme.log").write_text("Progress: 100%\n")
+        (run_dir / "design.bit").touch()
+        with patch.object(build.os, "scandir", wraps=os.scandir) as mock_scandir:
+            result = _parse_run_status(run_dir, "impl_1")
         assert result.status_message == "Bitstream generated"
+        assert result.timestamp is not None
+        assert mock_scandir.call_count == 1
+
+    def test_log_read_through_directory_entry(self, tmp_path: Path) -> None:
+        run_dir = tmp_path / "synth_1"
+        run_dir.mkdir()
+        (run_dir / "runme.log").write_text("Progress: 40%\n")
+        with patch.object(build, "_read_log_tail", wraps=_read_log_tail) as mock_read_tail:
+            result = _parse_run_status(run_dir, "synth_1")
+        assert result.progress == "40%"
+        mock_read_tail.assert_called_once_with(os.path.join(run_dir, "runme.log"))
 
     def test_incomplete_run_with_log_only(self, tmp_path: Path) -> None:
         run_dir = tmp_path / "synth_1"
@@ -633,6 +941,31 @@ class TestGetBuildStatus:
         assert result.overall_state == BuildState.NOT_STARTED
         assert result.runs_directory_exists is False
 
+    def test_runs_directory_lookup_cached(self, tmp_path: Path) -> None:
+        project = tmp_path / "test.xpr"
+        project.touch()
+        (tmp_path / "test.runs").mkdir()
+        _resolve_runs_dir.cache_clear()
+
+        get_build_status(project)
+        get_build_status(project)
+
+        info = _resolve_runs_dir.cache_info()
+        assert info.misses == 1
+        assert info.hits == 1
+
+    def test_runs_directory_cache_sees_new_directory(self, tmp_path: Path) -> None:
+        project = tmp_path / "test.xpr"
+        project.touch()
+        assert get_build_status(project).runs_directory_exists is False
+
+        (tmp_path / "test.runs").mkdir()
+        # Make sure the directory's mtime moves even on coarse filesystems
+        stat = os.stat(tmp_path)
+        os.utime(tmp_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        assert get_build_status(project).runs_directory_exists is True
+
     def test_runs_directory_exists_no_runs(self, tmp_path: Path) -> None:
         project = tmp_path / "test.xpr"
         project.touch()
@@ -647,10 +980,8 @@ class TestGetBuildStatus:
         project = tmp_path / "test.xpr"
         project.touch()
         runs_dir = tmp_path / "test.runs"
-        runs_dir.mkdir()
         synth_dir = runs_dir / "synth_1"
-        synth_dir.mkdir()
-        (synth_dir / ".vivado.begin.rst").touch()
+        _make_files(synth_dir, ".vivado.begin.rst")
 
         result = get_build_status(project)
         assert result.overall_state == BuildState.IN_PROGRESS
@@ -661,11 +992,8 @@ class TestGetBuildStatus:
         project = tmp_path / "test.xpr"
         project.touch()
         runs_dir = tmp_path / "test.runs"
-        runs_dir.mkdir()
         synth_dir = runs_dir / "synth_1"
-        synth_dir.mkdir()
-        (synth_dir / ".vivado.begin.rst").touch()
-        (synth_dir / ".vivado.end.rst").touch()
+        _make_files(synth_dir, ".vivado.begin.rst", ".vivado.end.rst")
 
         result = get_build_status(project)
         assert result.overall_state == BuildState.COMPLETED
@@ -678,21 +1006,15 @@ class TestGetBuildStatus:
         project = tmp_path / "test.xpr"
         project.touch()
         runs_dir = tmp_path / "test.runs"
-        runs_dir.mkdir()
 
         # Synthesis complete
         synth_dir = runs_dir / "synth_1"
-        synth_dir.mkdir()
-        (synth_dir / ".vivado.begin.rst").touch()
-        (synth_dir / ".vivado.end.rst").touch()
+        _make_files(synth_dir, ".vivado.begin.rst", ".vivado.end.rst")
         (synth_dir / "runme.log").write_text("synth_design Complete!")
 
         # Implementation complete
         impl_dir = runs_dir / "impl_1"
-        impl_dir.mkdir()
-        (impl_dir / ".vivado.begin.rst").touch()
-        (impl_dir / ".vivado.end.rst").touch()
-        (impl_dir / "design.bit").touch()
+        _make_files(impl_dir, ".vivado.begin.rst", ".vivado.end.rst", "design.bit")
 
         result = get_build_status(project)
         assert result.overall_state == BuildState.COMPLETED
@@ -705,12 +1027,9 @@ class TestGetBuildStatus:
         project = tmp_path / "test.xpr"
         project.touch()
         runs_dir = tmp_path / "test.runs"
-        runs_dir.mkdir()
 
         synth_dir = runs_dir / "synth_1"
-        synth_dir.mkdir()
-        (synth_dir / ".vivado.begin.rst").touch()
-        (synth_dir / ".vivado.error.rst").touch()
+        _make_files(synth_dir, ".vivado.begin.rst", ".vivado.error.rst")
 
         result = get_build_status(project)
         assert result.overall_state == BuildState.FAILED
@@ -721,13 +1040,10 @@ class TestGetBuildStatus:
         project = tmp_path / "test.xpr"
         project.touch()
         runs_dir = tmp_path / "test.runs"
-        runs_dir.mkdir()
 
         # Synthesis complete
         synth_dir = runs_dir / "synth_1"
-        synth_dir.mkdir()
-        (synth_dir / ".vivado.begin.rst").touch()
-        (synth_dir / ".vivado.end.rst").touch()
+        _make_files(synth_dir, ".vivado.begin.rst", ".vivado.end.rst")
 
         # Implementation failed
         impl_dir = runs_dir / "impl_1"
@@ -742,11 +1058,8 @@ class TestGetBuildStatus:
     def test_finds_runs_dir_by_glob(self, tmp_path: Path) -> None:
         # Test finding .runs directory when project name differs
         runs_dir = tmp_path / "different_name.runs"
-        runs_dir.mkdir()
         synth_dir = runs_dir / "synth_1"
-        synth_dir.mkdir()
-        (synth_dir / ".vivado.begin.rst").touch()
-        (synth_dir / ".vivado.end.rst").touch()
+        _make_files(synth_dir, ".vivado.begin.rst", ".vivado.end.rst")
 
         result = get_build_status(tmp_path)
         assert result.runs_directory_exists is True
@@ -757,11 +1070,8 @@ class TestGetBuildStatus:
         project = tmp_path / "test.xpr"
         project.touch()
         runs_dir = tmp_path / "test.runs"
-        runs_dir.mkdir()
         synth_dir = runs_dir / "synth_1"
-        synth_dir.mkdir()
-        (synth_dir / ".vivado.begin.rst").touch()
-        (synth_dir / ".vivado.end.rst").touch()
+        _make_files(synth_dir, ".vivado.begin.rst", ".vivado.end.rst")
         (synth_dir / "runme.log").write_text("Build log")
 
         result = get_build_status(project)
@@ -806,306 +1116,202 @@ class TestGenerateSynthesisTcl:
 class TestRunSynthesis:
     """Tests for the synthesis-only function."""
 
-    @pytest.mark.asyncio
-    async def test_project_not_found(self, tmp_path: Path) -> None:
+    async def test_project_not_found(self, session_tmp: Path) -> None:
         """Test handling of non-existent project file."""
-        result = await run_synthesis(tmp_path / "nonexistent.xpr")
+        result = await run_synthesis(session_tmp / "nonexistent.xpr")
         assert result.success is False
         assert len(result.errors) == 1
         assert "not found" in result.errors[0].message
 
-    @pytest.mark.asyncio
-    async def test_invalid_project_type(self, tmp_path: Path) -> None:
+    async def test_invalid_project_type(self, session_tmp: Path) -> None:
         """Test handling of invalid file type."""
-        invalid_file = tmp_path / "design.v"
-        invalid_file.touch()
+        invalid_file = session_tmp / "design.v"
         result = await run_synthesis(invalid_file)
         assert result.success is False
         assert len(result.errors) == 1
         assert "Invalid project file type" in result.errors[0].message
 
-    @pytest.mark.asyncio
-    async def test_no_vivado_installation(self, tmp_path: Path) -> None:
+    async def test_no_vivado_installation(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """Test handling when no Vivado is found."""
         project = tmp_path / "test.xpr"
         project.touch()
 
-        with patch(
-            "vivado_mcp.vivado.build.get_default_vivado",
-            return_value=None,
-        ):
-            result = await run_synthesis(project)
-            assert result.success is False
-            assert len(result.errors) == 1
-            assert "No Vivado installation found" in result.errors[0].message
-
-    @pytest.mark.asyncio
-    async def test_successful_synthesis(self, tmp_path: Path) -> None:
+        monkeypatch.setattr(build, "get_default_vivado", lambda: None)
+        result = await run_synthesis(project)
+        assert result.success is False
+        assert len(result.errors) == 1
+        assert "No Vivado installation found" in result.errors[0].message
+
+    async def test_successful_synthesis(self, tmp_path: Path, vivado_mocks: VivadoMocks) -> None:
         """Test successful synthesis execution."""
         project = tmp_path / "test.xpr"
         project.touch()
 
-        mock_install = VivadoInstallation(
-            version="2023.2",
-            path=tmp_path / "Vivado" / "2023.2",
-            executable=tmp_path / "Vivado" / "2023.2" / "bin" / "vivado",
-        )
+        vivado_mocks.process.stdout = b"Synthesis completed successfully\n"
 
-        # Mock the subprocess
-        mock_process = MagicMock()
-        mock_process.returncode = 0
-        mock_process.communicate = AsyncMock(
-            return_value=(b"Synthesis completed successfully\n", b"")
-        )
+        result = await run_synthesis(project)
+        assert result.success is True
+        assert result.vivado_version == "2023.2"
+        assert len(result.errors) == 0
 
-        with (
-            patch(
-                "vivado_mcp.vivado.build.get_default_vivado",
-                return_value=mock_install,
-            ),
-            patch(
-                "asyncio.create_subprocess_exec",
-                return_value=mock_process,
-            ),
-        ):
-            result = await run_synthesis(project)
-            assert result.success is True
-            assert result.vivado_version == "2023.2"
-            assert len(result.errors) == 0
-
-    @pytest.mark.asyncio
-    async def test_synthesis_with_errors(self, tmp_path: Path) -> None:
+    async def test_synthesis_with_errors(self, tmp_path: Path, vivado_mocks: VivadoMocks) -> None:
         """Test synthesis that produces errors."""
         project = tmp_path / "test.xpr"
         project.touch()
 
-        mock_install = VivadoInstallation(
-            version="2023.2",
-            path=tmp_path / "Vivado" / "2023.2",
-            executable=tmp_path / "Vivado" / "2023.2" / "bin" / "vivado",
-        )
-
         error_output = b"ERROR: [Synth 8-87] Signal 'clk' not found\n"
-        mock_process = MagicMock()
-        mock_process.returncode = 1
-        mock_process.communicate = AsyncMock(return_value=(error_output, b""))
-
-        with (
-            patch(
-                "vivado_mcp.vivado.build.get_default_vivado",
-                return_value=mock_install,
-            ),
-            patch(
-                "asyncio.create_subprocess_exec",
-                return_value=mock_process,
-            ),
-        ):
-            result = await run_synthesis(project)
-            assert result.success is False
-            assert result.exit_code == 1
-            assert len(result.errors) == 1
-            assert result.errors[0].id == "Synth 8-87"
-
-    @pytest.mark.asyncio
-    async def test_synthesis_timeout(self, tmp_path: Path) -> None:
-        """Test synthesis timeout handling."""
-        project = tmp_path / "test.xpr"
-        project.touch()
-
-        mock_install = VivadoInstallation(
-            version="2023.2",
-            path=tmp_path / "Vivado" / "2023.2",
-            executable=tmp_path / "Vivado" / "2023.2" / "bin" / "vivado",
-        )
-
-        mock_process = MagicMock()
-        mock_process.kill = MagicMock()
-        mock_process.wait = AsyncMock()
+        vivado_mocks.process.returncode = 1
+        vivado_mocks.process.stdout = error_output
 
-        async def slow_communicate() -> tuple[bytes, bytes]:
-            await asyncio.sleep(10)
-            return (b"", b"")
-
-        mock_process.communicate = slow_communicate
+        result = await run_synthesis(project)
+        assert result.success is False
+        assert result.exit_code == 1
+        assert len(result.errors) == 1
+        assert result.errors[0].id == "Synth 8-87"
 
-        with (
-            patch(
-                "vivado_mcp.vivado.build.get_default_vivado",
-                return_value=mock_install,
-            ),
-            patch(
-                "asyncio.create_subprocess_exec",
-                return_value=mock_process,
-            ),
-        ):
-            result = await run_synthesis(project, timeout=1)
-            assert result.success is False
-            assert len(result.errors) == 1
-            assert "timed out" in result.errors[0].message
-            mock_process.kill.assert_called_once()
-
-    @pytest.mark.asyncio
-    async def test_custom_vivado_installation(self, tmp_path: Path) -> None:
-        """Test using a custom Vivado installation."""
+    async def test_synthesis_timeout(self, tmp_path: Path, vivado_mocks: VivadoMocks) -> None:
+        """Test synthesis timeout handling."""
         project = tmp_path / "test.xpr"
         project.touch()
 
-        custom_install = VivadoInstallation(
-            version="2024.1",
-            path=tmp_path / "Custom" / "Vivado" / "2024.1",
-            executable=tmp_path / "Custom" / "Vivado" / "2024.1" / "bin" / "vivado",
-        )
+        # Stall until wait_for cancels it, with a timeout short enough not to slow the suite
+        vivado_mocks.process.stall = True
 
-        mock_process = MagicMock()
-        mock_process.returncode = 0
-        mock_process.communicate = AsyncMock(return_value=(b"Success\n", b""))
+        result = await run_synthesis(project, timeout=0.01)
+        assert result.success is False
+        assert len(result.errors) == 1
+        assert "timed out" in result.errors[0].message
+        assert vivado_mocks.process.cancelled is True
+        assert vivado_mocks.process.kill_count == 1
 
-        with patch(
-            "asyncio.create_subprocess_exec",
-            return_value=mock_process,
-        ) as mock_exec:
-            result = await run_synthesis(project, vivado_install=custom_install)
-            assert result.success is True
-            assert result.vivado_version == "2024.1"
+    def test_custom_vivado_installation(
+        self, synthesis_call: tuple[BuildResult, tuple[object, ...]]
+    ) -> None:
+        """Test using a custom Vivado installation."""
+        result, call_args = synthesis_call
+        assert result.success is True
+        assert result.vivado_version == "2024.1"
 
-            # Verify the custom executable was used
-            call_args = mock_exec.call_args[0]
-            assert "2024.1" in str(call_args[0])
+        # Verify the custom executable was used
+        assert "2024.1" in str(call_args[0])
 
-    @pytest.mark.asyncio
-    async def test_batch_mode_flags(self, tmp_path: Path) -> None:
+    def test_batch_mode_flags(
+        self, synthesis_call: tuple[BuildResult, tuple[object, ...]]
+    ) -> None:
         """Test that Vivado is called with correct batch mode flags."""
-        project = tmp_path / "test.xpr"
-        project.touch()
+        _, call_args = synthesis_call
 
-        mock_install = VivadoInstallation(
-            version="2023.2",
-            path=tmp_path / "Vivado" / "2023.2",
-            executable=tmp_path / "Vivado" / "2023.2" / "bin" / "vivado",
-        )
+        # Check batch mode flags
+        assert "-mode" in call_args
+        mode_idx = call_args.index("-mode")
+        assert call_args[mode_idx + 1] == "batch"
 
-        mock_process = MagicMock()
-        mock_process.returncode = 0
-        mock_process.communicate = AsyncMock(return_value=(b"Success\n", b""))
+        # Check no GUI flags
+        assert "-nojournal" in call_args
+        assert "-nolog" in call_args
 
-        with (
-            patch(
-                "vivado_mcp.vivado.build.get_default_vivado",
-                return_value=mock_install,
-            ),
-            patch(
-                "asyncio.create_subprocess_exec",
-                return_value=mock_process,
-            ) as mock_exec,
-        ):
-            await run_synthesis(project)
-
-            # Check batch mode flags
-            call_args = mock_exec.call_args[0]
-            assert "-mode" in call_args
-            mode_idx = call_args.index("-mode")
-            assert call_args[mode_idx + 1] == "batch"
-
-            # Check no GUI flags
-            assert "-nojournal" in call_args
-            assert "-nolog" in call_args
-
-    @pytest.mark.asyncio
-    async def test_synthesis_with_critical_warnings(self, tmp_path: Path) -> None:
+    async def test_synthesis_with_critical_warnings(
+        self, tmp_path: Path, vivado_mocks: VivadoMocks
+    ) -> None:
         """Test synthesis that produces critical warnings."""
         project = tmp_path / "test.xpr"
         project.touch()
 
-        mock_install = VivadoInstallation(
-            version="2023.2",
-            path=tmp_path / "Vivado" / "2023.2",
-            executable=tmp_path / "Vivado" / "2023.2" / "bin" / "vivado",
-        )
-
         warning_output = (
             b"CRITICAL WARNING: [Synth 8-5546] Missing constraint file\n"
             b"Synthesis completed successfully\n"
         )
-        mock_process = MagicMock()
-        mock_process.returncode = 0
-        mock_process.communicate = AsyncMock(return_value=(warning_output, b""))
-
-        with (
-            patch(
-                "vivado_mcp.vivado.build.get_default_vivado",
-                return_value=mock_install,
-            ),
-            patch(
-                "asyncio.create_subprocess_exec",
-                return_value=mock_process,
-            ),
-        ):
-            result = await run_synthesis(project)
-            assert result.success is True
-            assert len(result.errors) == 0
-            assert len(result.critical_warnings) == 1
-            assert result.critical_warnings[0].id == "Synth 8-5546"
+        vivado_mocks.process.stdout = warning_output
 
+        result = await run_synthesis(project)
+        assert result.success is True
+        assert len(result.errors) == 0
+        assert len(result.critical_warnings) == 1
+        assert result.critical_warnings[0].id == "Synth 8-5546"
 
-class TestGenerateImplementationTcl:
-    """Tests for TCL script generation for implementation-only."""
 
-    def test_xpr_project(self, tmp_path: Path) -> None:
-        project = tmp_path / "test.xpr"
-        tcl = _generate_implementation_tcl(project)
-
-        # Verify implementation-only commands are present
-        assert "open_project" in tcl
-        assert "impl_1" in tcl
-        assert "Implementation completed successfully" in tcl
-        assert "write_bitstream" in tcl
+# One scan per script collects every token a test looks for
+_IMPL_TOKENS = re.compile(
+    r"open_project|source|impl_1|synth_1|opt_design|place_design|route_design|write_bitstream"
+    r"|Implementation completed successfully|Synthesis not complete"
+    r"|reset_run synth_1|launch_runs synth_1|synth_design"
+)
 
-        # Verify synthesis check is present (to require completed synthesis)
-        assert "Synthesis not complete" in tcl
-        assert "synth_1" in tcl
 
-        # Verify synthesis execution commands are NOT present
-        assert "reset_run synth_1" not in tcl
-        assert "launch_runs synth_1" not in tcl
+class TestGenerateImplementationTcl:
+    """Tests for TCL script generation for implementation-only."""
 
-    def test_tcl_project(self, tmp_path: Path) -> None:
-        project = tmp_path / "build.tcl"
+    @pytest.mark.parametrize(
+        ("filename", "required", "forbidden"),
+        [
+            # Implementation-only commands and the check for completed
+            # synthesis, but no synthesis execution commands
+            (
+                "test.xpr",
+                {
+                    "open_project",
+                    "impl_1",
+                    "Implementation completed successfully",
+                    "write_bitstream",
+                    "Synthesis not complete",
+                    "synth_1",
+                },
+                {"reset_run synth_1", "launch_runs synth_1"},
+            ),
+            # TCL projects are sourced and never synthesized
+            (
+                "build.tcl",
+                {
+                    "source",
+                    "opt_design",
+                    "place_design",
+                    "route_design",
+                    "write_bitstream",
+                    "Implementation completed successfully",
+                },
+                {"synth_design"},
+            ),
+        ],
+    )
+    def test_generate(
+        self, tmp_path: Path, filename: str, required: set[str], forbidden: set[str]
+    ) -> None:
+        tcl = _generate_implementation_tcl(tmp_path / filename)
+        found = set(_IMPL_TOKENS.findall(tcl))
+        assert required <= found
+        assert found.isdisjoint(forbidden)
+
+    def test_cached_per_project_path(self, tmp_path: Path) -> None:
+        project = tmp_path / "test.xpr"
         tcl = _generate_implementation_tcl(project)
+        assert _generate_implementation_tcl(tmp_path / "test.xpr") is tcl
 
-        # For TCL projects, should source the file
-        assert "source" in tcl
-        assert "opt_design" in tcl
-        assert "place_design" in tcl
-        assert "route_design" in tcl
-        assert "write_bitstream" in tcl
-        assert "Implementation completed successfully" in tcl
-
-        # Verify synthesis commands are NOT present
-        assert "synth_design" not in tcl
+        # The script embeds the path, so another project gets its own script
+        other = _generate_implementation_tcl(tmp_path / "other" / "test.xpr")
+        assert other != tcl
+        assert "other" in other
 
 
 class TestRunImplementation:
     """Tests for the implementation-only function."""
 
-    @pytest.mark.asyncio
-    async def test_project_not_found(self, tmp_path: Path) -> None:
+    async def test_project_not_found(self, session_tmp: Path) -> None:
         """Test handling of non-existent project file."""
-        result = await run_implementation(tmp_path / "nonexistent.xpr")
+        result = await run_implementation(session_tmp / "nonexistent.xpr")
         assert result.success is False
         assert len(result.errors) == 1
         assert "not found" in result.errors[0].message
 
-    @pytest.mark.asyncio
-    async def test_invalid_project_type(self, tmp_path: Path) -> None:
+    async def test_invalid_project_type(self, session_tmp: Path) -> None:
         """Test handling of invalid file type."""
-        invalid_file = tmp_path / "design.v"
-        invalid_file.touch()
+        invalid_file = session_tmp / "design.v"
         result = await run_implementation(invalid_file)
         assert result.success is False
         assert len(result.errors) == 1
         assert "Invalid project file type" in result.errors[0].message
 
-    @pytest.mark.asyncio
     async def test_synthesis_not_complete(self, tmp_path: Path) -> None:
         """Test handling when synthesis is not complete."""
         project = tmp_path / "test.xpr"
@@ -1117,176 +1323,68 @@ class TestRunImplementation:
         assert len(result.errors) == 1
         assert "Synthesis not complete" in result.errors[0].message
 
-    @pytest.mark.asyncio
-    async def test_no_vivado_installation(self, tmp_path: Path) -> None:
+    async def test_no_vivado_installation(
+        self, synth_complete_project: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """Test handling when no Vivado is found."""
-        project = tmp_path / "test.xpr"
-        project.touch()
+        project = synth_complete_project
 
-        # Create completed synthesis run
-        runs_dir = tmp_path / "test.runs"
-        runs_dir.mkdir()
-        synth_dir = runs_dir / "synth_1"
-        synth_dir.mkdir()
-        (synth_dir / ".vivado.begin.rst").touch()
-        (synth_dir / ".vivado.end.rst").touch()
-        (synth_dir / "runme.log").write_text("synth_design Complete!")
+        monkeypatch.setattr(build, "get_default_vivado", lambda: None)
+        result = await run_implementation(project)
+        assert result.success is False
+        assert len(result.errors) == 1
+        assert "No Vivado installation found" in result.errors[0].message
 
-        with patch(
-            "vivado_mcp.vivado.build.get_default_vivado",
-            return_value=None,
-        ):
-            result = await run_implementation(project)
-            assert result.success is False
-            assert len(result.errors) == 1
-            assert "No Vivado installation found" in result.errors[0].message
-
-    @pytest.mark.asyncio
-    async def test_successful_implementation(self, tmp_path: Path) -> None:
+    async def test_successful_implementation(
+        self, synth_complete_project: Path, vivado_mocks: VivadoMocks
+    ) -> None:
         """Test successful implementation execution."""
-        project = tmp_path / "test.xpr"
-        project.touch()
+        project = synth_complete_project
 
-        # Create completed synthesis run
-        runs_dir = tmp_path / "test.runs"
-        runs_dir.mkdir()
-        synth_dir = runs_dir / "synth_1"
-        synth_dir.mkdir()
-        (synth_dir / ".vivado.begin.rst").touch()
-        (synth_dir / ".vivado.end.rst").touch()
-        (synth_dir / "runme.log").write_text("synth_design Complete!")
-
-        mock_install = VivadoInstallation(
-            version="2023.2",
-            path=tmp_path / "Vivado" / "2023.2",
-            executable=tmp_path / "Vivado" / "2023.2" / "bin" / "vivado",
-        )
+        vivado_mocks.process.stdout = b"Implementation completed successfully\n"
 
-        # Mock the subprocess
-        mock_process = MagicMock()
-        mock_process.returncode = 0
-        mock_process.communicate = AsyncMock(
-            return_value=(b"Implementation completed successfully\n", b"")
-        )
+        result = await run_implementation(project)
+        assert result.success is True
+        assert result.vivado_version == "2023.2"
+        assert len(result.errors) == 0
 
-        with (
-            patch(
-                "vivado_mcp.vivado.build.get_default_vivado",
-                return_value=mock_install,
-            ),
-            patch(
-                "asyncio.create_subprocess_exec",
-                return_value=mock_process,
-            ),
-        ):
-            result = await run_implementation(project)
-            assert result.success is True
-            assert result.vivado_version == "2023.2"
-            assert len(result.errors) == 0
-
-    @pytest.mark.asyncio
-    async def test_implementation_with_errors(self, tmp_path: Path) -> None:
+    async def test_implementation_with_errors(
+        self, synth_complete_project: Path, vivado_mocks: VivadoMocks
+    ) -> None:
         """Test implementation that produces errors."""
-        project = tmp_path / "test.xpr"
-        project.touch()
-
-        # Create completed synthesis run
-        runs_dir = tmp_path / "test.runs"
-        runs_dir.mkdir()
-        synth_dir = runs_dir / "synth_1"
-        synth_dir.mkdir()
-        (synth_dir / ".vivado.begin.rst").touch()
-        (synth_dir / ".vivado.end.rst").touch()
-        (synth_dir / "runme.log").write_text("synth_design Complete!")
-
-        mock_install = VivadoInstallation(
-            version="2023.2",
-            path=tmp_path / "Vivado" / "2023.2",
-            executable=tmp_path / "Vivado" / "2023.2" / "bin" / "vivado",
-        )
+        project = synth_complete_project
 
         error_output = b"ERROR: [Place 30-876] Placement failed for cell\n"
-        mock_process = MagicMock()
-        mock_process.returncode = 1
-        mock_process.communicate = AsyncMock(return_value=(error_output, b""))
-
-        with (
-            patch(
-                "vivado_mcp.vivado.build.get_default_vivado",
-                return_value=mock_install,
-            ),
-            patch(
-                "asyncio.create_subprocess_exec",
-                return_value=mock_process,
-            ),
-        ):
-            result = await run_implementation(project)
-            assert result.success is False
-            assert result.exit_code == 1
-            assert len(result.errors) == 1
-            assert result.errors[0].id == "Place 30-876"
-
-    @pytest.mark.asyncio
-    async def test_implementation_timeout(self, tmp_path: Path) -> None:
-        """Test implementation timeout handling."""
-        project = tmp_path / "test.xpr"
-        project.touch()
-
-        # Create completed synthesis run
-        runs_dir = tmp_path / "test.runs"
-        runs_dir.mkdir()
-        synth_dir = runs_dir / "synth_1"
-        synth_dir.mkdir()
-        (synth_dir / ".vivado.begin.rst").touch()
-        (synth_dir / ".vivado.end.rst").touch()
-        (synth_dir / "runme.log").write_text("synth_design Complete!")
+        vivado_mocks.process.returncode = 1
+        vivado_mocks.process.stdout = error_output
 
-        mock_install = VivadoInstallation(
-            version="2023.2",
-            path=tmp_path / "Vivado" / "2023.2",
-            executable=tmp_path / "Vivado" / "2023.2" / "bin" / "vivado",
-        )
+        result = await run_implementation(project)
+        assert result.success is False
+        assert result.exit_code == 1
+        assert len(result.errors) == 1
+        assert result.errors[0].id == "Place 30-876"
 
-        mock_process = MagicMock()
-        mock_process.kill = MagicMock()
-        mock_process.wait = AsyncMock()
+    async def test_implementation_timeout(
+        self, synth_complete_project: Path, vivado_mocks: VivadoMocks
+    ) -> None:
+        """Test implementation timeout handling."""
+        project = synth_complete_project
 
-        async def slow_communicate() -> tuple[bytes, bytes]:
-            await asyncio.sleep(10)
-            return (b"", b"")
+        # Stall until wait_for cancels it, with a timeout short enough not to slow the suite
+        vivado_mocks.process.stall = True
 
-        mock_process.communicate = slow_communicate
+        result = await run_implementation(project, timeout=0.01)
+        assert result.success is False
+        assert len(result.errors) == 1
+        assert "timed out" in result.errors[0].message
+        assert vivado_mocks.process.cancelled is True
+        assert vivado_mocks.process.kill_count == 1
 
-        with (
-            patch(
-                "vivado_mcp.vivado.build.get_default_vivado",
-                return_value=mock_install,
-            ),
-            patch(
-                "asyncio.create_subprocess_exec",
-                return_value=mock_process,
-            ),
-        ):
-            result = await run_implementation(project, timeout=1)
-            assert result.success is False
-            assert len(result.errors) == 1
-            assert "timed out" in result.errors[0].message
-            mock_process.kill.assert_called_once()
-
-    @pytest.mark.asyncio
-    async def test_custom_vivado_installation(self, tmp_path: Path) -> None:
+    async def test_custom_vivado_installation(
+        self, tmp_path: Path, synth_complete_project: Path, vivado_mocks: VivadoMocks
+    ) -> None:
         """Test using a custom Vivado installation."""
-        project = tmp_path / "test.xpr"
-        project.touch()
-
-        # Create completed synthesis run
-        runs_dir = tmp_path / "test.runs"
-        runs_dir.mkdir()
-        synth_dir = runs_dir / "synth_1"
-        synth_dir.mkdir()
-        (synth_dir / ".vivado.begin.rst").touch()
-        (synth_dir / ".vivado.end.rst").touch()
-        (synth_dir / "runme.log").write_text("synth_design Complete!")
+        project = synth_complete_project
 
         custom_install = VivadoInstallation(
             version="2024.1",
@@ -1294,146 +1392,63 @@ class TestRunImplementation:
             executable=tmp_path / "Custom" / "Vivado" / "2024.1" / "bin" / "vivado",
         )
 
-        mock_process = MagicMock()
-        mock_process.returncode = 0
-        mock_process.communicate = AsyncMock(return_value=(b"Success\n", b""))
-
-        with patch(
-            "asyncio.create_subprocess_exec",
-            return_value=mock_process,
-        ) as mock_exec:
-            result = await run_implementation(project, vivado_install=custom_install)
-            assert result.success is True
-            assert result.vivado_version == "2024.1"
+        result = await run_implementation(project, vivado_install=custom_install)
+        assert result.success is True
+        assert result.vivado_version == "2024.1"
 
-            # Verify the custom executable was used
-            call_args = mock_exec.call_args[0]
-            assert "2024.1" in str(call_args[0])
+        # Verify the custom executable was used
+        call_args = vivado_mocks.exec.argv
+        assert "2024.1" in str(call_args[0])
 
-    @pytest.mark.asyncio
-    async def test_batch_mode_flags(self, tmp_path: Path) -> None:
+    async def test_batch_mode_flags(
+        self, synth_complete_project: Path, vivado_mocks: VivadoMocks
+    ) -> None:
         """Test that Vivado is called with correct batch mode flags."""
-        project = tmp_path / "test.xpr"
-        project.touch()
+        project = synth_complete_project
 
-        # Create completed synthesis run
-        runs_dir = tmp_path / "test.runs"
-        runs_dir.mkdir()
-        synth_dir = runs_dir / "synth_1"
-        synth_dir.mkdir()
-        (synth_dir / ".vivado.begin.rst").touch()
-        (synth_dir / ".vivado.end.rst").touch()
-        (synth_dir / "runme.log").write_text("synth_design Complete!")
+        await run_implementation(project)
 
-        mock_install = VivadoInstallation(
-            version="2023.2",
-            path=tmp_path / "Vivado" / "2023.2",
-            executable=tmp_path / "Vivado" / "2023.2" / "bin" / "vivado",
-        )
+        # Check batch mode flags
+        call_args = vivado_mocks.exec.argv
+        assert "-mode" in call_args
+        mode_idx = call_args.index("-mode")
+        assert call_args[mode_idx + 1] == "batch"
 
-        mock_process = MagicMock()
-        mock_process.returncode = 0
-        mock_process.communicate = AsyncMock(return_value=(b"Success\n", b""))
+        # Check no GUI flags
+        assert "-nojournal" in call_args
+        assert "-nolog" in call_args
 
-        with (
-            patch(
-                "vivado_mcp.vivado.build.get_default_vivado",
-                return_value=mock_install,
-            ),
-            patch(
-                "asyncio.create_subprocess_exec",
-                return_value=mock_process,
-            ) as mock_exec,
-        ):
-            await run_implementation(project)
-
-            # Check batch mode flags
-            call_args = mock_exec.call_args[0]
-            assert "-mode" in call_args
-            mode_idx = call_args.index("-mode")
-            assert call_args[mode_idx + 1] == "batch"
-
-            # Check no GUI flags
-            assert "-nojournal" in call_args
-            assert "-nolog" in call_args
-
-    @pytest.mark.asyncio
-    async def test_implementation_with_critical_warnings(self, tmp_path: Path) -> None:
+    async def test_implementation_with_critical_warnings(
+        self, synth_complete_project: Path, vivado_mocks: VivadoMocks
+    ) -> None:
         """Test implementation that produces critical warnings."""
-        project = tmp_path / "test.xpr"
-        project.touch()
-
-        # Create completed synthesis run
-        runs_dir = tmp_path / "test.runs"
-        runs_dir.mkdir()
-        synth_dir = runs_dir / "synth_1"
-        synth_dir.mkdir()
-        (synth_dir / ".vivado.begin.rst").touch()
-        (synth_dir / ".vivado.end.rst").touch()
-        (synth_dir / "runme.log").write_text("synth_design Complete!")
-
-        mock_install = VivadoInstallation(
-            version="2023.2",
-            path=tmp_path / "Vivado" / "2023.2",
-            executable=tmp_path / "Vivado" / "2023.2" / "bin" / "vivado",
-        )
+        project = synth_complete_project
 
         warning_output = (
             b"CRITICAL WARNING: [Route 35-39] Timing constraints not met\n"
             b"Implementation completed successfully\n"
         )
-        mock_process = MagicMock()
-        mock_process.returncode = 0
-        mock_process.communicate = AsyncMock(return_value=(warning_output, b""))
-
-        with (
-            patch(
-                "vivado_mcp.vivado.build.get_default_vivado",
-                return_value=mock_install,
-            ),
-            patch(
-                "asyncio.create_subprocess_exec",
-                return_value=mock_process,
-            ),
-        ):
-            result = await run_implementation(project)
-            assert result.success is True
-            assert len(result.errors) == 0
-            assert len(result.critical_warnings) == 1
-            assert result.critical_warnings[0].id == "Route 35-39"
-
-    @pytest.mark.asyncio
-    async def test_tcl_project_skips_synthesis_check(self, tmp_path: Path) -> None:
+        vivado_mocks.process.stdout = warning_output
+
+        result = await run_implementation(project)
+        assert result.success is True
+        assert len(result.errors) == 0
+        assert len(result.critical_warnings) == 1
+        assert result.critical_warnings[0].id == "Route 35-39"
+
+    async def test_tcl_project_skips_synthesis_check(
+        self, tmp_path: Path, vivado_mocks: VivadoMocks
+    ) -> None:
         """Test that TCL projects skip the synthesis completion check."""
         project = tmp_path / "build.tcl"
         project.touch()
 
         # No runs directory - for TCL projects, this is OK
-        mock_install = VivadoInstallation(
-            version="2023.2",
-            path=tmp_path / "Vivado" / "2023.2",
-            executable=tmp_path / "Vivado" / "2023.2" / "bin" / "vivado",
-        )
+        vivado_mocks.process.stdout = b"Implementation completed successfully\n"
 
-        mock_process = MagicMock()
-        mock_process.returncode = 0
-        mock_process.communicate = AsyncMock(
-            return_value=(b"Implementation completed successfully\n", b"")
-        )
-
-        with (
-            patch(
-                "vivado_mcp.vivado.build.get_default_vivado",
-                return_value=mock_install,
-            ),
-            patch(
-                "asyncio.create_subprocess_exec",
-                return_value=mock_process,
-            ),
-        ):
-            result = await run_implementation(project)
-            # TCL projects don't require synthesis check
-            assert result.success is True
+        result = await run_implementation(project)
+        # TCL projects don't require synthesis check
+        assert result.success is True
 
 
 class TestBitstreamResult:
@@ -1496,6 +1511,16 @@ class TestParseBitstreamPath:
         result = _parse_bitstream_path(output)
         assert result == "/path/with spaces/design.bit"
 
+    def test_parse_bitstream_path_from_bytes(self) -> None:
+        output = b"Some output\r\nBITSTREAM_FILE: /path/to/design.bit\r\nMore output"
+        assert _parse_bitstream_path(output) == "/path/to/design.bit"
+        assert _parse_bitstream_path(b"no path here") is None
+
+    def test_parse_bitstream_path_requires_line_start(self) -> None:
+        output = "echo BITSTREAM_FILE: /wrong.bit\nBITSTREAM_FILE: /right.bit\n"
+        assert _parse_bitstream_path(output) == "/right.bit"
+        assert _parse_bitstream_path(output.encode()) == "/right.bit"
+
 
 class TestFindBitstreamFile:
     """Tests for _find_bitstream_file function."""
@@ -1503,12 +1528,9 @@ class TestFindBitstreamFile:
     def test_find_bitstream_file_found(self, tmp_path: Path) -> None:
         project = tmp_path / "test.xpr"
         project.touch()
-        runs_dir = tmp_path / "test.runs"
-        runs_dir.mkdir()
-        impl_dir = runs_dir / "impl_1"
-        impl_dir.mkdir()
+        impl_dir = tmp_path / "test.runs" / "impl_1"
+        _make_files(impl_dir, "design.bit")
         bitstream = impl_dir / "design.bit"
-        bitstream.touch()
 
         result = _find_bitstream_file(project)
         assert result == str(bitstream)
@@ -1523,92 +1545,91 @@ class TestFindBitstreamFile:
     def test_find_bitstream_file_impl_dir_exists_no_bit(self, tmp_path: Path) -> None:
         project = tmp_path / "test.xpr"
         project.touch()
-        runs_dir = tmp_path / "test.runs"
-        runs_dir.mkdir()
-        impl_dir = runs_dir / "impl_1"
-        impl_dir.mkdir()
+        _make_files(tmp_path / "test.runs" / "impl_1")
 
         result = _find_bitstream_file(project)
         assert result is None
 
 
-class TestGenerateBitstreamTcl:
-    """Tests for TCL script generation for bitstream-only."""
-
-    def test_xpr_project(self, tmp_path: Path) -> None:
-        project = tmp_path / "test.xpr"
-        tcl = _generate_bitstream_tcl(project)
-
-        # Verify bitstream-only commands are present
-        assert "open_project" in tcl
-        assert "impl_1" in tcl
-        assert "write_bitstream" in tcl
-        assert "Bitstream generation completed successfully" in tcl
-        assert "BITSTREAM_FILE:" in tcl
+_BITSTREAM_TOKENS = re.compile(
+    r"open_project|source|impl_1|write_bitstream|Bitstream generation completed successfully"
+    r"|BITSTREAM_FILE:|Implementation not complete|Synthesis not complete"
+    r"|reset_run impl_1|opt_design|place_design|route_design"
+)
 
-        # Verify implementation check is present (to require completed implementation)
-        assert "Implementation not complete" in tcl
+# Neither project type runs implementation again before writing the bitstream
+_BITSTREAM_FORBIDDEN = {"reset_run impl_1", "opt_design", "place_design", "route_design"}
 
-        # Verify synthesis check is present
-        assert "Synthesis not complete" in tcl
 
-        # Verify implementation execution commands are NOT present
-        assert "reset_run impl_1" not in tcl
-        assert "opt_design" not in tcl
-        assert "place_design" not in tcl
-        assert "route_design" not in tcl
-
-    def test_tcl_project(self, tmp_path: Path) -> None:
-        project = tmp_path / "build.tcl"
-        tcl = _generate_bitstream_tcl(project)
-
-        # For TCL projects, should source the file
-        assert "source" in tcl
-        assert "write_bitstream" in tcl
-        assert "Bitstream generation completed successfully" in tcl
-        assert "BITSTREAM_FILE:" in tcl
+class TestGenerateBitstreamTcl:
+    """Tests for TCL script generation for bitstream-only."""
 
-        # Verify implementation commands are NOT present
-        assert "opt_design" not in tcl
-        assert "place_design" not in tcl
-        assert "route_design" not in tcl
+    @pytest.mark.parametrize(
+        ("filename", "required"),
+        [
+            # Bitstream-only commands and the checks for completed synthesis
+            # and implementation
+            (
+                "test.xpr",
+                {
+                    "open_project",
+                    "impl_1",
+                    "write_bitstream",
+                    "Bitstream generation completed successfully",
+                    "BITSTREAM_FILE:",
+                    "Implementation not complete",
+                    "Synthesis not complete",
+                },
+            ),
+            # TCL projects are sourced
+            (
+                "build.tcl",
+                {
+                    "source",
+                    "write_bitstream",
+                    "Bitstream generation completed successfully",
+                    "BITSTREAM_FILE:",
+                },
+            ),
+        ],
+    )
+    def test_generate(self, tmp_path: Path, filename: str, required: set[str]) -> None:
+        tcl = _generate_bitstream_tcl(tmp_path / filename)
+        found = set(_BITSTREAM_TOKENS.findall(tcl))
+        assert required <= found
+        assert found.isdisjoint(_BITSTREAM_FORBIDDEN)
+
+
+# Vivado output for the bitstream runs; %(bitstream)b takes the encoded path
+# and is ignored by outputs without it
+_BITSTREAM_DONE = b"Bitstream generation completed successfully\n"
+_BITSTREAM_OK_OUTPUT = b"BITSTREAM_FILE: %(bitstream)b\n" + _BITSTREAM_DONE
+_BITSTREAM_WARNING_OUTPUT = (
+    b"CRITICAL WARNING: [DRC RPBF-3] Some DRC warning\n" + _BITSTREAM_OK_OUTPUT
+)
 
 
 class TestRunBitstreamGeneration:
     """Tests for the bitstream generation function."""
 
-    @pytest.mark.asyncio
-    async def test_project_not_found(self, tmp_path: Path) -> None:
+    async def test_project_not_found(self, session_tmp: Path) -> None:
         """Test handling of non-existent project file."""
-        result = await run_bitstream_generation(tmp_path / "nonexistent.xpr")
+        result = await run_bitstream_generation(session_tmp / "nonexistent.xpr")
         assert result.success is False
         assert len(result.errors) == 1
         assert "not found" in result.errors[0].message
 
-    @pytest.mark.asyncio
-    async def test_invalid_project_type(self, tmp_path: Path) -> None:
+    async def test_invalid_project_type(self, session_tmp: Path) -> None:
         """Test handling of invalid file type."""
-        invalid_file = tmp_path / "design.v"
-        invalid_file.touch()
+        invalid_file = session_tmp / "design.v"
         result = await run_bitstream_generation(invalid_file)
         assert result.success is False
         assert len(result.errors) == 1
         assert "Invalid project file type" in result.errors[0].message
 
-    @pytest.mark.asyncio
-    async def test_implementation_not_complete(self, tmp_path: Path) -> None:
+    async def test_implementation_not_complete(self, synth_complete_project: Path) -> None:
         """Test handling when implementation is not complete."""
-        project = tmp_path / "test.xpr"
-        project.touch()
-
-        # Create synthesis complete but implementation not complete
-        runs_dir = tmp_path / "test.runs"
-        runs_dir.mkdir()
-        synth_dir = runs_dir / "synth_1"
-        synth_dir.mkdir()
-        (synth_dir / ".vivado.begin.rst").touch()
-        (synth_dir / ".vivado.end.rst").touch()
-        (synth_dir / "runme.log").write_text("synth_design Complete!")
+        project = synth_complete_project
 
         # impl_1 not complete
         result = await run_bitstream_generation(project)
@@ -1616,319 +1637,86 @@ class TestRunBitstreamGeneration:
         assert len(result.errors) == 1
         assert "Implementation not complete" in result.errors[0].message
 
-    @pytest.mark.asyncio
-    async def test_no_vivado_installation(self, tmp_path: Path) -> None:
+    async def test_no_vivado_installation(
+        self, impl_complete_project: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """Test handling when no Vivado is found."""
-        project = tmp_path / "test.xpr"
-        project.touch()
-
-        # Create completed implementation run
-        runs_dir = tmp_path / "test.runs"
-        runs_dir.mkdir()
-        synth_dir = runs_dir / "synth_1"
-        synth_dir.mkdir()
-        (synth_dir / ".vivado.begin.rst").touch()
-        (synth_dir / ".vivado.end.rst").touch()
-        (synth_dir / "runme.log").write_text("synth_design Complete!")
-        impl_dir = runs_dir / "impl_1"
-        impl_dir.mkdir()
-        (impl_dir / ".vivado.begin.rst").touch()
-        (impl_dir / ".vivado.end.rst").touch()
-        (impl_dir / "design.bit").touch()
-
-        with patch(
-            "vivado_mcp.vivado.build.get_default_vivado",
-            return_value=None,
-        ):
-            result = await run_bitstream_generation(project)
-            assert result.success is False
-            assert len(result.errors) == 1
-            assert "No Vivado installation found" in result.errors[0].message
-
-    @pytest.mark.asyncio
-    async def test_successful_bitstream_generation(self, tmp_path: Path) -> None:
-        """Test successful bitstream generation."""
-        project = tmp_path / "test.xpr"
-        project.touch()
+        project = impl_complete_project
 
-        # Create completed implementation run
-        runs_dir = tmp_path / "test.runs"
-        runs_dir.mkdir()
-        synth_dir = runs_dir / "synth_1"
-        synth_dir.mkdir()
-        (synth_dir / ".vivado.begin.rst").touch()
-        (synth_dir / ".vivado.end.rst").touch()
-        (synth_dir / "runme.log").write_text("synth_design Complete!")
-        impl_dir = runs_dir / "impl_1"
-        impl_dir.mkdir()
-        (impl_dir / ".vivado.begin.rst").touch()
-        (impl_dir / ".vivado.end.rst").touch()
-        (impl_dir / "design.bit").touch()
-
-        mock_install = VivadoInstallation(
-            version="2023.2",
-            path=tmp_path / "Vivado" / "2023.2",
-            executable=tmp_path / "Vivado" / "2023.2" / "bin" / "vivado",
-        )
-
-        bitstream_path = str(impl_dir / "design.bit")
-        mock_process = MagicMock()
-        mock_process.returncode = 0
-        output = (
-            f"BITSTREAM_FILE: {bitstream_path}\n"
-            f"Bitstream generation completed successfully\n"
-        ).encode()
-        mock_process.communicate = AsyncMock(return_value=(output, b""))
-
-        with (
-            patch(
-                "vivado_mcp.vivado.build.get_default_vivado",
-                return_value=mock_install,
-            ),
-            patch(
-                "asyncio.create_subprocess_exec",
-                return_value=mock_process,
-            ),
-        ):
-            result = await run_bitstream_generation(project)
-            assert result.success is True
-            assert result.vivado_version == "2023.2"
+        monkeypatch.setattr(build, "get_default_vivado", lambda: None)
+        result = await run_bitstream_generation(project)
+        assert result.success is False
+        assert len(result.errors) == 1
+        assert "No Vivado installation found" in result.errors[0].message
+
+    @pytest.mark.parametrize(
+        ("output", "returncode", "error_ids", "warning_ids", "reports_bitstream"),
+        [
+            # The path printed by the TCL script is used as-is
+            (_BITSTREAM_OK_OUTPUT, 0, [], [], True),
+            # A failing run reports its errors and exit code
+            (b"ERROR: [Bitstream 12-34] DRC violation\n", 1, ["Bitstream 12-34"], [], False),
+            # Critical warnings don't fail the run
+            (_BITSTREAM_WARNING_OUTPUT, 0, [], ["DRC RPBF-3"], True),
+            # Without the BITSTREAM_FILE marker the run directory is searched
+            (_BITSTREAM_DONE, 0, [], [], True),
+        ],
+        ids=["success", "errors", "critical_warnings", "fallback_to_file_search"],
+    )
+    async def test_bitstream_generation(
+        self,
+        impl_complete_project: Path,
+        mock_subprocess_exec: ExecPatcher,
+        output: bytes,
+        returncode: int,
+        error_ids: list[str],
+        warning_ids: list[str],
+        reports_bitstream: bool,
+    ) -> None:
+        """Test how Vivado's output and exit code shape the bitstream result."""
+        project = impl_complete_project
+        bitstream_path = os.fspath(project.parent / "test.runs" / "impl_1" / "design.bit")
+        stdout = output % {b"bitstream": os.fsencode(bitstream_path)}
+
+        mock_subprocess_exec(FakeProcess(returncode=returncode, stdout=stdout))
+        result = await run_bitstream_generation(project)
+        assert result.success is (returncode == 0)
+        assert result.exit_code == returncode
+        assert result.vivado_version == "2023.2"
+        assert [msg.id for msg in result.errors] == error_ids
+        assert [msg.id for msg in result.critical_warnings] == warning_ids
+        if reports_bitstream:
             assert result.bitstream_path == bitstream_path
-            assert len(result.errors) == 0
-
-    @pytest.mark.asyncio
-    async def test_bitstream_generation_with_errors(self, tmp_path: Path) -> None:
-        """Test bitstream generation that produces errors."""
-        project = tmp_path / "test.xpr"
-        project.touch()
-
-        # Create completed implementation run
-        runs_dir = tmp_path / "test.runs"
-        runs_dir.mkdir()
-        synth_dir = runs_dir / "synth_1"
-        synth_dir.mkdir()
-        (synth_dir / ".vivado.begin.rst").touch()
-        (synth_dir / ".vivado.end.rst").touch()
-        (synth_dir / "runme.log").write_text("synth_design Complete!")
-        impl_dir = runs_dir / "impl_1"
-        impl_dir.mkdir()
-        (impl_dir / ".vivado.begin.rst").touch()
-        (impl_dir / ".vivado.end.rst").touch()
-        (impl_dir / "design.bit").touch()
-
-        mock_install = VivadoInstallation(
-            version="2023.2",
-            path=tmp_path / "Vivado" / "2023.2",
-            executable=tmp_path / "Vivado" / "2023.2" / "bin" / "vivado",
-        )
-
-        error_output = b"ERROR: [Bitstream 12-34] DRC violation\n"
-        mock_process = MagicMock()
-        mock_process.returncode = 1
-        mock_process.communicate = AsyncMock(return_value=(error_output, b""))
 
-        with (
-            patch(
-                "vivado_mcp.vivado.build.get_default_vivado",
-                return_value=mock_install,
-            ),
-            patch(
-                "asyncio.create_subprocess_exec",
-                return_value=mock_process,
-            ),
-        ):
-            result = await run_bitstream_generation(project)
-            assert result.success is False
-            assert result.exit_code == 1
-            assert len(result.errors) == 1
-            assert result.errors[0].id == "Bitstream 12-34"
-
-    @pytest.mark.asyncio
-    async def test_bitstream_generation_timeout(self, tmp_path: Path) -> None:
+    async def test_bitstream_generation_timeout(
+        self, impl_complete_project: Path, mock_subprocess_exec: ExecPatcher
+    ) -> None:
         """Test bitstream generation timeout handling."""
-        project = tmp_path / "test.xpr"
-        project.touch()
-
-        # Create completed implementation run
-        runs_dir = tmp_path / "test.runs"
-        runs_dir.mkdir()
-        synth_dir = runs_dir / "synth_1"
-        synth_dir.mkdir()
-        (synth_dir / ".vivado.begin.rst").touch()
-        (synth_dir / ".vivado.end.rst").touch()
-        (synth_dir / "runme.log").write_text("synth_design Complete!")
-        impl_dir = runs_dir / "impl_1"
-        impl_dir.mkdir()
-        (impl_dir / ".vivado.begin.rst").touch()
-        (impl_dir / ".vivado.end.rst").touch()
-        (impl_dir / "design.bit").touch()
-
-        mock_install = VivadoInstallation(
-            version="2023.2",
-            path=tmp_path / "Vivado" / "2023.2",
-            executable=tmp_path / "Vivado" / "2023.2" / "bin" / "vivado",
-        )
-
-        mock_process = MagicMock()
-        mock_process.kill = MagicMock()
-        mock_process.wait = AsyncMock()
-
-        async def slow_communicate() -> tuple[bytes, bytes]:
-            await asyncio.sleep(10)
-            return (b"", b"")
+        project = impl_complete_project
 
-        mock_process.communicate = slow_communicate
+        process = FakeProcess()
+        process.stall = True
 
-        with (
-            patch(
-                "vivado_mcp.vivado.build.get_default_vivado",
-                return_value=mock_install,
-            ),
-            patch(
-                "asyncio.create_subprocess_exec",
-                return_value=mock_process,
-            ),
-        ):
-            result = await run_bitstream_generation(project, timeout=1)
-            assert result.success is False
-            assert len(result.errors) == 1
-            assert "timed out" in result.errors[0].message
-            mock_process.kill.assert_called_once()
-
-    @pytest.mark.asyncio
-    async def test_bitstream_generation_with_critical_warnings(self, tmp_path: Path) -> None:
-        """Test bitstream generation that produces critical warnings."""
-        project = tmp_path / "test.xpr"
-        project.touch()
-
-        # Create completed implementation run
-        runs_dir = tmp_path / "test.runs"
-        runs_dir.mkdir()
-        synth_dir = runs_dir / "synth_1"
-        synth_dir.mkdir()
-        (synth_dir / ".vivado.begin.rst").touch()
-        (synth_dir / ".vivado.end.rst").touch()
-        (synth_dir / "runme.log").write_text("synth_design Complete!")
-        impl_dir = runs_dir / "impl_1"
-        impl_dir.mkdir()
-        (impl_dir / ".vivado.begin.rst").touch()
-        (impl_dir / ".vivado.end.rst").touch()
-        (impl_dir / "design.bit").touch()
-
-        mock_install = VivadoInstallation(
-            version="2023.2",
-            path=tmp_path / "Vivado" / "2023.2",
-            executable=tmp_path / "Vivado" / "2023.2" / "bin" / "vivado",
-        )
-
-        bitstream_path = str(impl_dir / "design.bit")
-        warning_output = (
-            f"CRITICAL WARNING: [DRC RPBF-3] Some DRC warning\n"
-            f"BITSTREAM_FILE: {bitstream_path}\n"
-            f"Bitstream generation completed successfully\n"
-        ).encode()
-        mock_process = MagicMock()
-        mock_process.returncode = 0
-        mock_process.communicate = AsyncMock(return_value=(warning_output, b""))
-
-        with (
-            patch(
-                "vivado_mcp.vivado.build.get_default_vivado",
-                return_value=mock_install,
-            ),
-            patch(
-                "asyncio.create_subprocess_exec",
-                return_value=mock_process,
-            ),
-        ):
-            result = await run_bitstream_generation(project)
-            assert result.success is True
-            assert result.bitstream_path == bitstream_path
-            assert len(result.errors) == 0
-            assert len(result.critical_warnings) == 1
-            assert result.critical_warnings[0].id == "DRC RPBF-3"
+        mock_subprocess_exec(process)
+        result = await run_bitstream_generation(project, timeout=0.01)
+        assert result.success is False
+        assert len(result.errors) == 1
+        assert "timed out" in result.errors[0].message
+        assert process.cancelled is True
+        assert process.kill_count == 1
 
-    @pytest.mark.asyncio
-    async def test_tcl_project_skips_implementation_check(self, tmp_path: Path) -> None:
+    async def test_tcl_project_skips_implementation_check(
+        self, tmp_path: Path, mock_subprocess_exec: ExecPatcher
+    ) -> None:
         """Test that TCL projects skip the implementation completion check."""
         project = tmp_path / "build.tcl"
         project.touch()
 
         # No runs directory - for TCL projects, this is OK
-        mock_install = VivadoInstallation(
-            version="2023.2",
-            path=tmp_path / "Vivado" / "2023.2",
-            executable=tmp_path / "Vivado" / "2023.2" / "bin" / "vivado",
-        )
-
-        mock_process = MagicMock()
-        mock_process.returncode = 0
-        output = (
-            b"BITSTREAM_FILE: /path/to/output.bit\n"
-            b"Bitstream generation completed successfully\n"
-        )
-        mock_process.communicate = AsyncMock(return_value=(output, b""))
-
-        with (
-            patch(
-                "vivado_mcp.vivado.build.get_default_vivado",
-                return_value=mock_install,
-            ),
-            patch(
-                "asyncio.create_subprocess_exec",
-                return_value=mock_process,
-            ),
-        ):
-            result = await run_bitstream_generation(project)
-            # TCL projects don't require implementation check
-            assert result.success is True
-            assert result.bitstream_path == "/path/to/output.bit"
-
-    @pytest.mark.asyncio
-    async def test_bitstream_path_fallback_to_file_search(self, tmp_path: Path) -> None:
-        """Test that bitstream path falls back to file search if not in output."""
-        project = tmp_path / "test.xpr"
-        project.touch()
+        output = _BITSTREAM_OK_OUTPUT % {b"bitstream": b"/path/to/output.bit"}
 
-        # Create completed implementation run with bitstream file
-        runs_dir = tmp_path / "test.runs"
-        runs_dir.mkdir()
-        synth_dir = runs_dir / "synth_1"
-        synth_dir.mkdir()
-        (synth_dir / ".vivado.begin.rst").touch()
-        (synth_dir / ".vivado.end.rst").touch()
-        (synth_dir / "runme.log").write_text("synth_design Complete!")
-        impl_dir = runs_dir / "impl_1"
-        impl_dir.mkdir()
-        (impl_dir / ".vivado.begin.rst").touch()
-        (impl_dir / ".vivado.end.rst").touch()
-        bitstream_file = impl_dir / "design.bit"
-        bitstream_file.touch()
-
-        mock_install = VivadoInstallation(
-            version="2023.2",
-            path=tmp_path / "Vivado" / "2023.2",
-            executable=tmp_path / "Vivado" / "2023.2" / "bin" / "vivado",
-        )
-
-        # Output without BITSTREAM_FILE marker
-        mock_process = MagicMock()
-        mock_process.returncode = 0
-        mock_process.communicate = AsyncMock(
-            return_value=(b"Bitstream generation completed successfully\n", b"")
-        )
-
-        with (
-            patch(
-                "vivado_mcp.vivado.build.get_default_vivado",
-                return_value=mock_install,
-            ),
-            patch(
-                "asyncio.create_subprocess_exec",
-                return_value=mock_process,
-            ),
-        ):
-            result = await run_bitstream_generation(project)
-            assert result.success is True
-            # Should find the bitstream file through fallback search
-            assert result.bitstream_path == str(bitstream_file)
+        mock_subprocess_exec(FakeProcess(stdout=output))
+        result = await run_bitstream_generation(project)
+        # TCL projects don't require implementation check
+        assert result.success is True
+        assert result.bitstream_path == "/path/to/output.bit"
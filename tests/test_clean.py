@@ -2,16 +2,35 @@
 
 from __future__ import annotations
 
+import os
+import subprocess
 from pathlib import Path
+from unittest.mock import patch
+
+import pytest
 
 from vivado_mcp.vivado.clean import (
+    _FAST_RMTREE_MIN_ENTRIES,
     VIVADO_OUTPUT_DIRS,
     CleanResult,
+    _fast_rmtree,
+    _is_small_tree,
+    _remove_one,
     _validate_project_path,
+    _walk_rmtree,
     clean_build_outputs,
+    clean_build_outputs_iter,
 )
 
 
+def create_large_tree(root: Path) -> None:
+    """Create a directory tree with enough entries to use the native remover."""
+    nested = root / "synth_1"
+    nested.mkdir(parents=True)
+    for i in range(_FAST_RMTREE_MIN_ENTRIES):
+        (nested / f"file_{i}.log").touch()
+
+
 class TestCleanResult:
     """Tests for CleanResult dataclass."""
 
@@ -87,6 +106,91 @@ class TestValidateProjectPath:
         assert "not found" in error
 
 
+class TestFastRmtree:
+    """Tests for the native-tool directory removal helper."""
+
+    def test_small_tree_removed_in_python(self, tmp_path: Path) -> None:
+        target = tmp_path / ".runs"
+        target.mkdir()
+        (target / "runme.log").touch()
+
+        with patch("vivado_mcp.vivado.clean.subprocess.run") as mock_run:
+            _fast_rmtree(target)
+
+        mock_run.assert_not_called()
+        assert not target.exists()
+
+    def test_large_tree_uses_native_tool(self, tmp_path: Path) -> None:
+        target = tmp_path / ".runs"
+        create_large_tree(target)
+
+        with patch(
+            "vivado_mcp.vivado.clean.subprocess.run",
+            wraps=subprocess.run,
+        ) as mock_run:
+            _fast_rmtree(target)
+
+        mock_run.assert_called_once()
+        cmd = mock_run.call_args.args[0]
+        if os.name == "nt":
+            assert cmd[:5] == ["cmd", "/c", "rd", "/s", "/q"]
+        else:
+            assert cmd[:2] == ["rm", "-rf"]
+        assert cmd[-1] == str(target)
+        assert not target.exists()
+
+    def test_falls_back_when_tool_missing(self, tmp_path: Path) -> None:
+        target = tmp_path / ".runs"
+        create_large_tree(target)
+
+        with patch(
+            "vivado_mcp.vivado.clean.subprocess.run",
+            side_effect=FileNotFoundError,
+        ):
+            _fast_rmtree(target)
+
+        assert not target.exists()
+
+    def test_tool_failure_raises_with_stderr(self, tmp_path: Path) -> None:
+        target = tmp_path / ".runs"
+        create_large_tree(target)
+
+        failed = subprocess.CompletedProcess(
+            args=[], returncode=1, stdout="", stderr="Permission denied"
+        )
+        with patch("vivado_mcp.vivado.clean.subprocess.run", return_value=failed):
+            with pytest.raises(OSError, match="Permission denied"):
+                _fast_rmtree(target)
+
+
+class TestWalkRmtree:
+    """Tests for the bottom-up Python directory removal helper."""
+
+    def test_removes_nested_tree(self, tmp_path: Path) -> None:
+        target = tmp_path / ".runs"
+        create_large_tree(target)
+        (target / "impl_1" / "reports").mkdir(parents=True)
+        (target / "impl_1" / "reports" / "timing.rpt").touch()
+
+        _walk_rmtree(target)
+
+        assert not target.exists()
+
+    @pytest.mark.skipif(os.name == "nt", reason="Symlinks need privileges on Windows")
+    def test_does_not_follow_directory_symlinks(self, tmp_path: Path) -> None:
+        outside = tmp_path / "sources"
+        outside.mkdir()
+        (outside / "top.v").touch()
+        target = tmp_path / ".gen"
+        target.mkdir()
+        (target / "link").symlink_to(outside, target_is_directory=True)
+
+        _walk_rmtree(target)
+
+        assert not target.exists()
+        assert (outside / "top.v").exists()
+
+
 class TestCleanBuildOutputs:
     """Tests for the main clean function."""
 
@@ -166,6 +270,36 @@ class TestCleanBuildOutputs:
             assert dir_name in result.cleaned_directories
             assert not (tmp_path / dir_name).exists()
 
+    def test_cleaned_directories_keep_configured_order(self, tmp_path: Path) -> None:
+        """Test that concurrent removal reports directories in configured order."""
+        for dir_name in VIVADO_OUTPUT_DIRS:
+            (tmp_path / dir_name).mkdir()
+            (tmp_path / dir_name / "artifact.log").touch()
+
+        result = clean_build_outputs(tmp_path)
+
+        assert result.success is True
+        assert result.cleaned_directories == VIVADO_OUTPUT_DIRS
+
+    def test_duplicate_additional_dirs_cleaned_once(self, tmp_path: Path) -> None:
+        """Test that a directory listed twice is removed and reported once."""
+        (tmp_path / ".runs").mkdir()
+
+        result = clean_build_outputs(tmp_path, additional_dirs=[".runs"])
+
+        assert result.cleaned_directories == [".runs"]
+
+    def test_empty_directory_skips_tree_removal(self, tmp_path: Path) -> None:
+        """Test that empty output directories are removed without a tree walk."""
+        (tmp_path / ".runs").mkdir()
+
+        with patch("vivado_mcp.vivado.clean._fast_rmtree") as mock_rmtree:
+            result = clean_build_outputs(tmp_path)
+
+        mock_rmtree.assert_not_called()
+        assert result.cleaned_directories == [".runs"]
+        assert not (tmp_path / ".runs").exists()
+
     def test_clean_nested_contents(self, tmp_path: Path) -> None:
         """Test that nested contents in output directories are cleaned."""
         runs_dir = tmp_path / ".runs"
@@ -240,3 +374,69 @@ class TestCleanBuildOutputs:
 
         # Should resolve to the project directory, not the file
         assert str(project_dir) in result.project_path
+
+
+class TestConcurrentRemoval:
+    """Tests for entries that disappear while they are being removed."""
+
+    def test_missing_tree_counts_as_small(self, tmp_path: Path) -> None:
+        assert _is_small_tree(tmp_path / "gone") is True
+
+    def test_walk_rmtree_tolerates_missing_tree(self, tmp_path: Path) -> None:
+        _walk_rmtree(tmp_path / "gone")
+
+    def test_remove_one_treats_vanished_tree_as_removed(self, tmp_path: Path) -> None:
+        (tmp_path / "build").mkdir()
+        (tmp_path / "build" / "out.log").touch()
+
+        with patch(
+            "vivado_mcp.vivado.clean._fast_rmtree",
+            side_effect=FileNotFoundError,
+        ):
+            assert _remove_one(tmp_path, "build") == ("build", None)
+
+    def test_overlapping_additional_dirs(self, tmp_path: Path) -> None:
+        for _ in range(20):
+            nested = tmp_path / "build" / "sub"
+            nested.mkdir(parents=True)
+            for i in range(_FAST_RMTREE_MIN_ENTRIES):
+                (nested / f"file_{i}.log").touch()
+
+            result = clean_build_outputs(tmp_path, additional_dirs=["build", "build/sub"])
+
+            assert result.success is True, result.errors
+            assert not (tmp_path / "build").exists()
+
+
+class TestCleanBuildOutputsIter:
+    """Tests for the streaming clean function."""
+
+    def test_yields_each_removed_directory(self, tmp_path: Path) -> None:
+        (tmp_path / ".runs").mkdir()
+        (tmp_path / ".cache").mkdir()
+
+        results = list(clean_build_outputs_iter(tmp_path))
+
+        assert sorted(results) == [(".cache", None), (".runs", None)]
+        assert not (tmp_path / ".runs").exists()
+        assert not (tmp_path / ".cache").exists()
+
+    def test_yields_errors(self, tmp_path: Path) -> None:
+        (tmp_path / ".runs").mkdir()
+        (tmp_path / ".runs" / "runme.log").touch()
+
+        with patch(
+            "vivado_mcp.vivado.clean._fast_rmtree",
+            side_effect=OSError("Permission denied"),
+        ):
+            results = list(clean_build_outputs_iter(tmp_path))
+
+        assert len(results) == 1
+        dir_name, error = results[0]
+        assert dir_name == ".runs"
+        assert error is not None
+        assert "Permission denied" in error
+
+    def test_invalid_path_raises(self, tmp_path: Path) -> None:
+        with pytest.raises(ValueError, match="not found"):
+            list(clean_build_outputs_iter(tmp_path / "nonexistent"))
@@ -4,19 +4,30 @@ from __future__ import annotations
 
 import os
 from pathlib import Path
+from typing import Any
 from unittest.mock import patch
 
 import pytest
 
 from vivado_mcp.vivado.detection import (
     VivadoInstallation,
+    _find_vivado_executable,
+    _get_search_paths,
     _is_valid_version_dir,
     _parse_version,
+    _scan_base,
     detect_vivado_installations,
     get_default_vivado,
+    invalidate_detection_cache,
 )
 
 
+@pytest.fixture(autouse=True)
+def _reset_detection_cache() -> None:
+    """Ensure each test starts without cached detection results."""
+    invalidate_detection_cache()
+
+
 def create_mock_vivado_executable(bin_dir: Path) -> Path:
     """Create a mock Vivado executable appropriate for the current platform.
 
@@ -66,6 +77,39 @@ class TestIsValidVersionDir:
         assert not _is_valid_version_dir(Path("v2023"))
 
 
+class TestFindVivadoExecutable:
+    """Tests for _find_vivado_executable function."""
+
+    def test_finds_executable(self, tmp_path: Path) -> None:
+        version_bin = tmp_path / "2023.2" / "bin"
+        version_bin.mkdir(parents=True)
+        executable = create_mock_vivado_executable(version_bin)
+        assert _find_vivado_executable(tmp_path / "2023.2") == executable
+
+    def test_missing_bin_directory(self, tmp_path: Path) -> None:
+        (tmp_path / "2023.2").mkdir()
+        assert _find_vivado_executable(tmp_path / "2023.2") is None
+
+    def test_bin_is_a_file(self, tmp_path: Path) -> None:
+        (tmp_path / "2023.2").mkdir()
+        (tmp_path / "2023.2" / "bin").touch()
+        assert _find_vivado_executable(tmp_path / "2023.2") is None
+
+    def test_ignores_directory_named_like_executable(self, tmp_path: Path) -> None:
+        version_bin = tmp_path / "2023.2" / "bin"
+        (version_bin / ("vivado.bat" if os.name == "nt" else "vivado")).mkdir(parents=True)
+        assert _find_vivado_executable(tmp_path / "2023.2") is None
+
+
+class TestGetSearchPaths:
+    """Tests for _get_search_paths function."""
+
+    def test_result_is_cached(self) -> None:
+        paths = _get_search_paths()
+        assert paths
+        assert _get_search_paths() is paths
+
+
 class TestVivadoInstallation:
     """Tests for VivadoInstallation dataclass."""
 
@@ -125,6 +169,90 @@ class TestDetectVivadoInstallations:
         assert result[1].version == "2022.1"
         assert result[2].version == "2021.2"
 
+    def test_unsorted_detection_returns_same_installations(self, tmp_path: Path) -> None:
+        """Test that sort=False finds the same installations."""
+        vivado_base = tmp_path / "Xilinx" / "Vivado"
+        for version in ["2021.2", "2023.2", "2022.1"]:
+            version_dir = vivado_base / version / "bin"
+            version_dir.mkdir(parents=True)
+            create_mock_vivado_executable(version_dir)
+
+        result = detect_vivado_installations(search_paths=[vivado_base], sort=False)
+        assert sorted(install.version for install in result) == ["2021.2", "2022.1", "2023.2"]
+
+    def test_skips_missing_and_non_directory_search_paths(self, tmp_path: Path) -> None:
+        """Test that missing or file search paths are silently skipped."""
+        not_a_dir = tmp_path / "Vivado.txt"
+        not_a_dir.touch()
+
+        result = detect_vivado_installations(search_paths=[tmp_path / "missing", not_a_dir])
+        assert result == []
+
+    def test_ignores_non_version_entries(self, tmp_path: Path) -> None:
+        """Test that files and non-version directories are ignored."""
+        vivado_base = tmp_path / "Xilinx" / "Vivado"
+        version_bin = vivado_base / "2023.2" / "bin"
+        version_bin.mkdir(parents=True)
+        create_mock_vivado_executable(version_bin)
+        (vivado_base / "docs").mkdir()
+        (vivado_base / "2024.1.txt").touch()
+
+        result = detect_vivado_installations(search_paths=[vivado_base])
+        assert [install.version for install in result] == ["2023.2"]
+
+    def test_duplicate_search_paths_scanned_once(self, tmp_path: Path) -> None:
+        """Test that search paths resolving to the same directory are scanned once."""
+        vivado_base = tmp_path / "Xilinx" / "Vivado"
+        version_bin = vivado_base / "2023.2" / "bin"
+        version_bin.mkdir(parents=True)
+        create_mock_vivado_executable(version_bin)
+        alias = tmp_path / "Xilinx" / ".." / "Xilinx" / "Vivado"
+
+        with patch("vivado_mcp.vivado.detection.os.scandir", wraps=os.scandir) as mock_scandir:
+            result = detect_vivado_installations(search_paths=[vivado_base, alias])
+
+        assert len(result) == 1
+        assert result[0].path == vivado_base / "2023.2"
+        scanned = [Path(call.args[0]) for call in mock_scandir.call_args_list]
+        assert scanned.count(vivado_base) == 1
+        assert alias not in scanned
+
+    @pytest.mark.skipif(os.name == "nt", reason="Symlinks need privileges on Windows")
+    def test_symlinked_version_dir_reported_once(self, tmp_path: Path) -> None:
+        """Test that a version directory reachable via a symlink is reported once."""
+        vivado_base = tmp_path / "Xilinx" / "Vivado"
+        version_bin = vivado_base / "2023.2" / "bin"
+        version_bin.mkdir(parents=True)
+        create_mock_vivado_executable(version_bin)
+        other_base = tmp_path / "tools" / "Vivado"
+        other_base.mkdir(parents=True)
+        (other_base / "2023.2").symlink_to(vivado_base / "2023.2", target_is_directory=True)
+
+        result = detect_vivado_installations(search_paths=[vivado_base, other_base])
+        assert len(result) == 1
+        assert result[0].path == vivado_base / "2023.2"
+
+    def test_zero_inode_falls_back_to_path_identity(self, tmp_path: Path) -> None:
+        """Test that filesystems reporting st_ino == 0 do not collapse versions."""
+        vivado_base = tmp_path / "Xilinx" / "Vivado"
+        for version in ["2022.1", "2023.2"]:
+            version_bin = vivado_base / version / "bin"
+            version_bin.mkdir(parents=True)
+            create_mock_vivado_executable(version_bin)
+
+        real_stat = os.stat
+
+        def zero_inode_stat(*args: Any, **kwargs: Any) -> os.stat_result:
+            st = real_stat(*args, **kwargs)
+            fields = list(st)
+            fields[1] = 0  # st_ino
+            return os.stat_result(fields)
+
+        with patch("vivado_mcp.vivado.detection.os.stat", side_effect=zero_inode_stat):
+            result = detect_vivado_installations(search_paths=[vivado_base])
+
+        assert [install.version for install in result] == ["2023.2", "2022.1"]
+
     @pytest.mark.skipif(os.name != "nt", reason="Windows-specific test")
     def test_detect_windows_installation(self, tmp_path: Path) -> None:
         """Test detecting Windows-style Vivado installation."""
@@ -141,6 +269,79 @@ class TestDetectVivadoInstallations:
         assert result[0].executable.name == "vivado.bat"
 
 
+class TestDetectionCache:
+    """Tests for caching of default-path detection results."""
+
+    def test_default_paths_are_cached(self, tmp_path: Path) -> None:
+        """Test that repeated default detection doesn't rescan the filesystem."""
+        vivado_base = tmp_path / "Xilinx" / "Vivado"
+        version_dir = vivado_base / "2023.2" / "bin"
+        version_dir.mkdir(parents=True)
+        create_mock_vivado_executable(version_dir)
+
+        with patch(
+            "vivado_mcp.vivado.detection._get_search_paths",
+            return_value=[vivado_base],
+        ) as mock_paths:
+            first = detect_vivado_installations()
+            second = detect_vivado_installations()
+
+        assert first == second
+        assert mock_paths.call_count == 1
+
+    def test_default_vivado_lookups_share_cache(self, tmp_path: Path) -> None:
+        """Test that repeated default installation lookups scan only once."""
+        vivado_base = tmp_path / "Xilinx" / "Vivado"
+        version_dir = vivado_base / "2023.2" / "bin"
+        version_dir.mkdir(parents=True)
+        create_mock_vivado_executable(version_dir)
+
+        with (
+            patch(
+                "vivado_mcp.vivado.detection._get_search_paths",
+                return_value=[vivado_base],
+            ),
+            patch(
+                "vivado_mcp.vivado.detection._scan_base",
+                wraps=_scan_base,
+            ) as mock_scan,
+        ):
+            results = [get_default_vivado() for _ in range(3)]
+
+        assert all(result is not None and result.version == "2023.2" for result in results)
+        assert mock_scan.call_count == 1
+
+    def test_invalidate_forces_rescan(self, tmp_path: Path) -> None:
+        """Test that invalidating the cache picks up new installations."""
+        vivado_base = tmp_path / "Xilinx" / "Vivado"
+        for version in ["2023.2", "2024.1"]:
+            (vivado_base / version / "bin").mkdir(parents=True)
+        create_mock_vivado_executable(vivado_base / "2023.2" / "bin")
+
+        with patch(
+            "vivado_mcp.vivado.detection._get_search_paths",
+            return_value=[vivado_base],
+        ):
+            assert len(detect_vivado_installations()) == 1
+
+            create_mock_vivado_executable(vivado_base / "2024.1" / "bin")
+            assert len(detect_vivado_installations()) == 1
+
+            invalidate_detection_cache()
+            result = detect_vivado_installations()
+            assert [install.version for install in result] == ["2024.1", "2023.2"]
+
+    def test_explicit_paths_bypass_cache(self, tmp_path: Path) -> None:
+        """Test that explicit search paths are always scanned."""
+        vivado_base = tmp_path / "Xilinx" / "Vivado"
+        version_dir = vivado_base / "2023.2" / "bin"
+        version_dir.mkdir(parents=True)
+        create_mock_vivado_executable(version_dir)
+
+        assert len(detect_vivado_installations(search_paths=[vivado_base])) == 1
+        assert detect_vivado_installations(search_paths=[tmp_path]) == []
+
+
 class TestGetDefaultVivado:
     """Tests for get_default_vivado function."""
 
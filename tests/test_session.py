@@ -3,11 +3,15 @@
 from __future__ import annotations
 
 import asyncio
+import os
+from collections.abc import Callable
+from datetime import datetime
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from vivado_mcp.vivado import session as session_module
 from vivado_mcp.vivado.detection import VivadoInstallation
 from vivado_mcp.vivado.session import (
     MAX_OUTPUT_SIZE,
@@ -23,6 +27,124 @@ from vivado_mcp.vivado.session import (
     truncate_output,
 )
 
+# Tests that patch process creation never touch the installation's files
+_MOCK_INSTALL = VivadoInstallation(
+    version="2023.2",
+    path=Path("/opt/Xilinx/Vivado/2023.2"),
+    executable=Path("/opt/Xilinx/Vivado/2023.2/bin/vivado"),
+)
+
+
+def make_frame(result: str = "", status: int = 0, log: str = "") -> bytes:
+    """Build a session response the way the Tcl command wrapper prints it.
+
+    Args:
+        result: The command result
+        status: The Tcl catch status (0 for success)
+        log: Output printed by the command before it returned
+
+    Returns:
+        The bytes Vivado would write to stdout, followed by a prompt
+    """
+    body = result.encode()
+    header = f"<<VMCP:{status}:{len(body)}>>\n".encode()
+    return log.encode() + header + body + b"<<VMCP:END>>\nVivado% "
+
+
+class FakeStdin:
+    """Records what a batch run pipes into the process."""
+
+    __slots__ = ("written", "closed")
+
+    def __init__(self) -> None:
+        self.written = b""
+        self.closed = False
+
+    def write(self, data: bytes) -> None:
+        self.written += data
+
+    async def drain(self) -> None:
+        pass
+
+    def close(self) -> None:
+        self.closed = True
+
+
+class FakeStdout:
+    """Yields a process's output in one chunk, then EOF."""
+
+    __slots__ = ("chunks", "stall")
+
+    def __init__(self, output: bytes) -> None:
+        self.chunks = [output]
+        # When set, read() never finishes, like a command that outlives its timeout
+        self.stall = False
+
+    async def read(self, n: int) -> bytes:
+        if self.stall:
+            await asyncio.get_running_loop().create_future()
+        return self.chunks.pop() if self.chunks else b""
+
+
+class FakeBatchProcess:
+    """A batch-mode Vivado process that prints output and exits.
+
+    Args:
+        output: The combined stdout/stderr the process prints
+        returncode: The exit code reported once the process exits
+    """
+
+    __slots__ = ("returncode", "stdin", "stdout", "kill_count")
+
+    def __init__(self, output: bytes, returncode: int = 0) -> None:
+        self.returncode = returncode
+        self.stdin = FakeStdin()
+        self.stdout = FakeStdout(output)
+        self.kill_count = 0
+
+    def kill(self) -> None:
+        self.kill_count += 1
+
+    async def wait(self) -> int:
+        return self.returncode
+
+
+class FakeExec:
+    """Stands in for ``create_subprocess_exec``, recording the last call."""
+
+    __slots__ = ("process", "args", "kwargs")
+
+    def __init__(self, process: FakeBatchProcess) -> None:
+        self.process = process
+        self.args: tuple[object, ...] = ()
+        self.kwargs: dict[str, object] = {}
+
+    async def __call__(self, *args: object, **kwargs: object) -> FakeBatchProcess:
+        self.args = args
+        self.kwargs = kwargs
+        return self.process
+
+
+BatchExecPatcher = Callable[[FakeBatchProcess], FakeExec]
+
+
+@pytest.fixture
+def batch_exec(monkeypatch: pytest.MonkeyPatch) -> BatchExecPatcher:
+    """Return a helper that makes ``create_subprocess_exec`` yield a batch process."""
+
+    def install(process: FakeBatchProcess) -> FakeExec:
+        fake_exec = FakeExec(process)
+        monkeypatch.setattr(asyncio, "create_subprocess_exec", fake_exec)
+        return fake_exec
+
+    return install
+
+
+@pytest.fixture(autouse=True)
+def _fresh_session_manager(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Start each test without a session manager and drop the one it creates."""
+    monkeypatch.setattr(session_module, "_session_manager", None)
+
 
 class TestTruncateOutput:
     """Tests for the truncate_output function."""
@@ -133,7 +255,12 @@ class TestTclCommandResult:
         assert d["success"] is False
         assert d["output_truncated"] is False
         assert d["error_count"] == 1
-        assert len(d["errors"]) == 1  # type: ignore[arg-type]
+        assert d["errors"] == [error.to_dict()]
+
+    def test_uses_slots(self) -> None:
+        """Test that results don't carry a per-instance __dict__."""
+        result = TclCommandResult(success=True, command="puts hello", output="hello")
+        assert not hasattr(result, "__dict__")
 
     def test_to_dict_large_output_truncated(self) -> None:
         """Large outputs should be truncated in to_dict() with file saved."""
@@ -214,13 +341,8 @@ class TestTclSession:
         info = session.get_info()
         assert info.working_directory == str(tmp_path)
 
-    def test_init_with_vivado_install(self, tmp_path: Path) -> None:
-        install = VivadoInstallation(
-            version="2023.2",
-            path=tmp_path / "Vivado" / "2023.2",
-            executable=tmp_path / "Vivado" / "2023.2" / "bin" / "vivado",
-        )
-        session = TclSession(vivado_install=install)
+    def test_init_with_vivado_install(self) -> None:
+        session = TclSession(vivado_install=_MOCK_INSTALL)
         info = session.get_info()
         assert info.vivado_version == "2023.2"
 
@@ -252,7 +374,6 @@ class TestTclSession:
         session._state = SessionState.CLOSED
         assert session.is_active is False
 
-    @pytest.mark.asyncio
     async def test_start_no_vivado_found(self) -> None:
         """Test starting session when no Vivado is installed."""
         session = TclSession()
@@ -266,22 +387,15 @@ class TestTclSession:
             assert "No Vivado installation found" in message
             assert session.state == SessionState.ERROR
 
-    @pytest.mark.asyncio
-    async def test_start_already_running(self, tmp_path: Path) -> None:
+    async def test_start_already_running(self) -> None:
         """Test starting session when already running."""
-        install = VivadoInstallation(
-            version="2023.2",
-            path=tmp_path / "Vivado" / "2023.2",
-            executable=tmp_path / "Vivado" / "2023.2" / "bin" / "vivado",
-        )
-        session = TclSession(vivado_install=install)
+        session = TclSession(vivado_install=_MOCK_INSTALL)
         session._state = SessionState.READY
 
         success, message = await session.start()
         assert success is False
         assert "already running" in message
 
-    @pytest.mark.asyncio
     async def test_start_vivado_not_found(self, tmp_path: Path) -> None:
         """Test starting session when Vivado executable doesn't exist."""
         install = VivadoInstallation(
@@ -296,15 +410,9 @@ class TestTclSession:
         assert "not found" in message.lower()
         assert session.state == SessionState.ERROR
 
-    @pytest.mark.asyncio
-    async def test_start_success(self, tmp_path: Path) -> None:
+    async def test_start_success(self) -> None:
         """Test successful session start."""
-        install = VivadoInstallation(
-            version="2023.2",
-            path=tmp_path / "Vivado" / "2023.2",
-            executable=tmp_path / "Vivado" / "2023.2" / "bin" / "vivado",
-        )
-        session = TclSession(vivado_install=install)
+        session = TclSession(vivado_install=_MOCK_INSTALL)
 
         # Mock subprocess
         mock_process = MagicMock()
@@ -328,7 +436,56 @@ class TestTclSession:
             assert session.state == SessionState.READY
             assert session.is_active is True
 
-    @pytest.mark.asyncio
+        started_at = datetime.fromisoformat(session.get_info().started_at)
+        assert abs((datetime.now() - started_at).total_seconds()) < 60
+
+    async def test_start_uses_large_read_buffers(self) -> None:
+        """Test that the session reads stdout in large chunks."""
+        session = TclSession(vivado_install=_MOCK_INSTALL)
+
+        mock_process = MagicMock()
+        mock_process.returncode = None
+        mock_process.stdout = MagicMock()
+        read_sizes: list[int] = []
+
+        async def mock_read(n: int) -> bytes:
+            read_sizes.append(n)
+            return b"Vivado% "
+
+        mock_process.stdout.read = mock_read
+
+        with patch(
+            "asyncio.create_subprocess_exec",
+            return_value=mock_process,
+        ) as mock_exec:
+            success, _ = await session.start()
+
+        assert success is True
+        assert mock_exec.call_args.kwargs["limit"] == TclSession._STREAM_LIMIT
+        assert read_sizes[0] == TclSession._READ_CHUNK
+
+    async def test_read_until_prompt_waits_without_polling(self) -> None:
+        """Test that a slow startup is awaited with one read instead of 1 s polls."""
+        session = TclSession()
+        reads: list[int] = []
+
+        async def mock_read(n: int) -> bytes:
+            reads.append(n)
+            if len(reads) == 1:
+                await asyncio.sleep(1.2)
+                return b"Vivado% "
+            return b""
+
+        mock_process = MagicMock()
+        mock_process.stdout.read = mock_read
+        session._process = mock_process
+
+        output = await session._read_until_prompt(timeout=5.0)
+
+        assert output == "Vivado% "
+        assert reads[0] == TclSession._READ_CHUNK
+        assert len(reads) == 2
+
     async def test_execute_not_started(self) -> None:
         """Test executing command when session is not started."""
         session = TclSession()
@@ -337,7 +494,6 @@ class TestTclSession:
         assert result.success is False
         assert "not started" in result.output
 
-    @pytest.mark.asyncio
     async def test_execute_error_state(self) -> None:
         """Test executing command when session is in error state."""
         session = TclSession()
@@ -347,15 +503,9 @@ class TestTclSession:
         assert result.success is False
         assert "error state" in result.output
 
-    @pytest.mark.asyncio
-    async def test_execute_success(self, tmp_path: Path) -> None:
+    async def test_execute_success(self) -> None:
         """Test successful command execution."""
-        install = VivadoInstallation(
-            version="2023.2",
-            path=tmp_path / "Vivado" / "2023.2",
-            executable=tmp_path / "Vivado" / "2023.2" / "bin" / "vivado",
-        )
-        session = TclSession(vivado_install=install)
+        session = TclSession(vivado_install=_MOCK_INSTALL)
         session._state = SessionState.READY
 
         # Mock process and I/O
@@ -364,10 +514,9 @@ class TestTclSession:
         mock_stdin.drain = AsyncMock()
 
         mock_stdout = MagicMock()
-        output_marker = TclSession._OUTPUT_MARKER
 
         async def mock_read(n: int) -> bytes:
-            return f"hello\n{output_marker}\nVivado% ".encode()
+            return make_frame("hello")
 
         mock_stdout.read = mock_read
 
@@ -382,15 +531,286 @@ class TestTclSession:
         assert "hello" in result.output
         assert result.execution_time_ms > 0
 
-    @pytest.mark.asyncio
-    async def test_execute_with_error_output(self, tmp_path: Path) -> None:
-        """Test command execution with error output."""
-        install = VivadoInstallation(
-            version="2023.2",
-            path=tmp_path / "Vivado" / "2023.2",
-            executable=tmp_path / "Vivado" / "2023.2" / "bin" / "vivado",
+    @pytest.mark.parametrize("command", ["", "   \n", "# just a comment"])
+    async def test_execute_skips_no_op_commands(self, command: str) -> None:
+        """Test that blank and comment-only commands are not sent to Vivado."""
+        session = TclSession()
+        session._state = SessionState.READY
+        mock_process = MagicMock()
+        session._process = mock_process
+
+        result = await session.execute(command)
+
+        assert result.success is True
+        assert result.output == ""
+        mock_process.stdin.write.assert_not_called()
+        assert session._command_count == 0
+
+    async def test_execute_filters_echo_and_prompt_lines(self) -> None:
+        """Test that command echo, prompts and blank lines are left out of the output."""
+        session = TclSession()
+        session._state = SessionState.READY
+        log = "Vivado% \n  report_timing  \n\nINFO: [Timing 38-91] done\n   \n"
+
+        async def mock_read(n: int) -> bytes:
+            return make_frame("  summary  ", log=log)
+
+        mock_process = MagicMock()
+        mock_process.stdin.drain = AsyncMock()
+        mock_process.stdout.read = mock_read
+        session._process = mock_process
+
+        result = await session.execute("report_timing")
+
+        assert result.output == "INFO: [Timing 38-91] done\nsummary"
+
+    async def test_execute_connection_lost_on_drain(self) -> None:
+        """Test that a process dying mid-write fails the command instead of hanging."""
+        session = TclSession()
+        session._state = SessionState.READY
+        mock_process = MagicMock()
+        mock_process.stdin.drain = AsyncMock(side_effect=ConnectionResetError("Connection lost"))
+        session._process = mock_process
+
+        results = await asyncio.wait_for(
+            asyncio.gather(session.execute("puts a"), session.execute("puts b")), timeout=5
         )
-        session = TclSession(vivado_install=install)
+
+        assert [r.success for r in results] == [False, False]
+        assert "terminated unexpectedly" in results[0].output
+        assert session.state == SessionState.ERROR
+
+    async def test_execute_rejects_unencodable_command(self) -> None:
+        """Test that a command that cannot be encoded fails without reaching Vivado."""
+        session = TclSession()
+        session._state = SessionState.READY
+        mock_process = MagicMock()
+        session._process = mock_process
+
+        result = await session.execute("puts \ud800")
+
+        assert result.success is False
+        assert "cannot be sent" in result.output
+        mock_process.stdin.write.assert_not_called()
+        assert session.state == SessionState.READY
+
+    async def test_read_frame_header_split_across_reads(self) -> None:
+        """Test that a frame header spanning two reads is recognised."""
+        session = TclSession()
+        frame = make_frame("result", log="INFO: working\n")
+        split = frame.index(b"<<VMCP:") + 4
+        chunks = [frame[:split], frame[split:], b"unexpected"]
+
+        async def mock_read(n: int) -> bytes:
+            return chunks.pop(0)
+
+        mock_process = MagicMock()
+        mock_process.stdout.read = mock_read
+        session._process = mock_process
+
+        status, log_output, result = await session._read_frame(timeout=5.0)
+
+        assert status == 0
+        assert log_output == "INFO: working\n"
+        assert result == "result"
+        assert chunks == [b"unexpected"]
+
+    async def test_read_frame_keeps_bytes_past_frame_end(self) -> None:
+        """Test that output after a frame is kept for the next response."""
+        session = TclSession()
+        chunks = [make_frame("first") + make_frame("second")]
+
+        async def mock_read(n: int) -> bytes:
+            return chunks.pop(0)
+
+        mock_process = MagicMock()
+        mock_process.stdout.read = mock_read
+        session._process = mock_process
+
+        _, _, first = await session._read_frame(timeout=5.0)
+        _, log_output, second = await session._read_frame(timeout=5.0)
+
+        assert first == "first"
+        assert second == "second"
+        assert log_output == "Vivado% "
+
+    async def test_read_frame_reuses_receive_buffer(self) -> None:
+        """Test that frames are consumed in place from one receive buffer."""
+        session = TclSession()
+        buffer = session._read_buffer
+        chunks = [make_frame("first") + b"partial", b" output"]
+
+        async def mock_read(n: int) -> bytes:
+            if not chunks:
+                # Nothing more arrives; the read is cancelled by the timeout
+                await asyncio.get_running_loop().create_future()
+            return chunks.pop(0)
+
+        mock_process = MagicMock()
+        mock_process.stdout.read = mock_read
+        session._process = mock_process
+
+        _, _, first = await session._read_frame(timeout=5.0)
+        assert first == "first"
+        assert session._read_buffer is buffer
+        assert buffer == b"Vivado% partial"
+
+        with pytest.raises(asyncio.TimeoutError):
+            await session._read_frame(timeout=0.1)
+        assert session._read_buffer is buffer
+        assert buffer == b""
+
+    async def test_read_frame_ignores_echoed_wrapper(self) -> None:
+        """Test that wrapper source echoed before the header is not taken as a frame."""
+        session = TclSession()
+        echo = 'puts -nonewline "<<VMCP:${__vmcp_status}:[string length $b]>>"\n'
+
+        async def mock_read(n: int) -> bytes:
+            return make_frame("ok", log=echo)
+
+        mock_process = MagicMock()
+        mock_process.stdout.read = mock_read
+        session._process = mock_process
+
+        status, log_output, result = await session._read_frame(timeout=5.0)
+
+        assert status == 0
+        assert log_output == echo
+        assert result == "ok"
+
+    @staticmethod
+    def _batching_process(
+        writes: list[list[str]], respond: bool = True
+    ) -> MagicMock:
+        """Build a mock process that answers every command written to stdin.
+
+        Args:
+            writes: Receives the commands of each stdin write, in order
+            respond: If False, commands are recorded but never answered
+        """
+        pending: list[bytes] = []
+
+        def mock_write(data: bytes) -> None:
+            commands = [
+                chunk.split("}", 1)[0] for chunk in data.decode().split("catch {")[1:]
+            ]
+            writes.append(commands)
+            if respond:
+                pending.extend(make_frame(command) for command in commands)
+
+        async def mock_read(n: int) -> bytes:
+            while not pending:
+                await asyncio.sleep(0.01)
+            return pending.pop(0)
+
+        mock_process = MagicMock()
+        mock_process.stdin.write = mock_write
+        mock_process.stdin.drain = AsyncMock()
+        mock_process.stdout.read = mock_read
+        return mock_process
+
+    async def test_concurrent_executes_run_in_order(self) -> None:
+        """Test that concurrent commands are sent and answered in order."""
+        session = TclSession()
+        session._state = SessionState.READY
+        writes: list[list[str]] = []
+        session._process = self._batching_process(writes)
+
+        commands = [f"puts {i}" for i in range(5)]
+        results = await asyncio.gather(*(session.execute(c) for c in commands))
+
+        assert [c for batch in writes for c in batch] == commands
+        assert [r.output for r in results] == commands
+        assert session.get_info().command_count == 5
+
+    async def test_queued_commands_are_batched(self) -> None:
+        """Test that commands queued together share one stdin write."""
+        session = TclSession()
+        session._state = SessionState.READY
+        writes: list[list[str]] = []
+        session._process = self._batching_process(writes)
+
+        commands = [f"puts {i}" for i in range(TclSession._MAX_BATCH + 4)]
+        results = await asyncio.gather(*(session.execute(c) for c in commands))
+
+        assert writes == [commands[: TclSession._MAX_BATCH], commands[TclSession._MAX_BATCH :]]
+        assert all(r.success for r in results)
+
+    async def test_batch_respects_byte_limit(self) -> None:
+        """Test that a batch stops growing at the byte limit."""
+        session = TclSession()
+        session._state = SessionState.READY
+        writes: list[list[str]] = []
+        session._process = self._batching_process(writes)
+
+        big = "set x " + "a" * (TclSession._MAX_BATCH_BYTES // 2)
+        results = await asyncio.gather(*(session.execute(big) for _ in range(3)))
+
+        assert [len(batch) for batch in writes] == [1, 1, 1]
+        assert all(r.success for r in results)
+
+    async def test_timeout_in_batch_reports_later_commands_as_unread(self) -> None:
+        """Test that commands sent after a timed-out one are not reported as not run."""
+        session = TclSession()
+        session._state = SessionState.READY
+        writes: list[list[str]] = []
+        session._process = self._batching_process(writes, respond=False)
+
+        results = await asyncio.gather(
+            session.execute("synth_design", timeout=0.05),
+            session.execute("report_timing"),
+        )
+
+        assert writes == [["synth_design", "report_timing"]]
+        assert "timed out" in results[0].output
+        assert results[1].success is False
+        assert "was sent to Vivado" in results[1].output
+        assert "timed out" in results[1].output
+        assert session.state == SessionState.ERROR
+
+    async def test_execute_eof_marks_session_error(self) -> None:
+        """Test that the process closing its output fails the command."""
+        session = TclSession()
+        session._state = SessionState.READY
+
+        async def mock_read(n: int) -> bytes:
+            return b""
+
+        mock_process = MagicMock()
+        mock_process.stdin.drain = AsyncMock()
+        mock_process.stdout.read = mock_read
+        session._process = mock_process
+
+        result = await session.execute("puts hello")
+
+        assert result.success is False
+        assert "terminated" in result.output
+        assert session.state == SessionState.ERROR
+
+    async def test_execute_timeout_marks_session_error(self) -> None:
+        """Test that a command without a complete frame times out."""
+        session = TclSession()
+        session._state = SessionState.READY
+
+        async def mock_read(n: int) -> bytes:
+            # The frame never completes; the read is cancelled by the timeout
+            await asyncio.get_running_loop().create_future()
+            return b"still running\n"
+
+        mock_process = MagicMock()
+        mock_process.stdin.drain = AsyncMock()
+        mock_process.stdout.read = mock_read
+        session._process = mock_process
+
+        result = await session.execute("synth_design", timeout=0.05)
+
+        assert result.success is False
+        assert "timed out" in result.output
+        assert session.state == SessionState.ERROR
+
+    async def test_execute_with_error_output(self) -> None:
+        """Test command execution with error output."""
+        session = TclSession(vivado_install=_MOCK_INSTALL)
         session._state = SessionState.READY
 
         # Mock process and I/O
@@ -399,10 +819,9 @@ class TestTclSession:
         mock_stdin.drain = AsyncMock()
 
         mock_stdout = MagicMock()
-        error_marker = TclSession._ERROR_MARKER
 
         async def mock_read(n: int) -> bytes:
-            return f"ERROR: [Synth 8-87] Signal not found\n{error_marker}\nVivado% ".encode()
+            return make_frame(status=1, log="ERROR: [Synth 8-87] Signal not found\n")
 
         mock_stdout.read = mock_read
 
@@ -417,7 +836,25 @@ class TestTclSession:
         assert len(result.errors) == 1
         assert result.errors[0].id == "Synth 8-87"
 
-    @pytest.mark.asyncio
+    async def test_execute_parses_messages_from_log_and_result(self) -> None:
+        """Test that messages are found in both the log and the command result."""
+        session = TclSession()
+        session._state = SessionState.READY
+        log = "Vivado% \nCRITICAL WARNING: [Constraints 18-5210] No constraints\n"
+
+        async def mock_read(n: int) -> bytes:
+            return make_frame("ERROR: [Common 17-39] 'report_foo' failed", status=1, log=log)
+
+        mock_process = MagicMock()
+        mock_process.stdin.drain = AsyncMock()
+        mock_process.stdout.read = mock_read
+        session._process = mock_process
+
+        result = await session.execute("report_foo")
+
+        assert [e.id for e in result.errors] == ["Common 17-39"]
+        assert [w.id for w in result.critical_warnings] == ["Constraints 18-5210"]
+
     async def test_close_not_started(self) -> None:
         """Test closing session that was never started."""
         session = TclSession()
@@ -426,15 +863,9 @@ class TestTclSession:
         assert success is True
         assert "already closed" in message
 
-    @pytest.mark.asyncio
-    async def test_close_running_session(self, tmp_path: Path) -> None:
+    async def test_close_running_session(self) -> None:
         """Test closing a running session."""
-        install = VivadoInstallation(
-            version="2023.2",
-            path=tmp_path / "Vivado" / "2023.2",
-            executable=tmp_path / "Vivado" / "2023.2" / "bin" / "vivado",
-        )
-        session = TclSession(vivado_install=install)
+        session = TclSession(vivado_install=_MOCK_INSTALL)
         session._state = SessionState.READY
 
         # Mock process
@@ -455,6 +886,46 @@ class TestTclSession:
         assert "successfully" in message
         assert session.state == SessionState.CLOSED
 
+    async def test_execute_during_close_is_rejected(self) -> None:
+        """Test that a command submitted while closing is not sent after exit."""
+        session = TclSession()
+        session._state = SessionState.READY
+        late_results: list[TclCommandResult] = []
+
+        async def mock_wait() -> int:
+            # Submit a command while close() waits for the process to exit
+            late_results.append(await session.execute("puts late"))
+            mock_process.returncode = 0
+            return 0
+
+        mock_process = MagicMock()
+        mock_process.returncode = None
+        mock_process.stdin.drain = AsyncMock()
+        mock_process.wait = mock_wait
+        session._process = mock_process
+
+        success, _ = await session.close()
+
+        assert success is True
+        assert session.state == SessionState.CLOSED
+        assert late_results[0].success is False
+        assert "not started" in late_results[0].output
+        written = [call.args[0] for call in mock_process.stdin.write.call_args_list]
+        assert written == [b"exit\n"]
+        assert session._writer_task is None
+
+    async def test_execute_during_start_is_rejected(self) -> None:
+        """Test that commands are not sent while start() reads startup output."""
+        session = TclSession()
+        session._state = SessionState.STARTING
+        session._process = MagicMock()
+
+        result = await session.execute("puts hello")
+
+        assert result.success is False
+        assert "starting" in result.output
+        session._process.stdin.write.assert_not_called()
+
 
 class TestSessionManager:
     """Tests for SessionManager class."""
@@ -464,7 +935,6 @@ class TestSessionManager:
         assert manager.default_session_id is None
         assert manager.list_sessions() == []
 
-    @pytest.mark.asyncio
     async def test_create_session_no_vivado(self) -> None:
         """Test creating session when Vivado is not available."""
         manager = SessionManager()
@@ -477,17 +947,10 @@ class TestSessionManager:
             assert success is False
             assert "No Vivado installation found" in message
 
-    @pytest.mark.asyncio
-    async def test_create_session_success(self, tmp_path: Path) -> None:
+    async def test_create_session_success(self) -> None:
         """Test successful session creation."""
         manager = SessionManager()
 
-        install = VivadoInstallation(
-            version="2023.2",
-            path=tmp_path / "Vivado" / "2023.2",
-            executable=tmp_path / "Vivado" / "2023.2" / "bin" / "vivado",
-        )
-
         # Mock subprocess
         mock_process = MagicMock()
         mock_process.returncode = None
@@ -504,7 +967,7 @@ class TestSessionManager:
             return_value=mock_process,
         ):
             session, success, message = await manager.create_session(
-                vivado_install=install
+                vivado_install=_MOCK_INSTALL
             )
             assert success is True
             assert session.state == SessionState.READY
@@ -516,21 +979,18 @@ class TestSessionManager:
         assert manager.get_session() is None
         assert manager.get_session("nonexistent") is None
 
-    @pytest.mark.asyncio
     async def test_close_session_none(self) -> None:
         manager = SessionManager()
         success, message = await manager.close_session()
         assert success is False
         assert "No session" in message
 
-    @pytest.mark.asyncio
     async def test_close_session_not_found(self) -> None:
         manager = SessionManager()
         success, message = await manager.close_session("nonexistent-id")
         assert success is False
         assert "not found" in message
 
-    @pytest.mark.asyncio
     async def test_close_all_sessions(self, tmp_path: Path) -> None:
         """Test closing all sessions."""
         manager = SessionManager()
@@ -566,13 +1026,66 @@ class TestSessionManager:
         assert manager.default_session_id is None
         assert len(manager.list_sessions()) == 0
 
+    async def test_slow_start_does_not_block_close(self) -> None:
+        """Test that closing a session isn't held up by another session starting."""
+        manager = SessionManager()
+        existing = TclSession()
+        existing.close = AsyncMock(return_value=(True, "closed"))
+        manager._sessions[existing.session_id] = existing
+        manager._default_session_id = existing.session_id
+        release = asyncio.Event()
+
+        async def slow_start(session: TclSession) -> tuple[bool, str]:
+            await release.wait()
+            session._state = SessionState.READY
+            return True, "started"
+
+        with patch.object(TclSession, "start", autospec=True, side_effect=slow_start):
+            create_task = asyncio.create_task(manager.create_session())
+            await asyncio.sleep(0)
+
+            result = await asyncio.wait_for(manager.close_session(), timeout=1.0)
+            assert result == (True, "closed")
+
+            release.set()
+            session, success, _ = await create_task
+
+        assert success is True
+        assert manager.default_session_id == session.session_id
+
+    async def test_close_all_sessions_runs_concurrently(self) -> None:
+        """Test that sessions are closed in parallel and failures are reported."""
+        manager = SessionManager()
+        sessions = [TclSession() for _ in range(3)]
+        for session in sessions:
+            manager._sessions[session.session_id] = session
+
+        async def slow_close() -> tuple[bool, str]:
+            await asyncio.sleep(0.2)
+            return True, "closed"
+
+        sessions[0].close = slow_close
+        sessions[1].close = slow_close
+        sessions[2].close = AsyncMock(side_effect=RuntimeError("boom"))
+
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        results = await manager.close_all_sessions()
+
+        assert loop.time() - start < 0.4
+        assert [r[0] for r in results] == [s.session_id for s in sessions]
+        assert results[0][1:] == (True, "closed")
+        assert results[2][1] is False
+        assert "boom" in results[2][2]
+        assert manager.list_sessions() == []
+
     def test_list_sessions(self) -> None:
         manager = SessionManager()
 
         # Add a mock session
         session = TclSession()
         session._state = SessionState.READY
-        session._started_at = "2024-01-15T10:30:00"
+        session._started_at_ns = 1_705_314_600_000_000_000
         session._vivado_install = VivadoInstallation(
             version="2023.2",
             path=Path("/opt/Vivado/2023.2"),
@@ -590,11 +1103,6 @@ class TestGetSessionManager:
     """Tests for get_session_manager function."""
 
     def test_singleton(self) -> None:
-        # Reset global state for this test
-        import vivado_mcp.vivado.session as session_module
-
-        session_module._session_manager = None
-
         manager1 = get_session_manager()
         manager2 = get_session_manager()
         assert manager1 is manager2
@@ -603,113 +1111,85 @@ class TestGetSessionManager:
 class TestRunBatchCommand:
     """Tests for _run_batch_command function."""
 
-    @pytest.mark.asyncio
-    async def test_no_vivado(self) -> None:
+    async def test_no_vivado(self, monkeypatch: pytest.MonkeyPatch) -> None:
         """Test batch command when no Vivado is available."""
-        with patch(
-            "vivado_mcp.vivado.session.get_default_vivado",
-            return_value=None,
-        ):
-            result = await _run_batch_command("puts hello")
-            assert result.success is False
-            assert "No Vivado installation found" in result.output
+        monkeypatch.setattr(session_module, "get_default_vivado", lambda: None)
+        result = await _run_batch_command("puts hello")
+        assert result.success is False
+        assert "No Vivado installation found" in result.output
 
-    @pytest.mark.asyncio
-    async def test_success(self, tmp_path: Path) -> None:
+    async def test_success(self, batch_exec: BatchExecPatcher) -> None:
         """Test successful batch command execution."""
-        install = VivadoInstallation(
-            version="2023.2",
-            path=tmp_path / "Vivado" / "2023.2",
-            executable=tmp_path / "Vivado" / "2023.2" / "bin" / "vivado",
-        )
+        batch_exec(FakeBatchProcess(b"hello\n"))
+        result = await _run_batch_command("puts hello", vivado_install=_MOCK_INSTALL)
+        assert result.success is True
+        assert "hello" in result.output
+        assert result.execution_time_ms > 0
 
-        mock_process = MagicMock()
-        mock_process.returncode = 0
-        mock_process.communicate = AsyncMock(return_value=(b"hello\n", b""))
+    @pytest.mark.skipif(os.name == "nt", reason="Windows uses a temporary script file")
+    async def test_pipes_command_on_stdin(
+        self, monkeypatch: pytest.MonkeyPatch, batch_exec: BatchExecPatcher
+    ) -> None:
+        """Test that the command is sourced from stdin instead of a temp file."""
 
-        with patch(
-            "asyncio.create_subprocess_exec",
-            return_value=mock_process,
-        ):
-            result = await _run_batch_command("puts hello", vivado_install=install)
-            assert result.success is True
-            assert "hello" in result.output
-            assert result.execution_time_ms > 0
+        def no_temp_file(*args: object, **kwargs: object) -> None:
+            raise AssertionError("the command should not be written to a file")
 
-    @pytest.mark.asyncio
-    async def test_timeout(self, tmp_path: Path) -> None:
-        """Test batch command timeout."""
-        install = VivadoInstallation(
-            version="2023.2",
-            path=tmp_path / "Vivado" / "2023.2",
-            executable=tmp_path / "Vivado" / "2023.2" / "bin" / "vivado",
-        )
+        monkeypatch.setattr(session_module.tempfile, "NamedTemporaryFile", no_temp_file)
+        mock_process = FakeBatchProcess(b"hello\n")
+        fake_exec = batch_exec(mock_process)
+        await _run_batch_command("puts hello", vivado_install=_MOCK_INSTALL)
 
-        mock_process = MagicMock()
-        mock_process.kill = MagicMock()
-        mock_process.wait = AsyncMock()
+        args = fake_exec.args
+        assert args[args.index("-source") + 1] == "/dev/stdin"
+        assert fake_exec.kwargs["stdin"] == asyncio.subprocess.PIPE
+        assert mock_process.stdin.written == b"puts hello\nexit\n"
+        assert mock_process.stdin.closed is True
 
-        async def slow_communicate() -> tuple[bytes, bytes]:
-            await asyncio.sleep(10)
-            return (b"", b"")
+    async def test_timeout(self, batch_exec: BatchExecPatcher) -> None:
+        """Test batch command timeout."""
+        mock_process = FakeBatchProcess(b"")
+        mock_process.stdout.stall = True
 
-        mock_process.communicate = slow_communicate
+        batch_exec(mock_process)
+        result = await _run_batch_command(
+            "puts hello", vivado_install=_MOCK_INSTALL, timeout=0.01
+        )
+        assert result.success is False
+        assert "timed out" in result.output
+        assert mock_process.kill_count == 1
 
-        with patch(
-            "asyncio.create_subprocess_exec",
-            return_value=mock_process,
-        ):
-            result = await _run_batch_command(
-                "puts hello", vivado_install=install, timeout=0.1
-            )
-            assert result.success is False
-            assert "timed out" in result.output
-            mock_process.kill.assert_called_once()
+    async def test_merges_stderr_into_output(self, batch_exec: BatchExecPatcher) -> None:
+        """Test that stderr is read through stdout instead of a second pipe."""
+        fake_exec = batch_exec(FakeBatchProcess(b"hello\nERROR: [Common 17-69] Command failed\n"))
+        result = await _run_batch_command("puts hello", vivado_install=_MOCK_INSTALL)
 
-    @pytest.mark.asyncio
-    async def test_with_errors(self, tmp_path: Path) -> None:
-        """Test batch command with errors in output."""
-        install = VivadoInstallation(
-            version="2023.2",
-            path=tmp_path / "Vivado" / "2023.2",
-            executable=tmp_path / "Vivado" / "2023.2" / "bin" / "vivado",
-        )
+        assert fake_exec.kwargs["stderr"] == asyncio.subprocess.STDOUT
+        assert result.output == "hello\nERROR: [Common 17-69] Command failed"
+        assert [e.id for e in result.errors] == ["Common 17-69"]
+        assert result.success is False
 
+    async def test_with_errors(self, batch_exec: BatchExecPatcher) -> None:
+        """Test batch command with errors in output."""
         error_output = b"ERROR: [Synth 8-87] Signal not found\n"
-        mock_process = MagicMock()
-        mock_process.returncode = 1
-        mock_process.communicate = AsyncMock(return_value=(error_output, b""))
-
-        with patch(
-            "asyncio.create_subprocess_exec",
-            return_value=mock_process,
-        ):
-            result = await _run_batch_command("synth_design", vivado_install=install)
-            assert result.success is False
-            assert len(result.errors) == 1
-            assert result.errors[0].id == "Synth 8-87"
+        batch_exec(FakeBatchProcess(error_output, returncode=1))
+        result = await _run_batch_command("synth_design", vivado_install=_MOCK_INSTALL)
+        assert result.success is False
+        assert len(result.errors) == 1
+        assert result.errors[0].id == "Synth 8-87"
 
 
 class TestRunTclCommandWithFallback:
     """Tests for run_tcl_command_with_fallback function."""
 
-    @pytest.mark.asyncio
-    async def test_uses_session_when_available(self, tmp_path: Path) -> None:
+    async def test_uses_session_when_available(self) -> None:
         """Test that active session is used when available."""
-        # Reset session manager
-        import vivado_mcp.vivado.session as session_module
-
-        session_module._session_manager = None
         manager = get_session_manager()
 
         # Create a mock session
         session = TclSession()
         session._state = SessionState.READY
-        session._vivado_install = VivadoInstallation(
-            version="2023.2",
-            path=tmp_path / "Vivado" / "2023.2",
-            executable=tmp_path / "Vivado" / "2023.2" / "bin" / "vivado",
-        )
+        session._vivado_install = _MOCK_INSTALL
 
         # Mock process
         mock_stdin = MagicMock()
@@ -717,10 +1197,9 @@ class TestRunTclCommandWithFallback:
         mock_stdin.drain = AsyncMock()
 
         mock_stdout = MagicMock()
-        output_marker = TclSession._OUTPUT_MARKER
 
         async def mock_read(n: int) -> bytes:
-            return f"hello\n{output_marker}\nVivado% ".encode()
+            return make_frame("hello")
 
         mock_stdout.read = mock_read
 
@@ -737,51 +1216,21 @@ class TestRunTclCommandWithFallback:
         assert result.success is True
         assert "hello" in result.output
 
-    @pytest.mark.asyncio
-    async def test_falls_back_to_batch(self, tmp_path: Path) -> None:
+    async def test_falls_back_to_batch(self, batch_exec: BatchExecPatcher) -> None:
         """Test fallback to batch mode when no session is available."""
-        # Reset session manager
-        import vivado_mcp.vivado.session as session_module
-
-        session_module._session_manager = None
-
-        install = VivadoInstallation(
-            version="2023.2",
-            path=tmp_path / "Vivado" / "2023.2",
-            executable=tmp_path / "Vivado" / "2023.2" / "bin" / "vivado",
-        )
-
-        mock_process = MagicMock()
-        mock_process.returncode = 0
-        mock_process.communicate = AsyncMock(return_value=(b"hello\n", b""))
-
-        with patch(
-            "asyncio.create_subprocess_exec",
-            return_value=mock_process,
-        ):
-            result = await run_tcl_command_with_fallback(
-                "puts hello", vivado_install=install
-            )
-            assert result.success is True
-            assert "hello" in result.output
+        batch_exec(FakeBatchProcess(b"hello\n"))
+        result = await run_tcl_command_with_fallback("puts hello", vivado_install=_MOCK_INSTALL)
+        assert result.success is True
+        assert "hello" in result.output
 
-    @pytest.mark.asyncio
-    async def test_specific_session_id(self, tmp_path: Path) -> None:
+    async def test_specific_session_id(self) -> None:
         """Test using a specific session ID."""
-        # Reset session manager
-        import vivado_mcp.vivado.session as session_module
-
-        session_module._session_manager = None
         manager = get_session_manager()
 
         # Create a mock session
         session = TclSession()
         session._state = SessionState.READY
-        session._vivado_install = VivadoInstallation(
-            version="2023.2",
-            path=tmp_path / "Vivado" / "2023.2",
-            executable=tmp_path / "Vivado" / "2023.2" / "bin" / "vivado",
-        )
+        session._vivado_install = _MOCK_INSTALL
 
         # Mock process
         mock_stdin = MagicMock()
@@ -789,10 +1238,9 @@ class TestRunTclCommandWithFallback:
         mock_stdin.drain = AsyncMock()
 
         mock_stdout = MagicMock()
-        output_marker = TclSession._OUTPUT_MARKER
 
         async def mock_read(n: int) -> bytes:
-            return f"hello\n{output_marker}\nVivado% ".encode()
+            return make_frame("hello")
 
         mock_stdout.read = mock_read
 
@@ -810,3 +1258,76 @@ class TestRunTclCommandWithFallback:
         )
         assert result.success is True
         assert "hello" in result.output
+
+    @staticmethod
+    async def _fake_start(session: TclSession) -> tuple[bool, str]:
+        """Stand in for TclSession.start with a process that echoes results."""
+        responses: list[bytes] = []
+
+        def mock_write(data: bytes) -> None:
+            # Batched commands arrive in one write; answer each of them
+            responses.extend(make_frame("auto") for _ in range(data.count(b"catch {")))
+
+        async def mock_read(n: int) -> bytes:
+            return responses.pop(0)
+
+        mock_process = MagicMock()
+        mock_process.stdin.write = mock_write
+        mock_process.stdin.drain = AsyncMock()
+        mock_process.stdout.read = mock_read
+        session._process = mock_process
+        session._state = SessionState.READY
+        return True, "Session started"
+
+    async def test_auto_session_is_started_and_reused(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that VIVADO_MCP_AUTO_SESSION routes fallback commands to one session."""
+        monkeypatch.setenv("VIVADO_MCP_AUTO_SESSION", "1")
+
+        with (
+            patch.object(TclSession, "start", autospec=True, side_effect=self._fake_start),
+            patch("asyncio.create_subprocess_exec") as mock_exec,
+        ):
+            first = await run_tcl_command_with_fallback("get_parts")
+            second = await run_tcl_command_with_fallback("get_parts")
+
+        assert first.output == second.output == "auto"
+        assert len(get_session_manager().list_sessions()) == 1
+        mock_exec.assert_not_called()
+
+    async def test_concurrent_first_calls_start_one_auto_session(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that concurrent first calls share a single auto-started session."""
+        monkeypatch.setenv("VIVADO_MCP_AUTO_SESSION", "1")
+
+        async def slow_start(session: TclSession) -> tuple[bool, str]:
+            # Let the other callers run while Vivado is starting
+            await asyncio.sleep(0)
+            return await self._fake_start(session)
+
+        with patch.object(TclSession, "start", autospec=True, side_effect=slow_start):
+            results = await asyncio.gather(
+                *(run_tcl_command_with_fallback("get_parts") for _ in range(3))
+            )
+
+        assert [r.output for r in results] == ["auto"] * 3
+        assert len(get_session_manager().list_sessions()) == 1
+
+    async def test_auto_session_skips_exit_commands(
+        self, monkeypatch: pytest.MonkeyPatch, batch_exec: BatchExecPatcher
+    ) -> None:
+        """Test that commands ending the shell are still run in batch mode."""
+        monkeypatch.setenv("VIVADO_MCP_AUTO_SESSION", "1")
+
+        batch_exec(FakeBatchProcess(b"bye\n"))
+
+        with patch.object(TclSession, "start", autospec=True) as mock_start:
+            result = await run_tcl_command_with_fallback(
+                "puts bye\nexit", vivado_install=_MOCK_INSTALL
+            )
+
+        assert result.output == "bye"
+        mock_start.assert_not_called()
+        assert get_session_manager().list_sessions() == []